@@ -5,10 +5,10 @@
 use std::net::SocketAddr;
 use std::sync::Arc;
 
-use axum::Router;
+use axum::{http::HeaderValue, Router};
 use tokio::sync::RwLock;
 use tower_http::{
-    cors::{Any, CorsLayer},
+    cors::{AllowOrigin, Any, CorsLayer},
     trace::TraceLayer,
 };
 use tracing_subscriber::{layer::SubscriberExt, util::SubscriberInitExt};
@@ -32,7 +32,6 @@ pub async fn run() -> anyhow::Result<()> {
 
     // Start background network metrics broadcaster
     start_network_broadcaster(state.clone());
-    tracing::info!("Network metrics broadcaster started");
 
     let app = create_app(state);
 
@@ -40,25 +39,38 @@ pub async fn run() -> anyhow::Result<()> {
 }
 
 /// Initialize tracing/logging
+///
+/// `KUBARR_LOG_FORMAT=json` emits one JSON object per line for log collectors;
+/// anything else keeps the plain text format.
 fn init_tracing() {
+    let json = CONFIG.log_format == "json";
+
     tracing_subscriber::registry()
         .with(
             tracing_subscriber::EnvFilter::try_from_default_env()
                 .unwrap_or_else(|_| format!("kubarr={}", CONFIG.log_level).into()),
         )
-        .with(tracing_subscriber::fmt::layer().with_ansi(false))
+        .with(json.then(|| tracing_subscriber::fmt::layer().json()))
+        .with((!json).then(|| tracing_subscriber::fmt::layer().with_ansi(false)))
         .init();
 }
 
 /// Initialize all application services
 async fn init_services() -> anyhow::Result<AppState> {
-    let k8s_client = init_kubernetes().await;
-    let catalog = init_catalog();
+    // The Kubernetes client and the on-disk catalog are independent, so load both at once
+    let (k8s_client, catalog) = tokio::join!(init_kubernetes(), init_catalog());
 
-    // Create chart sync service and run initial sync
+    // Create chart sync service and run the initial sync in the background.
+    // The catalog already serves the charts on disk; the sync swaps in the
+    // refreshed catalog when it finishes, so startup does not wait on GitHub/OCI.
     let chart_sync = Arc::new(ChartSyncService::new(catalog.clone()));
-    if let Err(e) = chart_sync.sync().await {
-        tracing::warn!("Initial chart sync failed: {}", e);
+    {
+        let chart_sync = chart_sync.clone();
+        tokio::spawn(async move {
+            if let Err(e) = chart_sync.sync().await {
+                tracing::warn!("Initial chart sync failed: {}", e);
+            }
+        });
     }
 
     // Try to connect to database (may not be available during initial setup)
@@ -163,31 +175,95 @@ async fn init_kubernetes() -> Arc<RwLock<Option<K8sClient>>> {
 }
 
 /// Initialize the app catalog
-fn init_catalog() -> Arc<RwLock<AppCatalog>> {
-    let catalog = Arc::new(RwLock::new(AppCatalog::new()));
-    tracing::info!("App catalog loaded");
-    catalog
+async fn init_catalog() -> Arc<RwLock<AppCatalog>> {
+    // Chart YAML parsing is blocking file I/O; keep it off the async workers
+    let catalog = tokio::task::spawn_blocking(AppCatalog::new)
+        .await
+        .unwrap_or_else(|e| {
+            tracing::warn!("Failed to load app catalog: {}", e);
+            AppCatalog::with_apps(Default::default())
+        });
+    Arc::new(RwLock::new(catalog))
 }
 
 /// Create the main application router
 fn create_app(state: AppState) -> Router {
-    let cors = CorsLayer::new()
-        .allow_origin(Any)
-        .allow_methods(Any)
-        .allow_headers(Any);
-
-    endpoints::create_router(state)
-        .layer(TraceLayer::new_for_http())
-        .layer(cors)
+    let app = endpoints::create_router(state).layer(TraceLayer::new_for_http());
+
+    // The frontend is served from this origin, so CORS is only layered on
+    // when other origins are configured
+    match cors_layer(&CONFIG.server.cors_origins) {
+        Some(cors) => app.layer(cors),
+        None => app,
+    }
+}
+
+/// Build the CORS layer for the configured origins ("*" allows any origin)
+fn cors_layer(origins: &[String]) -> Option<CorsLayer> {
+    if origins.is_empty() {
+        return None;
+    }
+
+    let allow_origin = if origins.iter().any(|o| o == "*") {
+        AllowOrigin::any()
+    } else {
+        AllowOrigin::list(origins.iter().filter_map(|o| o.parse::<HeaderValue>().ok()))
+    };
+
+    Some(
+        CorsLayer::new()
+            .allow_origin(allow_origin)
+            .allow_methods(Any)
+            .allow_headers(Any),
+    )
 }
 
 /// Start the HTTP server
 async fn serve(app: Router) -> anyhow::Result<()> {
     let addr = SocketAddr::from(([0, 0, 0, 0], CONFIG.server.port));
-    tracing::info!("Listening on {}", addr);
-
     let listener = tokio::net::TcpListener::bind(addr).await?;
-    axum::serve(listener, app).await?;
+    tracing::info!(
+        "Kubarr backend v{} ready: listening on {}, network metrics broadcaster running",
+        env!("CARGO_PKG_VERSION"),
+        addr
+    );
+    axum::serve(listener, app)
+        .with_graceful_shutdown(shutdown_signal())
+        .await?;
 
+    tracing::info!("Kubarr backend stopped");
     Ok(())
 }
+
+/// Resolve when the process receives Ctrl+C or SIGTERM
+async fn shutdown_signal() {
+    let ctrl_c = async {
+        if let Err(e) = tokio::signal::ctrl_c().await {
+            tracing::warn!("Failed to listen for Ctrl+C: {}", e);
+            std::future::pending::<()>().await;
+        }
+    };
+
+    #[cfg(unix)]
+    let terminate = async {
+        match tokio::signal::unix::signal(tokio::signal::unix::SignalKind::terminate()) {
+            Ok(mut signal) => {
+                signal.recv().await;
+            }
+            Err(e) => {
+                tracing::warn!("Failed to listen for SIGTERM: {}", e);
+                std::future::pending::<()>().await;
+            }
+        }
+    };
+
+    #[cfg(not(unix))]
+    let terminate = std::future::pending::<()>();
+
+    tokio::select! {
+        _ = ctrl_c => {}
+        _ = terminate => {}
+    }
+
+    tracing::info!("Shutdown signal received, draining connections");
+}
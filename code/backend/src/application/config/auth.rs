@@ -4,16 +4,24 @@ use std::env;
 pub struct AuthConfig {
     pub oauth2_enabled: bool,
     pub oauth2_issuer_url: String,
+    /// JWT `iss` claim, derived once from the issuer URL
+    pub token_issuer: String,
+    /// Whether session cookies get the `Secure` flag (issuer served over HTTPS)
+    pub secure_cookies: bool,
 }
 
 impl AuthConfig {
     pub fn from_env() -> Self {
+        let oauth2_issuer_url = env::var("KUBARR_OAUTH2_ISSUER_URL")
+            .unwrap_or_else(|_| "http://kubarr:8000/auth".to_string());
+
         Self {
             oauth2_enabled: env::var("KUBARR_OAUTH2_ENABLED")
                 .map(|v| v.to_lowercase() == "true")
                 .unwrap_or(false),
-            oauth2_issuer_url: env::var("KUBARR_OAUTH2_ISSUER_URL")
-                .unwrap_or_else(|_| "http://kubarr:8000/auth".to_string()),
+            token_issuer: format!("{}/auth", oauth2_issuer_url),
+            secure_cookies: oauth2_issuer_url.starts_with("https://"),
+            oauth2_issuer_url,
         }
     }
 }
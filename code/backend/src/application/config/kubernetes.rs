@@ -6,6 +6,13 @@ pub struct KubernetesConfig {
     pub kubeconfig_path: Option<PathBuf>,
     pub in_cluster: bool,
     pub default_namespace: String,
+    pub gluetun_image: String,
+    /// Base URL of the in-cluster VictoriaLogs service
+    pub victorialogs_url: String,
+    /// Base URL of the in-cluster VictoriaMetrics service
+    pub victoriametrics_url: String,
+    /// Upper bound on VictoriaMetrics queries in flight at once
+    pub victoriametrics_max_concurrent_queries: usize,
 }
 
 impl KubernetesConfig {
@@ -17,6 +24,23 @@ impl KubernetesConfig {
                 .unwrap_or(false),
             default_namespace: env::var("KUBARR_DEFAULT_NAMESPACE")
                 .unwrap_or_else(|_| "media".to_string()),
+            gluetun_image: env::var("KUBARR_GLUETUN_IMAGE")
+                .unwrap_or_else(|_| "qmcgaw/gluetun:v3.40".to_string()),
+            victorialogs_url: env::var("KUBARR_VICTORIALOGS_URL").unwrap_or_else(|_| {
+                "http://victorialogs.victorialogs.svc.cluster.local:9428".to_string()
+            }),
+            victoriametrics_url: env::var("KUBARR_VICTORIAMETRICS_URL").unwrap_or_else(|_| {
+                "http://victoriametrics.victoriametrics.svc.cluster.local:8428".to_string()
+            }),
+            victoriametrics_max_concurrent_queries: env::var(
+                "KUBARR_VICTORIAMETRICS_MAX_CONCURRENT_QUERIES",
+            )
+            .ok()
+            .and_then(|n| n.parse().ok())
+            .filter(|&n| n > 0)
+            .unwrap_or(8)
+            // Semaphore::new panics above this
+            .min(tokio::sync::Semaphore::MAX_PERMITS),
         }
     }
 }
@@ -25,6 +25,8 @@ pub struct Config {
 
     // Logging
     pub log_level: String,
+    /// Log output format: "text" (default) or "json"
+    pub log_format: String,
 
     // Frontend proxy
     pub frontend_url: String,
@@ -47,6 +49,9 @@ impl Config {
 
             // Logging
             log_level: env::var("KUBARR_LOG_LEVEL").unwrap_or_else(|_| "info".to_string()),
+            log_format: env::var("KUBARR_LOG_FORMAT")
+                .map(|v| v.to_lowercase())
+                .unwrap_or_else(|_| "text".to_string()),
 
             // Frontend proxy
             frontend_url: env::var("KUBARR_FRONTEND_URL").unwrap_or_else(|_| {
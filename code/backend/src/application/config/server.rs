@@ -4,6 +4,10 @@ use std::env;
 pub struct ServerConfig {
     pub host: String,
     pub port: u16,
+    /// Prefix under which the host filesystem is mounted for setup browsing
+    pub host_browse_prefix: String,
+    /// Origins allowed to call the API cross-origin ("*" for any); empty disables CORS
+    pub cors_origins: Vec<String>,
 }
 
 impl ServerConfig {
@@ -14,6 +18,15 @@ impl ServerConfig {
                 .ok()
                 .and_then(|p| p.parse().ok())
                 .unwrap_or(8000),
+            host_browse_prefix: env::var("KUBARR_HOST_BROWSE_PREFIX").unwrap_or_default(),
+            cors_origins: env::var("KUBARR_CORS_ORIGINS")
+                .map(|v| {
+                    v.split(',')
+                        .map(|o| o.trim().to_string())
+                        .filter(|o| !o.is_empty())
+                        .collect()
+                })
+                .unwrap_or_default(),
         }
     }
 }
@@ -17,11 +17,18 @@ pub async fn connect() -> Result<DbConn> {
 pub async fn connect_with_url(database_url: &str) -> Result<DbConn> {
     tracing::info!("Connecting to database...");
 
+    // Size the pool for bursts of concurrent auth, logs and monitoring
+    // requests; waiters give up after acquire_timeout instead of piling up,
+    // and connections are health-checked on checkout and recycled every
+    // 30 minutes so a database restart doesn't surface as request errors
     let mut opts = ConnectOptions::new(database_url);
-    opts.max_connections(10)
+    opts.max_connections(CONFIG.database.max_connections)
         .min_connections(1)
         .connect_timeout(Duration::from_secs(30))
+        .acquire_timeout(Duration::from_secs(30))
         .idle_timeout(Duration::from_secs(600))
+        .max_lifetime(Duration::from_secs(1800))
+        .test_before_acquire(true)
         .sqlx_logging(false);
 
     let db = Database::connect(opts)
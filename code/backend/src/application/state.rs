@@ -6,9 +6,11 @@ use tokio::sync::{broadcast, RwLock};
 use sea_orm::DatabaseConnection;
 
 use crate::services::audit::AuditService;
+use crate::services::bootstrap::BootstrapService;
 use crate::services::cadvisor::NamespaceNetworkMetrics;
 use crate::services::catalog::AppCatalog;
 use crate::services::chart_sync::ChartSyncService;
+use crate::services::deployment::DeploymentManager;
 use crate::services::k8s::K8sClient;
 use crate::services::notification::NotificationService;
 use crate::services::proxy::ProxyService;
@@ -29,6 +31,30 @@ pub struct CachedEndpoint {
 pub struct EndpointCache {
     cache: Arc<RwLock<HashMap<String, CachedEndpoint>>>,
     ttl: Duration,
+    /// Names recently found to have no service, with their expiry. Kept
+    /// separately and much shorter-lived, so a freshly installed app becomes
+    /// reachable within seconds.
+    missing: Arc<RwLock<HashMap<String, Instant>>>,
+}
+
+/// How long a name without a service is remembered. SPA routes such as
+/// /networking look like app names, so this spares a Kubernetes lookup per
+/// page navigation.
+const MISSING_ENDPOINT_TTL: Duration = Duration::from_secs(5);
+
+/// Cached app status response with expiration
+#[derive(Clone)]
+struct CachedAppStatus {
+    status: serde_json::Value,
+    expires_at: Instant,
+}
+
+/// Short-lived cache of app status responses, so dashboards polling every app
+/// (possibly from several tabs) share one Kubernetes health check per app
+#[derive(Clone, Default)]
+pub struct AppStatusCache {
+    cache: Arc<RwLock<HashMap<String, CachedAppStatus>>>,
+    ttl: Duration,
 }
 
 /// Number of samples to keep for sliding window average
@@ -214,6 +240,7 @@ impl EndpointCache {
         Self {
             cache: Arc::new(RwLock::new(HashMap::new())),
             ttl: Duration::from_secs(ttl_seconds),
+            missing: Arc::new(RwLock::new(HashMap::new())),
         }
     }
 
@@ -241,7 +268,63 @@ impl EndpointCache {
         );
     }
 
+    /// Whether the name was recently found to have no service
+    pub async fn is_missing(&self, app_name: &str) -> bool {
+        let missing = self.missing.read().await;
+        missing
+            .get(app_name)
+            .is_some_and(|expires_at| *expires_at > Instant::now())
+    }
+
+    /// Remember that the name has no service, dropping any expired entries
+    pub async fn set_missing(&self, app_name: &str) {
+        let now = Instant::now();
+        let mut missing = self.missing.write().await;
+        missing.retain(|_, expires_at| *expires_at > now);
+        missing.insert(app_name.to_string(), now + MISSING_ENDPOINT_TTL);
+    }
+
     /// Invalidate cache for an app (e.g., when app is restarted)
+    pub async fn invalidate(&self, app_name: &str) {
+        let mut cache = self.cache.write().await;
+        cache.remove(app_name);
+        drop(cache);
+        self.missing.write().await.remove(app_name);
+    }
+}
+
+impl AppStatusCache {
+    pub fn new(ttl_seconds: u64) -> Self {
+        Self {
+            cache: Arc::new(RwLock::new(HashMap::new())),
+            ttl: Duration::from_secs(ttl_seconds),
+        }
+    }
+
+    /// Get the cached status for an app, if still fresh
+    pub async fn get(&self, app_name: &str) -> Option<serde_json::Value> {
+        let cache = self.cache.read().await;
+        cache
+            .get(app_name)
+            .filter(|entry| entry.expires_at > Instant::now())
+            .map(|entry| entry.status.clone())
+    }
+
+    /// Cache the status for an app, dropping any expired entries
+    pub async fn set(&self, app_name: &str, status: serde_json::Value) {
+        let now = Instant::now();
+        let mut cache = self.cache.write().await;
+        cache.retain(|_, entry| entry.expires_at > now);
+        cache.insert(
+            app_name.to_string(),
+            CachedAppStatus {
+                status,
+                expires_at: now + self.ttl,
+            },
+        );
+    }
+
+    /// Invalidate the status for an app (e.g., when it is installed or removed)
     pub async fn invalidate(&self, app_name: &str) {
         let mut cache = self.cache.write().await;
         cache.remove(app_name);
@@ -274,9 +357,11 @@ pub struct AppState {
     pub notification: NotificationService,
     pub proxy: ProxyService,
     pub endpoint_cache: EndpointCache,
+    pub app_status_cache: AppStatusCache,
     pub network_metrics_cache: NetworkMetricsCache,
     pub network_metrics_tx: NetworkMetricsBroadcast,
     pub bootstrap_tx: BootstrapBroadcast,
+    pub bootstrap: Arc<BootstrapService>,
 }
 
 impl AppState {
@@ -293,8 +378,17 @@ impl AppState {
         // Create broadcast channel for bootstrap progress (capacity of 32 messages)
         let (bootstrap_tx, _) = broadcast::channel(32);
 
+        let db = Arc::new(RwLock::new(db));
+        // One bootstrap service for the whole process, so every request sees
+        // the same in-memory progress from before PostgreSQL is available
+        let bootstrap = Arc::new(BootstrapService::new(
+            db.clone(),
+            k8s_client.clone(),
+            bootstrap_tx.clone(),
+        ));
+
         Self {
-            db: Arc::new(RwLock::new(db)),
+            db,
             k8s_client,
             catalog,
             chart_sync,
@@ -302,9 +396,11 @@ impl AppState {
             notification,
             proxy: ProxyService::new(),
             endpoint_cache: EndpointCache::new(60), // Cache endpoints for 60 seconds
+            app_status_cache: AppStatusCache::new(5), // Absorb bursts of status polls
             network_metrics_cache: NetworkMetricsCache::new(),
             network_metrics_tx,
             bootstrap_tx,
+            bootstrap,
         }
     }
 
@@ -324,6 +420,31 @@ impl AppState {
         })
     }
 
+    /// Get a handle to the shared Kubernetes client (returns error if unavailable)
+    ///
+    /// The client is created once at startup; this hands out a cheap clone so
+    /// handlers don't hold the read lock for the whole request.
+    pub async fn get_k8s(&self) -> crate::error::Result<K8sClient> {
+        let k8s_guard = self.k8s_client.read().await;
+        k8s_guard.clone().ok_or_else(|| {
+            crate::error::AppError::Internal("Kubernetes client not available".to_string())
+        })
+    }
+
+    /// Get a snapshot of the app catalog
+    ///
+    /// Cloning the catalog only bumps a reference count, so handlers that go on
+    /// to make slow Kubernetes/Helm calls don't keep chart sync waiting on the lock.
+    pub async fn get_catalog(&self) -> AppCatalog {
+        self.catalog.read().await.clone()
+    }
+
+    /// Build a deployment manager from the shared Kubernetes client and a catalog snapshot
+    pub async fn deployment_manager(&self) -> crate::error::Result<DeploymentManager> {
+        let k8s = self.get_k8s().await?;
+        Ok(DeploymentManager::new(k8s, self.get_catalog().await))
+    }
+
     /// Check if database is connected
     pub async fn is_db_connected(&self) -> bool {
         let db_guard = self.db.read().await;
@@ -1,21 +1,21 @@
 use axum::{
     extract::{Path, Query, State},
-    http::header,
+    http::{header, HeaderMap, StatusCode},
     response::{IntoResponse, Response},
     routing::{delete, get, post},
     Json, Router,
 };
 use sea_orm::EntityTrait;
 use serde::Deserialize;
+use std::collections::BTreeMap;
 
-use crate::config::CONFIG;
 use crate::error::{AppError, Result};
 use crate::middleware::permissions::{
     AppsDelete, AppsInstall, AppsRestart, AppsView, Authenticated, Authorized,
 };
 use crate::models::audit_log::AuditAction;
 use crate::models::prelude::*;
-use crate::services::{AppConfig, DeploymentManager, DeploymentRequest, DeploymentStatus};
+use crate::services::{DeploymentRequest, DeploymentStatus};
 use crate::state::AppState;
 
 /// Create apps routes
@@ -28,6 +28,7 @@ pub fn apps_routes(state: AppState) -> Router {
         .route("/install", post(install_app))
         .route("/sync", post(sync_charts))
         .route("/categories", get(list_categories))
+        .route("/status", get(get_all_app_statuses))
         .route("/category/{category}", get(get_apps_by_category))
         .route("/{app_name}", delete(delete_app))
         .route("/{app_name}/restart", post(restart_app))
@@ -38,6 +39,12 @@ pub fn apps_routes(state: AppState) -> Router {
         .with_state(state)
 }
 
+/// Browsers may reuse catalog responses briefly and must revalidate via ETag after that
+const CATALOG_CACHE_CONTROL: &str = "private, max-age=60, stale-while-revalidate=300";
+
+/// Chart icons change only with a new chart version
+const ICON_CACHE_CONTROL: &str = "public, max-age=604800, immutable";
+
 // ============================================================================
 // Request/Response Types
 // ============================================================================
@@ -60,16 +67,16 @@ pub struct NamespaceQuery {
 )]
 async fn list_catalog(
     State(state): State<AppState>,
+    headers: HeaderMap,
     _auth: Authorized<AppsView>,
-) -> Result<Json<Vec<AppConfig>>> {
+) -> Result<Response> {
     let catalog = state.catalog.read().await;
-    let apps: Vec<AppConfig> = catalog
-        .get_all_apps()
-        .into_iter()
-        .filter(|app| !app.is_hidden)
-        .cloned()
-        .collect();
-    Ok(Json(apps))
+    Ok(catalog_response(&headers, catalog.etag(), || {
+        (
+            [(header::CONTENT_TYPE, "application/json")],
+            catalog.visible_apps_json(),
+        )
+    }))
 }
 
 /// Get a specific app from the catalog
@@ -83,14 +90,16 @@ async fn list_catalog(
 async fn get_app_from_catalog(
     State(state): State<AppState>,
     Path(app_name): Path<String>,
+    headers: HeaderMap,
     _auth: Authorized<AppsView>,
-) -> Result<Json<AppConfig>> {
+) -> Result<Response> {
     let catalog = state.catalog.read().await;
-    let app = catalog
-        .get_app(&app_name)
-        .cloned()
+    let app_json = catalog
+        .app_json(&app_name)
         .ok_or_else(|| AppError::NotFound(format!("App '{}' not found", app_name)))?;
-    Ok(Json(app))
+    Ok(catalog_response(&headers, catalog.etag(), || {
+        ([(header::CONTENT_TYPE, "application/json")], app_json)
+    }))
 }
 
 /// Get the icon for an app (SVG)
@@ -101,32 +110,30 @@ async fn get_app_from_catalog(
     params(("app_name" = String, Path, description = "App name")),
     responses((status = 200, description = "SVG icon content", content_type = "image/svg+xml"))
 )]
-async fn get_app_icon(Path(app_name): Path<String>) -> Result<Response> {
-    // Validate app name to prevent path traversal
-    if app_name.contains("..") || app_name.contains('/') || app_name.contains('\\') {
+async fn get_app_icon(
+    State(state): State<AppState>,
+    Path(app_name): Path<String>,
+    headers: HeaderMap,
+) -> Result<Response> {
+    // Allow-list the name so it can never be used for path traversal
+    if !is_valid_app_name(&app_name) {
         return Err(AppError::BadRequest("Invalid app name".to_string()));
     }
 
-    let icon_path = CONFIG.charts.dir.join(&app_name).join("icon.svg");
-
-    if !icon_path.exists() {
-        return Err(AppError::NotFound(format!(
-            "Icon not found for app '{}'",
-            app_name
-        )));
-    }
-
-    let content = std::fs::read(&icon_path)
-        .map_err(|e| AppError::Internal(format!("Failed to read icon: {}", e)))?;
-
-    Ok((
-        [
-            (header::CONTENT_TYPE, "image/svg+xml"),
-            (header::CACHE_CONTROL, "public, max-age=604800, immutable"),
-        ],
-        content,
-    )
-        .into_response())
+    // Icons are read into memory with the catalog, so no disk access here
+    let icon = state
+        .catalog
+        .read()
+        .await
+        .get_icon(&app_name)
+        .ok_or_else(|| AppError::NotFound(format!("Icon not found for app '{}'", app_name)))?;
+
+    Ok(cached_response(
+        &headers,
+        &icon.etag,
+        ICON_CACHE_CONTROL,
+        || ([(header::CONTENT_TYPE, "image/svg+xml")], icon.svg),
+    ))
 }
 
 /// List installed apps
@@ -140,11 +147,7 @@ async fn list_installed_apps(
     State(state): State<AppState>,
     _auth: Authorized<AppsView>,
 ) -> Result<Json<Vec<String>>> {
-    let k8s = state.k8s_client.read().await;
-    let catalog = state.catalog.read().await;
-
-    let apps = if let Some(ref client) = *k8s {
-        let manager = DeploymentManager::new(client, &catalog);
+    let apps = if let Ok(manager) = state.deployment_manager().await {
         manager.get_deployed_apps().await
     } else {
         Vec::new()
@@ -167,25 +170,20 @@ async fn install_app(
     Json(request): Json<DeploymentRequest>,
 ) -> Result<Json<DeploymentStatus>> {
     let db = state.get_db().await?;
-    let k8s = state.k8s_client.read().await;
-    let catalog = state.catalog.read().await;
 
-    let client = k8s
-        .as_ref()
-        .ok_or_else(|| AppError::Internal("Kubernetes client not available".to_string()))?;
+    // Use with_db to enable VPN support
+    let manager = state.deployment_manager().await?.with_db(db.clone());
 
     // Get storage path from settings
     let storage_setting = SystemSetting::find_by_id("storage_path").one(&db).await?;
     let storage_path = storage_setting.map(|s| s.value);
-
-    // Use with_db to enable VPN support
-    let manager = DeploymentManager::with_db(client, &catalog, &db);
     let status = manager
         .deploy_app(&request, storage_path.as_deref())
         .await?;
 
     // Invalidate cache to ensure fresh lookup when app becomes ready
     state.endpoint_cache.invalidate(&request.app_name).await;
+    state.app_status_cache.invalidate(&request.app_name).await;
 
     Ok(Json(status))
 }
@@ -203,8 +201,7 @@ async fn delete_app(
     Path(app_name): Path<String>,
     _auth: Authorized<AppsDelete>,
 ) -> Result<Json<serde_json::Value>> {
-    let k8s = state.k8s_client.read().await;
-    let catalog = state.catalog.read().await;
+    let catalog = state.get_catalog().await;
 
     // Check if this is a system app
     if let Some(app) = catalog.get_app(&app_name) {
@@ -216,15 +213,12 @@ async fn delete_app(
         }
     }
 
-    let client = k8s
-        .as_ref()
-        .ok_or_else(|| AppError::Internal("Kubernetes client not available".to_string()))?;
-
-    let manager = DeploymentManager::new(client, &catalog);
+    let manager = state.deployment_manager().await?;
     manager.remove_app(&app_name).await?;
 
     // Invalidate endpoint cache for deleted app
     state.endpoint_cache.invalidate(&app_name).await;
+    state.app_status_cache.invalidate(&app_name).await;
 
     Ok(Json(serde_json::json!({
         "success": true,
@@ -252,33 +246,14 @@ async fn restart_app(
 ) -> Result<Json<serde_json::Value>> {
     let namespace = query.namespace.unwrap_or_else(|| app_name.clone());
 
-    let k8s = state.k8s_client.read().await;
-    let client = k8s
-        .as_ref()
-        .ok_or_else(|| AppError::Internal("Kubernetes client not available".to_string()))?;
-
-    // Get pods with app label
-    let pods = client.get_pod_status(&namespace, Some(&app_name)).await?;
+    let client = state.get_k8s().await?;
 
-    // Delete each pod
-    use k8s_openapi::api::core::v1::Pod;
-    use kube::api::{Api, DeleteParams};
-
-    let pod_api: Api<Pod> = Api::namespaced(client.client().clone(), &namespace);
-    let mut deleted_count = 0;
-
-    for pod in &pods {
-        if pod_api
-            .delete(&pod.name, &DeleteParams::default())
-            .await
-            .is_ok()
-        {
-            deleted_count += 1;
-        }
-    }
+    // Delete all pods with the app label in one request; their controllers recreate them
+    let deleted_count = client.delete_app_pods(&namespace, &app_name).await?;
 
     // Invalidate endpoint cache since service endpoint may change after restart
     state.endpoint_cache.invalidate(&app_name).await;
+    state.app_status_cache.invalidate(&app_name).await;
 
     Ok(Json(serde_json::json!({
         "success": true,
@@ -295,10 +270,16 @@ async fn restart_app(
 )]
 async fn list_categories(
     State(state): State<AppState>,
+    headers: HeaderMap,
     _auth: Authorized<AppsView>,
-) -> Result<Json<Vec<String>>> {
+) -> Result<Response> {
     let catalog = state.catalog.read().await;
-    Ok(Json(catalog.get_categories()))
+    Ok(catalog_response(&headers, catalog.etag(), || {
+        (
+            [(header::CONTENT_TYPE, "application/json")],
+            catalog.categories_json(),
+        )
+    }))
 }
 
 /// Get apps by category
@@ -312,15 +293,16 @@ async fn list_categories(
 async fn get_apps_by_category(
     State(state): State<AppState>,
     Path(category): Path<String>,
+    headers: HeaderMap,
     _auth: Authorized<AppsView>,
-) -> Result<Json<Vec<AppConfig>>> {
+) -> Result<Response> {
     let catalog = state.catalog.read().await;
-    let apps: Vec<AppConfig> = catalog
-        .get_apps_by_category(&category)
-        .into_iter()
-        .cloned()
-        .collect();
-    Ok(Json(apps))
+    Ok(catalog_response(&headers, catalog.etag(), || {
+        (
+            [(header::CONTENT_TYPE, "application/json")],
+            catalog.category_apps_json(&category),
+        )
+    }))
 }
 
 /// Check app health
@@ -336,14 +318,7 @@ async fn check_app_health(
     Path(app_name): Path<String>,
     _auth: Authorized<AppsView>,
 ) -> Result<Json<serde_json::Value>> {
-    let k8s = state.k8s_client.read().await;
-    let catalog = state.catalog.read().await;
-
-    let client = k8s
-        .as_ref()
-        .ok_or_else(|| AppError::Internal("Kubernetes client not available".to_string()))?;
-
-    let manager = DeploymentManager::new(client, &catalog);
+    let manager = state.deployment_manager().await?;
     let health = manager.check_namespace_health(&app_name).await?;
 
     Ok(Json(health))
@@ -362,14 +337,7 @@ async fn check_app_exists(
     Path(app_name): Path<String>,
     _auth: Authorized<AppsView>,
 ) -> Result<Json<serde_json::Value>> {
-    let k8s = state.k8s_client.read().await;
-    let catalog = state.catalog.read().await;
-
-    let client = k8s
-        .as_ref()
-        .ok_or_else(|| AppError::Internal("Kubernetes client not available".to_string()))?;
-
-    let manager = DeploymentManager::new(client, &catalog);
+    let manager = state.deployment_manager().await?;
     let exists = manager.check_namespace_exists(&app_name).await;
 
     Ok(Json(serde_json::json!({"exists": exists})))
@@ -388,12 +356,13 @@ async fn get_app_status(
     Path(app_name): Path<String>,
     _auth: Authorized<AppsView>,
 ) -> Result<Json<serde_json::Value>> {
-    let k8s = state.k8s_client.read().await;
-    let catalog = state.catalog.read().await;
+    if let Some(status) = state.app_status_cache.get(&app_name).await {
+        return Ok(Json(status));
+    }
 
-    let client = match k8s.as_ref() {
-        Some(c) => c,
-        None => {
+    let manager = match state.deployment_manager().await {
+        Ok(m) => m,
+        Err(_) => {
             return Ok(Json(serde_json::json!({
                 "state": "error",
                 "message": "Kubernetes client not available"
@@ -401,39 +370,75 @@ async fn get_app_status(
         }
     };
 
-    let manager = DeploymentManager::new(client, &catalog);
+    // The health check already reports a missing namespace, so one call covers both
+    let health = match manager.check_namespace_health(&app_name).await {
+        Ok(health) => health,
+        Err(e) => {
+            return Ok(Json(serde_json::json!({
+                "state": "error",
+                "message": e.to_string()
+            })));
+        }
+    };
 
-    // Check if namespace exists
-    if !manager.check_namespace_exists(&app_name).await {
-        return Ok(Json(serde_json::json!({
-            "state": "idle",
-            "message": "Not installed"
-        })));
+    let status = app_status_json(
+        health["status"].as_str().unwrap_or("unknown"),
+        health["message"].as_str(),
+    );
+
+    state.app_status_cache.set(&app_name, status.clone()).await;
+    Ok(Json(status))
+}
+
+/// Get the status of every app in the catalog
+///
+/// Lets dashboards fetch all app states in one request, backed by a few
+/// cluster-wide list calls instead of a health check per app.
+#[utoipa::path(
+    get,
+    path = "/api/apps/status",
+    tag = "Apps",
+    responses((status = 200, body = serde_json::Value))
+)]
+async fn get_all_app_statuses(
+    State(state): State<AppState>,
+    _auth: Authorized<AppsView>,
+) -> Result<Json<BTreeMap<String, serde_json::Value>>> {
+    let manager = state.deployment_manager().await?;
+    let health = manager.get_app_health_statuses().await?;
+
+    let mut statuses = BTreeMap::new();
+    for (app_name, health) in health {
+        let status = app_status_json(
+            health["status"].as_str().unwrap_or("unknown"),
+            health["message"].as_str(),
+        );
+        state.app_status_cache.set(&app_name, status.clone()).await;
+        statuses.insert(app_name, status);
     }
 
-    // Check health
-    match manager.check_namespace_health(&app_name).await {
-        Ok(health) => {
-            let status = health["status"].as_str().unwrap_or("unknown");
-            match status {
-                "healthy" => Ok(Json(serde_json::json!({
-                    "state": "installed",
-                    "message": "Running"
-                }))),
-                "no_deployments" => Ok(Json(serde_json::json!({
-                    "state": "idle",
-                    "message": "No deployments found"
-                }))),
-                _ => Ok(Json(serde_json::json!({
-                    "state": "installing",
-                    "message": health["message"].as_str().unwrap_or("Waiting for deployments to be ready")
-                }))),
-            }
-        }
-        Err(e) => Ok(Json(serde_json::json!({
-            "state": "error",
-            "message": e.to_string()
-        }))),
+    Ok(Json(statuses))
+}
+
+/// Map a namespace health status onto the app state shown in the UI
+fn app_status_json(status: &str, message: Option<&str>) -> serde_json::Value {
+    match status {
+        "not_found" => serde_json::json!({
+            "state": "idle",
+            "message": "Not installed"
+        }),
+        "healthy" => serde_json::json!({
+            "state": "installed",
+            "message": "Running"
+        }),
+        "no_deployments" => serde_json::json!({
+            "state": "idle",
+            "message": "No deployments found"
+        }),
+        _ => serde_json::json!({
+            "state": "installing",
+            "message": message.unwrap_or("Waiting for deployments to be ready")
+        }),
     }
 }
 
@@ -497,3 +502,83 @@ async fn log_app_access(
         "message": "Access logged"
     })))
 }
+
+// ============================================================================
+// Helper Functions
+// ============================================================================
+
+/// Check whether an If-None-Match header value matches the given ETag
+fn etag_matches(if_none_match: &str, etag: &str) -> bool {
+    if_none_match
+        .split(',')
+        .map(str::trim)
+        .any(|candidate| candidate == "*" || candidate.trim_start_matches("W/") == etag)
+}
+
+/// Allow-list check for app names: a DNS-1123 label, as used for chart
+/// directories and namespaces (lowercase alphanumerics and '-', at most 63
+/// characters, starting and ending alphanumeric), checked in a single pass
+fn is_valid_app_name(name: &str) -> bool {
+    let bytes = name.as_bytes();
+    !bytes.is_empty()
+        && bytes.len() <= 63
+        && bytes.first() != Some(&b'-')
+        && bytes.last() != Some(&b'-')
+        && bytes
+            .iter()
+            .all(|&b| b.is_ascii_lowercase() || b.is_ascii_digit() || b == b'-')
+}
+
+/// Build a cacheable catalog response (see [`cached_response`])
+fn catalog_response<T: IntoResponse>(
+    headers: &HeaderMap,
+    etag: &str,
+    body: impl FnOnce() -> T,
+) -> Response {
+    cached_response(headers, etag, CATALOG_CACHE_CONTROL, body)
+}
+
+/// Build a cacheable response, answering 304 when the client's copy is current
+///
+/// The body is only built when it will actually be sent.
+fn cached_response<T: IntoResponse>(
+    headers: &HeaderMap,
+    etag: &str,
+    cache_control: &'static str,
+    body: impl FnOnce() -> T,
+) -> Response {
+    let not_modified = headers
+        .get(header::IF_NONE_MATCH)
+        .and_then(|v| v.to_str().ok())
+        .is_some_and(|v| etag_matches(v, etag));
+
+    let cache_headers = [
+        (header::ETAG, etag.to_string()),
+        (header::CACHE_CONTROL, cache_control.to_string()),
+    ];
+
+    if not_modified {
+        (StatusCode::NOT_MODIFIED, cache_headers).into_response()
+    } else {
+        (cache_headers, body()).into_response()
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_is_valid_app_name() {
+        assert!(is_valid_app_name("sonarr"));
+        assert!(is_valid_app_name("qbittorrent-vpn"));
+        assert!(is_valid_app_name("a1"));
+        assert!(!is_valid_app_name(""));
+        assert!(!is_valid_app_name("../etc/passwd"));
+        assert!(!is_valid_app_name("..\\windows"));
+        assert!(!is_valid_app_name("-sonarr"));
+        assert!(!is_valid_app_name("sonarr-"));
+        assert!(!is_valid_app_name("Sonarr"));
+        assert!(!is_valid_app_name(&"a".repeat(64)));
+    }
+}
@@ -17,7 +17,8 @@ use crate::middleware::auth::{
 use crate::models::prelude::*;
 use crate::models::{role, session, two_factor_recovery_code, user, user_role};
 use crate::services::{
-    create_session_token, decode_session_token, verify_password, verify_recovery_code, verify_totp,
+    create_session_token, decode_session_token, verify_login_password_async, verify_recovery_code,
+    verify_totp,
 };
 use crate::state::AppState;
 
@@ -219,31 +220,7 @@ async fn login(
 ) -> Result<Response> {
     let db = state.get_db().await?;
 
-    // Find user by username or email
-    let found_user = User::find()
-        .filter(
-            user::Column::Username
-                .eq(&request.username)
-                .or(user::Column::Email.eq(&request.username)),
-        )
-        .one(&db)
-        .await?
-        .ok_or_else(|| AppError::Unauthorized("Invalid credentials".to_string()))?;
-
-    // Check if user is active and approved
-    if !found_user.is_active {
-        return Err(AppError::Unauthorized("Account is disabled".to_string()));
-    }
-    if !found_user.is_approved {
-        return Err(AppError::Unauthorized(
-            "Account is pending approval".to_string(),
-        ));
-    }
-
-    // Verify password
-    if !verify_password(&request.password, &found_user.hashed_password) {
-        return Err(AppError::Unauthorized("Invalid credentials".to_string()));
-    }
+    let found_user = authenticate_credentials(&db, &request.username, &request.password).await?;
 
     // If role requires 2FA but user hasn't set it up, block login
     if !found_user.totp_enabled && role_requires_2fa(&db, found_user.id).await {
@@ -312,7 +289,7 @@ async fn login(
     });
 
     // Determine if we should set Secure flag (check if running behind HTTPS)
-    let secure = CONFIG.auth.oauth2_issuer_url.starts_with("https://");
+    let secure = CONFIG.auth.secure_cookies;
 
     tracing::info!(
         user_id = found_user.id,
@@ -480,16 +457,70 @@ async fn revoke_session(
     Ok(Json(serde_json::json!({"message": "Session revoked"})))
 }
 
+/// Look up a user by login identifier (username or email)
+///
+/// Queries the column the identifier most likely refers to first (email if it
+/// contains '@', username otherwise) so the common case is a single indexed
+/// equality lookup instead of an OR across both columns. Falls back to the
+/// other column on a miss.
+async fn find_user_by_login(
+    db: &sea_orm::DatabaseConnection,
+    identifier: &str,
+) -> Result<Option<user::Model>> {
+    let (primary, fallback) = if identifier.contains('@') {
+        (user::Column::Email, user::Column::Username)
+    } else {
+        (user::Column::Username, user::Column::Email)
+    };
+
+    if let Some(found) = User::find().filter(primary.eq(identifier)).one(db).await? {
+        return Ok(Some(found));
+    }
+
+    Ok(User::find().filter(fallback.eq(identifier)).one(db).await?)
+}
+
+/// Resolve a username/email and password to an active, approved user.
+///
+/// The password is always run through bcrypt, even for unknown accounts, and
+/// account status is only disclosed once the password has been verified.
+async fn authenticate_credentials(
+    db: &sea_orm::DatabaseConnection,
+    identifier: &str,
+    password: &str,
+) -> Result<user::Model> {
+    let found_user = find_user_by_login(db, identifier).await?;
+
+    let stored_hash = found_user.as_ref().map(|u| u.hashed_password.as_str());
+    if !verify_login_password_async(password, stored_hash).await {
+        return Err(AppError::Unauthorized("Invalid credentials".to_string()));
+    }
+    let found_user =
+        found_user.ok_or_else(|| AppError::Unauthorized("Invalid credentials".to_string()))?;
+
+    if !found_user.is_active {
+        return Err(AppError::Unauthorized("Account is disabled".to_string()));
+    }
+    if !found_user.is_approved {
+        return Err(AppError::Unauthorized(
+            "Account is pending approval".to_string(),
+        ));
+    }
+
+    Ok(found_user)
+}
+
 /// Check if any of a user's roles require 2FA
 async fn role_requires_2fa(db: &sea_orm::DatabaseConnection, user_id: i64) -> bool {
-    let roles: Vec<role::Model> = Role::find()
+    // Let the database answer the question instead of loading every role
+    Role::find()
         .inner_join(UserRole)
         .filter(user_role::Column::UserId.eq(user_id))
-        .all(db)
+        .filter(role::Column::Requires2fa.eq(true))
+        .count(db)
         .await
-        .unwrap_or_default();
-
-    roles.iter().any(|r| r.requires_2fa)
+        .map(|n| n > 0)
+        .unwrap_or(false)
 }
 
 /// Login using a recovery code instead of a TOTP code
@@ -509,30 +540,7 @@ async fn recover_with_code(
 ) -> Result<Response> {
     let db = state.get_db().await?;
 
-    // Find user by username or email
-    let found_user = User::find()
-        .filter(
-            user::Column::Username
-                .eq(&request.username)
-                .or(user::Column::Email.eq(&request.username)),
-        )
-        .one(&db)
-        .await?
-        .ok_or_else(|| AppError::Unauthorized("Invalid credentials".to_string()))?;
-
-    if !found_user.is_active {
-        return Err(AppError::Unauthorized("Account is disabled".to_string()));
-    }
-    if !found_user.is_approved {
-        return Err(AppError::Unauthorized(
-            "Account is pending approval".to_string(),
-        ));
-    }
-
-    // Verify password
-    if !verify_password(&request.password, &found_user.hashed_password) {
-        return Err(AppError::Unauthorized("Invalid credentials".to_string()));
-    }
+    let found_user = authenticate_credentials(&db, &request.username, &request.password).await?;
 
     // Recovery only applies when 2FA is enabled
     if !found_user.totp_enabled {
@@ -552,14 +560,19 @@ async fn recover_with_code(
         .all(&db)
         .await?;
 
-    // Find a matching code
-    let matching = recovery_codes
-        .iter()
-        .find(|rc| verify_recovery_code(&request.recovery_code, &rc.code_hash));
+    // Find a matching code; each comparison is a bcrypt verify, so run them
+    // on the blocking thread pool rather than on the async runtime
+    let code = request.recovery_code.clone();
+    let matching = tokio::task::spawn_blocking(move || {
+        recovery_codes
+            .into_iter()
+            .find(|rc| verify_recovery_code(&code, &rc.code_hash))
+    })
+    .await
+    .map_err(|e| AppError::Internal(format!("Recovery code check failed: {}", e)))?;
 
-    let matched_code = matching
-        .ok_or_else(|| AppError::Unauthorized("Invalid recovery code".to_string()))?
-        .clone();
+    let matched_code =
+        matching.ok_or_else(|| AppError::Unauthorized("Invalid recovery code".to_string()))?;
 
     // Mark the code as used
     let now = Utc::now();
@@ -634,7 +647,7 @@ async fn recover_with_code(
         session_slot: slot,
     });
 
-    let secure = CONFIG.auth.oauth2_issuer_url.starts_with("https://");
+    let secure = CONFIG.auth.secure_cookies;
 
     tracing::info!(
         user_id = user_id,
@@ -729,7 +742,7 @@ async fn switch_session(
         return Err(AppError::NotFound("No session in that slot".to_string()));
     }
 
-    let secure = CONFIG.auth.oauth2_issuer_url.starts_with("https://");
+    let secure = CONFIG.auth.secure_cookies;
 
     tracing::info!(slot = slot, "User switched to session slot {}", slot);
 
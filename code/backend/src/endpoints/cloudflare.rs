@@ -64,11 +64,8 @@ async fn save_config(
     Json(req): Json<ProvisionRequest>,
 ) -> Result<Json<CloudflareTunnelResponse>> {
     let db = state.get_db().await?;
-    let k8s = state.k8s_client.read().await;
-    let client = k8s.as_ref().ok_or_else(|| {
-        crate::error::AppError::Internal("Kubernetes client not available".to_string())
-    })?;
-    let result = cloudflare::save_config(&db, client, req).await?;
+    let client = state.get_k8s().await?;
+    let result = cloudflare::save_config(&db, &client, req).await?;
     Ok(Json(result))
 }
 
@@ -86,11 +83,8 @@ async fn delete_config(
     _auth: Authorized<CloudflareManage>,
 ) -> Result<Json<serde_json::Value>> {
     let db = state.get_db().await?;
-    let k8s = state.k8s_client.read().await;
-    let client = k8s.as_ref().ok_or_else(|| {
-        crate::error::AppError::Internal("Kubernetes client not available".to_string())
-    })?;
-    cloudflare::delete_config(&db, client).await?;
+    let client = state.get_k8s().await?;
+    cloudflare::delete_config(&db, &client).await?;
     Ok(Json(serde_json::json!({ "success": true })))
 }
 
@@ -107,11 +101,8 @@ async fn get_status(
     State(state): State<AppState>,
     _auth: Authorized<CloudflareView>,
 ) -> Result<Json<CloudflareTunnelStatus>> {
-    let k8s = state.k8s_client.read().await;
-    let client = k8s.as_ref().ok_or_else(|| {
-        crate::error::AppError::Internal("Kubernetes client not available".to_string())
-    })?;
-    let status = cloudflare::get_status(client).await?;
+    let client = state.get_k8s().await?;
+    let status = cloudflare::get_status(&client).await?;
     Ok(Json(status))
 }
 
@@ -5,9 +5,9 @@
 //! Implements SPA routing: returns index.html for non-asset 404s.
 
 use axum::{
-    body::Body,
+    body::{Body, Bytes},
     extract::{Request, State},
-    http::{header, Method, Response, StatusCode},
+    http::{header, HeaderValue, Method, Response, StatusCode},
 };
 
 use crate::config::CONFIG;
@@ -17,7 +17,11 @@ use crate::models::session;
 use crate::services::security::decode_session_token;
 use crate::state::AppState;
 use chrono::Utc;
+use once_cell::sync::Lazy;
+use parking_lot::RwLock;
 use sea_orm::{ColumnTrait, EntityTrait, QueryFilter};
+use std::collections::HashMap;
+use std::time::{Duration, Instant};
 
 /// Check if a path looks like a static asset (has a file extension)
 fn is_static_asset(path: &str) -> bool {
@@ -29,6 +33,58 @@ fn is_static_asset(path: &str) -> bool {
     }
 }
 
+/// Client-side routes the frontend answered with 404, with their expiry, so
+/// later requests can skip straight to the index.html fallback. Entries expire
+/// with [`INDEX_HTML_TTL`] so a rollout that adds a real file at one of these
+/// paths is picked up. Cleared when full.
+const SPA_FALLBACK_PATHS_MAX: usize = 1024;
+static SPA_FALLBACK_PATHS: Lazy<RwLock<HashMap<String, Instant>>> =
+    Lazy::new(|| RwLock::new(HashMap::new()));
+
+/// How long a fetched index.html is served from memory before refetching.
+/// Short, so a frontend rollout shows up without restarting the backend.
+const INDEX_HTML_TTL: Duration = Duration::from_secs(30);
+
+/// The frontend's index.html, kept in memory for SPA fallbacks
+struct CachedIndexHtml {
+    body: Bytes,
+    content_type: HeaderValue,
+    expires_at: Instant,
+}
+
+static INDEX_HTML_CACHE: Lazy<RwLock<Option<CachedIndexHtml>>> = Lazy::new(|| RwLock::new(None));
+
+/// Build an index.html response; browsers must revalidate it since asset names change per build
+fn index_html_response(body: Bytes, content_type: HeaderValue) -> Response<Body> {
+    let mut response = Response::new(Body::from(body));
+    response
+        .headers_mut()
+        .insert(header::CONTENT_TYPE, content_type);
+    response
+        .headers_mut()
+        .insert(header::CACHE_CONTROL, HeaderValue::from_static("no-cache"));
+    response
+}
+
+/// Mark content-hashed build assets (/assets/*) as immutable so browsers
+/// stop revalidating them on every page load
+fn with_asset_cache_headers(mut response: Response<Body>, path: &str) -> Response<Body> {
+    if path.starts_with("/assets/")
+        && response.status() == StatusCode::OK
+        && !response.headers().contains_key(header::CACHE_CONTROL)
+    {
+        response.headers_mut().insert(
+            header::CACHE_CONTROL,
+            header::HeaderValue::from_static("public, max-age=31536000, immutable"),
+        );
+        response.headers_mut().insert(
+            header::VARY,
+            header::HeaderValue::from_static("Accept-Encoding"),
+        );
+    }
+    response
+}
+
 /// Reserved paths that should never be treated as app names
 const RESERVED_PATHS: &[&str] = &[
     "api",
@@ -165,30 +221,29 @@ async fn rewrite_response_body(response: Response<Body>, app_name: &str) -> Resp
     Response::from_parts(parts, Body::from(body_bytes))
 }
 
+/// Attribute openings whose absolute paths get the app prefix in HTML
+const HTML_ATTR_PATH_PREFIXES: &[&str] = &[
+    "src=\"",
+    "href=\"",
+    "action=\"",
+    "src='",
+    "href='",
+    "action='",
+];
+
+/// Openings of common JS patterns containing absolute paths:
+/// - Webpack minified public path: .p="/..." (e.g., .p="/_next/")
+/// - JSON-style config values: :"/" or : "/" (e.g., "base": "/")
+const JS_PATH_PREFIXES: &[&str] = &[".p=\"", ".p='", ":\"", ":'", ": \"", ": '"];
+
+/// CSS url() openings, quoted and unquoted
+const CSS_PATH_PREFIXES: &[&str] = &["url(\"", "url('", "url("];
+
 /// Rewrite HTML content: absolute paths in attributes + inline script patterns
 fn rewrite_html(html: &str, prefix: &str) -> String {
-    // Rewrite absolute paths in HTML attributes (double and single quoted)
-    let rewritten = html
-        .replace("src=\"/", &format!("src=\"{}/", prefix))
-        .replace("href=\"/", &format!("href=\"{}/", prefix))
-        .replace("action=\"/", &format!("action=\"{}/", prefix))
-        .replace("src='/", &format!("src='{}/", prefix))
-        .replace("href='/", &format!("href='{}/", prefix))
-        .replace("action='/", &format!("action='{}/", prefix));
-
-    // Fix protocol-relative URLs that got incorrectly rewritten (e.g., //cdn.example.com)
-    let rewritten = rewritten
-        .replace(&format!("src=\"{}//", prefix), "src=\"//")
-        .replace(&format!("href=\"{}//", prefix), "href=\"//")
-        .replace(&format!("action=\"{}//", prefix), "action=\"//")
-        .replace(&format!("src='{}//", prefix), "src='//")
-        .replace(&format!("href='{}//", prefix), "href='//")
-        .replace(&format!("action='{}//", prefix), "action='//");
-
-    // Rewrite inline JS patterns commonly found in <script> blocks:
-    // - JSON config values like "base": "/" or "basePath": "/"
-    //   These are used by apps (e.g., Deluge ExtJS) to construct URLs at runtime
-    rewrite_js_paths(&rewritten, prefix)
+    // Inline <script> blocks carry the same JSON config values as JS files
+    // (e.g., Deluge ExtJS builds URLs at runtime from "base": "/")
+    prefix_absolute_paths(html, prefix, &[HTML_ATTR_PATH_PREFIXES, JS_PATH_PREFIXES])
 }
 
 /// Rewrite JavaScript content: webpack public paths and other absolute path patterns
@@ -198,48 +253,53 @@ fn rewrite_js(js: &str, prefix: &str) -> String {
 
 /// Rewrite CSS content: url() references with absolute paths
 fn rewrite_css(css: &str, prefix: &str) -> String {
-    // url("/path/...") → url("/app_name/path/...")
-    let rewritten = css
-        .replace("url(\"/", &format!("url(\"{}/", prefix))
-        .replace("url('/", &format!("url('{}/", prefix))
-        .replace("url(/", &format!("url({}/", prefix));
-
-    // Fix protocol-relative
-    rewritten
-        .replace(&format!("url(\"{}//'", prefix), "url(\"//")
-        .replace(&format!("url('{}//'", prefix), "url('//")
-        .replace(&format!("url({}//'", prefix), "url(//")
+    prefix_absolute_paths(css, prefix, &[CSS_PATH_PREFIXES])
 }
 
-/// Rewrite common JS patterns containing absolute paths.
-/// This is generic and handles patterns from various frameworks:
-/// - Webpack minified public path: .p="/..." (e.g., .p="/_next/")
-/// - JSON-style config values: :"/" or : "/" (e.g., "base": "/")
+/// Rewrite common JS patterns containing absolute paths (see [`JS_PATH_PREFIXES`])
 fn rewrite_js_paths(text: &str, prefix: &str) -> String {
-    let rewritten = text
-        // Webpack public path (minified): .p="/..." or .p='/'
-        .replace(".p=\"/", &format!(".p=\"{}/", prefix))
-        .replace(".p='/", &format!(".p='{}/", prefix))
-        // JSON config values: :"/" and : "/" (with optional space after colon)
-        // Catches patterns like "base":"/" or "base": "/"
-        .replace(":\"/", &format!(":\"{}/", prefix))
-        .replace(":'/", &format!(":\'{}/", prefix))
-        .replace(": \"/", &format!(": \"{}/", prefix))
-        .replace(": '/", &format!(": '{}/", prefix));
-
-    // Fix protocol-relative URLs that got incorrectly rewritten
-    let rewritten = rewritten
-        .replace(&format!(".p=\"{}//", prefix), ".p=\"//")
-        .replace(&format!(".p='{}//", prefix), ".p='//")
-        .replace(&format!(":\"{}//'", prefix), ":\"//")
-        .replace(&format!(":\'{}//'", prefix), ":'//")
-        .replace(&format!(": \"{}//'", prefix), ": \"//")
-        .replace(&format!(": '{}//'", prefix), ": '//");
-
-    // Fix double-prefixing: if a path already had the prefix, undo the extra one
-    let double_prefix = format!("{}{}/", prefix, prefix);
-    let single_prefix = format!("{}/", prefix);
-    rewritten.replace(&double_prefix, &single_prefix)
+    prefix_absolute_paths(text, prefix, &[JS_PATH_PREFIXES])
+}
+
+/// Insert `prefix` before every absolute path that directly follows one of
+/// the given openings, in a single pass over the text.
+///
+/// Protocol-relative URLs (`//host/...`) and paths that already start with
+/// the prefix are left untouched.
+fn prefix_absolute_paths(text: &str, prefix: &str, openings: &[&[&str]]) -> String {
+    let app_segment = prefix.trim_start_matches('/');
+    let mut rewritten = String::with_capacity(text.len() + text.len() / 32);
+    let mut copied = 0;
+
+    for (i, _) in text.match_indices('/') {
+        let before = &text[..i];
+        // Every opening ends in a quote or parenthesis; skip other slashes cheaply
+        if !matches!(before.as_bytes().last(), Some(b'"' | b'\'' | b'(')) {
+            continue;
+        }
+        if !openings
+            .iter()
+            .flat_map(|set| set.iter())
+            .any(|opening| before.ends_with(opening))
+        {
+            continue;
+        }
+
+        let after = &text[i + 1..];
+        let already_prefixed = after
+            .strip_prefix(app_segment)
+            .is_some_and(|rest| rest.starts_with('/'));
+        if after.starts_with('/') || already_prefixed {
+            continue;
+        }
+
+        rewritten.push_str(&text[copied..i]);
+        rewritten.push_str(prefix);
+        copied = i;
+    }
+
+    rewritten.push_str(&text[copied..]);
+    rewritten
 }
 
 /// Create a redirect response to the app error page
@@ -389,50 +449,7 @@ pub async fn proxy_frontend(
         }
     }
 
-    let body = request.into_body();
-    let proxy = &state.proxy;
-
-    // For static assets, proxy directly
-    if is_static_asset(&path) {
-        let target_url = format!("{}{}{}", CONFIG.frontend_url, path, query);
-        tracing::debug!("Proxying static asset: {}", target_url);
-
-        return proxy
-            .proxy_http(&target_url, method, headers, body)
-            .await
-            .map_err(|e| {
-                tracing::error!("Frontend proxy error: {}", e);
-                AppError::BadGateway(format!("Frontend unavailable: {}", e))
-            });
-    }
-
-    // For non-asset paths, try the path first, fall back to index.html on 404
-    let target_url = format!("{}{}{}", CONFIG.frontend_url, path, query);
-    tracing::debug!("Proxying to frontend: {}", target_url);
-
-    let response = proxy
-        .proxy_http(&target_url, method.clone(), headers.clone(), body)
-        .await
-        .map_err(|e| {
-            tracing::error!("Frontend proxy error: {}", e);
-            AppError::BadGateway(format!("Frontend unavailable: {}", e))
-        })?;
-
-    // If 404, serve index.html for SPA routing
-    if response.status() == StatusCode::NOT_FOUND {
-        let index_url = format!("{}/index.html", CONFIG.frontend_url);
-        tracing::debug!("SPA fallback to index.html for path: {}", path);
-
-        return proxy
-            .proxy_http(&index_url, Method::GET, headers, Body::empty())
-            .await
-            .map_err(|e| {
-                tracing::error!("Frontend proxy error (index.html): {}", e);
-                AppError::BadGateway(format!("Frontend unavailable: {}", e))
-            });
-    }
-
-    Ok(response)
+    proxy_to_frontend(&state, path, query, method, headers, request.into_body()).await
 }
 
 /// Check if user has permission to access the app
@@ -446,7 +463,10 @@ async fn check_app_permission(state: &AppState, user_id: i64, app_name: &str) ->
     let permissions = get_user_permissions(&db, user_id).await;
 
     // Check for app.* wildcard or specific app.{name} permission
-    permissions.contains(&"app.*".to_string()) || permissions.contains(&format!("app.{}", app_name))
+    permissions
+        .iter()
+        .filter_map(|p| p.strip_prefix("app."))
+        .any(|app| app == "*" || app == app_name)
 }
 
 /// Helper function to proxy to frontend
@@ -465,13 +485,26 @@ async fn proxy_to_frontend(
         let target_url = format!("{}{}{}", CONFIG.frontend_url, path, query);
         tracing::debug!("Proxying static asset: {}", target_url);
 
-        return proxy
-            .proxy_http(&target_url, method, headers, body)
+        // Assets are passed through unmodified, so the frontend may serve its
+        // precompressed .gz variants directly
+        let response = proxy
+            .proxy_http_encoded(&target_url, method, headers, body)
             .await
             .map_err(|e| {
                 tracing::error!("Frontend proxy error: {}", e);
                 AppError::BadGateway(format!("Frontend unavailable: {}", e))
-            });
+            })?;
+        return Ok(with_asset_cache_headers(response, &path));
+    }
+
+    // Client-side routes already known to 404 go straight to index.html
+    if method == Method::GET
+        && SPA_FALLBACK_PATHS
+            .read()
+            .get(&path)
+            .is_some_and(|expires_at| Instant::now() < *expires_at)
+    {
+        return proxy_index_html(state, &path, headers).await;
     }
 
     // For non-asset paths, try the path first, fall back to index.html on 404
@@ -488,21 +521,73 @@ async fn proxy_to_frontend(
 
     // If 404, serve index.html for SPA routing
     if response.status() == StatusCode::NOT_FOUND {
-        let index_url = format!("{}/index.html", CONFIG.frontend_url);
-        tracing::debug!("SPA fallback to index.html for path: {}", path);
-
-        return proxy
-            .proxy_http(&index_url, Method::GET, headers, Body::empty())
-            .await
-            .map_err(|e| {
-                tracing::error!("Frontend proxy error (index.html): {}", e);
-                AppError::BadGateway(format!("Frontend unavailable: {}", e))
-            });
+        if method == Method::GET {
+            let mut known = SPA_FALLBACK_PATHS.write();
+            let now = Instant::now();
+            if known.len() >= SPA_FALLBACK_PATHS_MAX {
+                known.retain(|_, expires_at| now < *expires_at);
+                if known.len() >= SPA_FALLBACK_PATHS_MAX {
+                    known.clear();
+                }
+            }
+            known.insert(path.clone(), now + INDEX_HTML_TTL);
+        }
+        return proxy_index_html(state, &path, headers).await;
     }
 
     Ok(response)
 }
 
+/// Proxy the frontend's index.html for SPA routing
+async fn proxy_index_html(
+    state: &AppState,
+    path: &str,
+    headers: axum::http::HeaderMap,
+) -> Result<Response<Body>> {
+    tracing::debug!("SPA fallback to index.html for path: {}", path);
+
+    if let Some(cached) = INDEX_HTML_CACHE.read().as_ref() {
+        if cached.expires_at > Instant::now() {
+            return Ok(index_html_response(
+                cached.body.clone(),
+                cached.content_type.clone(),
+            ));
+        }
+    }
+
+    let index_url = format!("{}/index.html", CONFIG.frontend_url);
+    let response = state
+        .proxy
+        .proxy_http(&index_url, Method::GET, headers, Body::empty())
+        .await
+        .map_err(|e| {
+            tracing::error!("Frontend proxy error (index.html): {}", e);
+            AppError::BadGateway(format!("Frontend unavailable: {}", e))
+        })?;
+
+    // Only successful responses are cached; errors pass through as-is
+    if response.status() != StatusCode::OK {
+        return Ok(response);
+    }
+
+    let content_type = response
+        .headers()
+        .get(header::CONTENT_TYPE)
+        .cloned()
+        .unwrap_or_else(|| HeaderValue::from_static("text/html"));
+    let body = axum::body::to_bytes(response.into_body(), usize::MAX)
+        .await
+        .map_err(|e| AppError::BadGateway(format!("Failed to read index.html: {}", e)))?;
+
+    *INDEX_HTML_CACHE.write() = Some(CachedIndexHtml {
+        body: body.clone(),
+        content_type: content_type.clone(),
+        expires_at: Instant::now() + INDEX_HTML_TTL,
+    });
+
+    Ok(index_html_response(body, content_type))
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -696,6 +781,59 @@ mod tests {
         builder.body(Body::empty()).unwrap()
     }
 
+    // -------------------------------------------------------------------------
+    // index_html_response tests
+    // -------------------------------------------------------------------------
+
+    #[test]
+    fn test_index_html_response_requires_revalidation() {
+        let response = index_html_response(
+            Bytes::from_static(b"<html></html>"),
+            HeaderValue::from_static("text/html"),
+        );
+        assert_eq!(response.status(), StatusCode::OK);
+        assert_eq!(
+            response.headers().get(header::CONTENT_TYPE).unwrap(),
+            "text/html"
+        );
+        assert_eq!(
+            response.headers().get(header::CACHE_CONTROL).unwrap(),
+            "no-cache"
+        );
+    }
+
+    // -------------------------------------------------------------------------
+    // with_asset_cache_headers tests
+    // -------------------------------------------------------------------------
+
+    #[test]
+    fn test_asset_cache_headers_set_for_hashed_assets() {
+        let response = make_response(StatusCode::OK, None);
+        let result = with_asset_cache_headers(response, "/assets/index-abc123.js");
+        assert_eq!(
+            result.headers().get(header::CACHE_CONTROL).unwrap(),
+            "public, max-age=31536000, immutable"
+        );
+        assert_eq!(
+            result.headers().get(header::VARY).unwrap(),
+            "Accept-Encoding"
+        );
+    }
+
+    #[test]
+    fn test_asset_cache_headers_skipped_outside_assets() {
+        let response = make_response(StatusCode::OK, None);
+        let result = with_asset_cache_headers(response, "/favicon.svg");
+        assert!(result.headers().get(header::CACHE_CONTROL).is_none());
+    }
+
+    #[test]
+    fn test_asset_cache_headers_skipped_for_errors() {
+        let response = make_response(StatusCode::NOT_FOUND, None);
+        let result = with_asset_cache_headers(response, "/assets/missing.js");
+        assert!(result.headers().get(header::CACHE_CONTROL).is_none());
+    }
+
     #[test]
     fn test_rewrite_app_response_non_redirect_passes_through() {
         let response = make_response(StatusCode::OK, None);
@@ -896,6 +1034,30 @@ mod tests {
         assert!(!result.contains(r#""/sonarr/sonarr/""#));
     }
 
+    #[test]
+    fn test_rewrite_js_paths_protocol_relative_url_preserved() {
+        let js = r#"{"cdn":"//cdn.example.com/lib.js"}"#;
+        let result = rewrite_js_paths(js, "/sonarr");
+        assert_eq!(result, js);
+    }
+
+    #[test]
+    fn test_rewrite_css_protocol_relative_and_prefixed_urls_preserved() {
+        let css = "a{background:url(//cdn.example.com/a.png)} b{background:url(/sonarr/b.png)}";
+        let result = rewrite_css(css, "/sonarr");
+        assert_eq!(result, css);
+    }
+
+    #[test]
+    fn test_rewrite_html_rewrites_attributes_and_inline_config_together() {
+        let html = r#"<a href="/home"></a><script>var c={"base":"/"}</script>"#;
+        let result = rewrite_html(html, "/sonarr");
+        assert_eq!(
+            result,
+            r#"<a href="/sonarr/home"></a><script>var c={"base":"/sonarr/"}</script>"#
+        );
+    }
+
     #[test]
     fn test_rewrite_js_paths_webpack_single_quote() {
         let js = ".p='/static/'";
@@ -914,6 +1076,11 @@ async fn get_app_target_url(
     // Check cache first
     let (base_url, base_path) = if let Some(cached) = state.endpoint_cache.get(app_name).await {
         cached
+    } else if state.endpoint_cache.is_missing(app_name).await {
+        return Err(AppError::NotFound(format!(
+            "App {} not found or not ready",
+            app_name
+        )));
     } else {
         // Get K8s client
         let k8s_guard = state.k8s_client.read().await;
@@ -926,6 +1093,7 @@ async fn get_app_target_url(
         let endpoints = k8s.get_service_endpoints(app_name, app_name).await?;
 
         if endpoints.is_empty() {
+            state.endpoint_cache.set_missing(app_name).await;
             return Err(AppError::NotFound(format!(
                 "App {} not found or not ready",
                 app_name
@@ -1,18 +1,36 @@
 use axum::{
     extract::{Path, Query, State},
+    http::header,
+    response::{IntoResponse, Response},
     routing::get,
     Json, Router,
 };
 use chrono::{Duration, Utc};
+use futures_util::future::join_all;
+use once_cell::sync::Lazy;
+use parking_lot::Mutex;
 use serde::{Deserialize, Serialize};
+use std::borrow::Cow;
 use std::collections::HashMap;
+use std::time::Instant;
 
+use crate::config::CONFIG;
 use crate::error::{AppError, Result};
 use crate::middleware::permissions::{Authorized, LogsView};
 use crate::state::AppState;
 
-// VictoriaLogs service URL inside the cluster
-const VICTORIALOGS_URL: &str = "http://victorialogs.victorialogs.svc.cluster.local:9428";
+/// Shared VictoriaLogs client, so requests reuse pooled connections
+static VLOGS_CLIENT: Lazy<reqwest::Client> = Lazy::new(reqwest::Client::new);
+
+/// How long field names and values fetched from VictoriaLogs are reused
+const VLOGS_FIELD_CACHE_TTL: std::time::Duration = std::time::Duration::from_secs(30);
+
+/// Upper bound on cached field lists; label names come from the request path
+const VLOGS_FIELD_CACHE_MAX_ENTRIES: usize = 256;
+
+/// Recently fetched field lists, keyed by endpoint and field name
+static VLOGS_FIELD_CACHE: Lazy<Mutex<HashMap<String, (Instant, Vec<String>)>>> =
+    Lazy::new(|| Mutex::new(HashMap::new()));
 
 pub fn logs_routes(state: AppState) -> Router {
     Router::new()
@@ -41,6 +59,42 @@ pub struct LogEntry {
     pub container: Option<String>,
 }
 
+/// Borrowed form of [`LogEntry`], serialized straight from the fetched log
+/// text instead of allocating a `String` per field for every line
+#[derive(Serialize)]
+struct LogEntryRef<'a> {
+    timestamp: &'a str,
+    line: &'a str,
+    pod_name: &'a str,
+    container: Option<&'a str>,
+}
+
+/// JSON punctuation and field names around each serialized log entry
+const LOG_ENTRY_JSON_OVERHEAD: usize = 64;
+
+/// Serialize log entries into a buffer sized up front from the entries
+/// themselves, so large tails don't grow the body through repeated
+/// reallocation the way `Json`'s small default buffer does
+fn log_entries_response(entries: &[LogEntryRef<'_>]) -> Result<Response> {
+    let capacity = entries
+        .iter()
+        .map(|e| {
+            e.timestamp.len()
+                + e.line.len()
+                + e.pod_name.len()
+                + e.container.map_or(0, str::len)
+                + LOG_ENTRY_JSON_OVERHEAD
+        })
+        .sum::<usize>()
+        + 2;
+
+    let mut body = Vec::with_capacity(capacity);
+    serde_json::to_writer(&mut body, entries)
+        .map_err(|e| AppError::Internal(format!("Failed to serialize log entries: {}", e)))?;
+
+    Ok(([(header::CONTENT_TYPE, "application/json")], body).into_response())
+}
+
 #[derive(Debug, Deserialize, utoipa::ToSchema)]
 pub struct PodLogsQuery {
     #[serde(default = "default_namespace")]
@@ -113,11 +167,8 @@ async fn get_pod_logs(
     Path(pod_name): Path<String>,
     Query(params): Query<PodLogsQuery>,
     _auth: Authorized<LogsView>,
-) -> Result<Json<Vec<LogEntry>>> {
-    let k8s = state.k8s_client.read().await;
-    let client = k8s
-        .as_ref()
-        .ok_or_else(|| AppError::Internal("Kubernetes client not available".to_string()))?;
+) -> Result<Response> {
+    let client = state.get_k8s().await?;
 
     let logs = client
         .get_pod_logs(
@@ -128,17 +179,18 @@ async fn get_pod_logs(
         )
         .await?;
 
-    let entries: Vec<LogEntry> = logs
+    let timestamp = Utc::now().to_rfc3339();
+    let entries: Vec<LogEntryRef> = logs
         .lines()
-        .map(|line| LogEntry {
-            timestamp: Utc::now().to_rfc3339(),
-            line: line.to_string(),
-            pod_name: pod_name.clone(),
-            container: params.container.clone(),
+        .map(|line| LogEntryRef {
+            timestamp: &timestamp,
+            line,
+            pod_name: &pod_name,
+            container: params.container.as_deref(),
         })
         .collect();
 
-    Ok(Json(entries))
+    log_entries_response(&entries)
 }
 
 #[utoipa::path(
@@ -158,46 +210,58 @@ async fn get_app_logs(
     Path(app_name): Path<String>,
     Query(params): Query<PodLogsQuery>,
     _auth: Authorized<LogsView>,
-) -> Result<Json<Vec<LogEntry>>> {
-    let k8s = state.k8s_client.read().await;
-    let client = k8s
-        .as_ref()
-        .ok_or_else(|| AppError::Internal("Kubernetes client not available".to_string()))?;
+) -> Result<Response> {
+    let client = state.get_k8s().await?;
 
     // Get all pods for the app
     let pods = client.list_pods(&params.namespace, Some(&app_name)).await?;
 
-    let mut all_entries = Vec::new();
-
-    for pod in pods {
-        if let Some(pod_name) = pod.metadata.name {
-            match client
-                .get_pod_logs(
-                    &pod_name,
-                    &params.namespace,
-                    params.container.as_deref(),
-                    params.tail,
-                )
-                .await
-            {
-                Ok(logs) => {
-                    for line in logs.lines() {
-                        all_entries.push(LogEntry {
-                            timestamp: Utc::now().to_rfc3339(),
-                            line: line.to_string(),
-                            pod_name: pod_name.clone(),
-                            container: params.container.clone(),
-                        });
-                    }
-                }
-                Err(e) => {
-                    tracing::warn!("Failed to get logs for pod {}: {}", pod_name, e);
-                }
+    // Fetch every pod's logs concurrently rather than one pod at a time
+    let fetches = pods
+        .into_iter()
+        .filter_map(|pod| pod.metadata.name)
+        .map(|pod_name| {
+            let client = &client;
+            let params = &params;
+            async move {
+                let logs = client
+                    .get_pod_logs(
+                        &pod_name,
+                        &params.namespace,
+                        params.container.as_deref(),
+                        params.tail,
+                    )
+                    .await;
+                (pod_name, logs)
+            }
+        });
+
+    let mut pod_logs = Vec::new();
+    for (pod_name, logs) in join_all(fetches).await {
+        match logs {
+            Ok(logs) => pod_logs.push((pod_name, logs)),
+            Err(e) => {
+                tracing::warn!("Failed to get logs for pod {}: {}", pod_name, e);
             }
         }
     }
 
-    Ok(Json(all_entries))
+    let timestamp = Utc::now().to_rfc3339();
+    let timestamp = timestamp.as_str();
+    let container = params.container.as_deref();
+    let all_entries: Vec<LogEntryRef> = pod_logs
+        .iter()
+        .flat_map(|(pod_name, logs)| {
+            logs.lines().map(move |line| LogEntryRef {
+                timestamp,
+                line,
+                pod_name,
+                container,
+            })
+        })
+        .collect();
+
+    log_entries_response(&all_entries)
 }
 
 #[utoipa::path(
@@ -218,10 +282,7 @@ async fn get_raw_pod_logs(
     Query(params): Query<PodLogsQuery>,
     _auth: Authorized<LogsView>,
 ) -> Result<String> {
-    let k8s = state.k8s_client.read().await;
-    let client = k8s
-        .as_ref()
-        .ok_or_else(|| AppError::Internal("Kubernetes client not available".to_string()))?;
+    let client = state.get_k8s().await?;
 
     let logs = client
         .get_pod_logs(
@@ -247,47 +308,7 @@ async fn get_raw_pod_logs(
 )]
 /// Get all namespaces that have logs in VictoriaLogs
 async fn get_vlogs_namespaces(_auth: Authorized<LogsView>) -> Result<Json<Vec<String>>> {
-    let client = reqwest::Client::builder()
-        .timeout(std::time::Duration::from_secs(30))
-        .build()
-        .map_err(|e| AppError::Internal(format!("Failed to create HTTP client: {}", e)))?;
-
-    // VictoriaLogs uses /select/logsql/field_values for getting field values
-    // Requires a query parameter
-    let response = client
-        .get(format!("{}/select/logsql/field_values", VICTORIALOGS_URL))
-        .query(&[("query", "*"), ("field", "namespace"), ("limit", "1000")])
-        .send()
-        .await
-        .map_err(|e| {
-            AppError::ServiceUnavailable(format!("Failed to connect to VictoriaLogs: {}", e))
-        })?;
-
-    if !response.status().is_success() {
-        let status = response.status();
-        let body = response.text().await.unwrap_or_default();
-        return Err(AppError::Internal(format!(
-            "VictoriaLogs returned error: {} - {}",
-            status, body
-        )));
-    }
-
-    // VictoriaLogs returns JSON with values array
-    let json: serde_json::Value = response
-        .json()
-        .await
-        .map_err(|e| AppError::Internal(format!("Failed to parse VictoriaLogs response: {}", e)))?;
-
-    let namespaces: Vec<String> = json
-        .get("values")
-        .and_then(|v| v.as_array())
-        .map(|arr| {
-            arr.iter()
-                .filter_map(|v| v.get("value").and_then(|v| v.as_str()).map(String::from))
-                .collect()
-        })
-        .unwrap_or_default();
-
+    let namespaces = fetch_vlogs_field_list("field_values", Some("namespace")).await?;
     Ok(Json(namespaces))
 }
 
@@ -301,46 +322,7 @@ async fn get_vlogs_namespaces(_auth: Authorized<LogsView>) -> Result<Json<Vec<St
 )]
 /// Get all available labels (field names) from VictoriaLogs
 async fn get_vlogs_labels(_auth: Authorized<LogsView>) -> Result<Json<Vec<String>>> {
-    let client = reqwest::Client::builder()
-        .timeout(std::time::Duration::from_secs(30))
-        .build()
-        .map_err(|e| AppError::Internal(format!("Failed to create HTTP client: {}", e)))?;
-
-    // VictoriaLogs uses /select/logsql/field_names with query parameter
-    let response = client
-        .get(format!("{}/select/logsql/field_names", VICTORIALOGS_URL))
-        .query(&[("query", "*"), ("limit", "1000")])
-        .send()
-        .await
-        .map_err(|e| {
-            AppError::ServiceUnavailable(format!("Failed to connect to VictoriaLogs: {}", e))
-        })?;
-
-    if !response.status().is_success() {
-        let status = response.status();
-        let body = response.text().await.unwrap_or_default();
-        return Err(AppError::Internal(format!(
-            "VictoriaLogs returned error: {} - {}",
-            status, body
-        )));
-    }
-
-    // VictoriaLogs returns JSON with values array
-    let json: serde_json::Value = response
-        .json()
-        .await
-        .map_err(|e| AppError::Internal(format!("Failed to parse VictoriaLogs response: {}", e)))?;
-
-    let labels: Vec<String> = json
-        .get("values")
-        .and_then(|v| v.as_array())
-        .map(|arr| {
-            arr.iter()
-                .filter_map(|v| v.get("value").and_then(|v| v.as_str()).map(String::from))
-                .collect()
-        })
-        .unwrap_or_default();
-
+    let labels = fetch_vlogs_field_list("field_names", None).await?;
     Ok(Json(labels))
 }
 
@@ -360,14 +342,36 @@ async fn get_vlogs_label_values(
     Path(label): Path<String>,
     _auth: Authorized<LogsView>,
 ) -> Result<Json<Vec<String>>> {
-    let client = reqwest::Client::builder()
-        .timeout(std::time::Duration::from_secs(30))
-        .build()
-        .map_err(|e| AppError::Internal(format!("Failed to create HTTP client: {}", e)))?;
+    let values = fetch_vlogs_field_list("field_values", Some(&label)).await?;
+    Ok(Json(values))
+}
 
-    let response = client
-        .get(format!("{}/select/logsql/field_values", VICTORIALOGS_URL))
-        .query(&[("query", "*"), ("field", label.as_str()), ("limit", "1000")])
+/// Fetch field names (`field_names`) or the values of one field
+/// (`field_values`) from VictoriaLogs, reusing results for a short while.
+///
+/// Namespaces and labels change on a scale of minutes, but the log viewer
+/// asks for them on every render.
+async fn fetch_vlogs_field_list(endpoint: &str, field: Option<&str>) -> Result<Vec<String>> {
+    let cache_key = format!("{}:{}", endpoint, field.unwrap_or_default());
+    if let Some((fetched_at, values)) = VLOGS_FIELD_CACHE.lock().get(&cache_key) {
+        if fetched_at.elapsed() < VLOGS_FIELD_CACHE_TTL {
+            return Ok(values.clone());
+        }
+    }
+
+    // VictoriaLogs field endpoints require a query parameter
+    let mut query = vec![("query", "*"), ("limit", "1000")];
+    if let Some(field) = field {
+        query.push(("field", field));
+    }
+
+    let response = VLOGS_CLIENT
+        .get(format!(
+            "{}/select/logsql/{}",
+            CONFIG.kubernetes.victorialogs_url, endpoint
+        ))
+        .query(&query)
+        .timeout(std::time::Duration::from_secs(30))
         .send()
         .await
         .map_err(|e| {
@@ -399,7 +403,16 @@ async fn get_vlogs_label_values(
         })
         .unwrap_or_default();
 
-    Ok(Json(values))
+    let mut cache = VLOGS_FIELD_CACHE.lock();
+    if cache.len() >= VLOGS_FIELD_CACHE_MAX_ENTRIES {
+        cache.retain(|_, (fetched_at, _)| fetched_at.elapsed() < VLOGS_FIELD_CACHE_TTL);
+        if cache.len() >= VLOGS_FIELD_CACHE_MAX_ENTRIES {
+            cache.clear();
+        }
+    }
+    cache.insert(cache_key, (Instant::now(), values.clone()));
+
+    Ok(values)
 }
 
 #[utoipa::path(
@@ -415,11 +428,6 @@ async fn query_vlogs(
     Query(params): Query<VLogsQueryParams>,
     _auth: Authorized<LogsView>,
 ) -> Result<Json<VLogsQueryResponse>> {
-    let client = reqwest::Client::builder()
-        .timeout(std::time::Duration::from_secs(60))
-        .build()
-        .map_err(|e| AppError::Internal(format!("Failed to create HTTP client: {}", e)))?;
-
     // Default to last hour if no time range specified
     let now = Utc::now();
     let end = params.end.unwrap_or_else(|| now.to_rfc3339());
@@ -431,14 +439,18 @@ async fn query_vlogs(
     // Convert Loki-style query to LogsQL if needed
     let query = convert_loki_to_logsql(&params.query);
 
-    let response = client
-        .get(format!("{}/select/logsql/query", VICTORIALOGS_URL))
+    let mut response = VLOGS_CLIENT
+        .get(format!(
+            "{}/select/logsql/query",
+            CONFIG.kubernetes.victorialogs_url
+        ))
         .query(&[
             ("query", query.as_str()),
             ("start", start.as_str()),
             ("end", end.as_str()),
             ("limit", &params.limit.to_string()),
         ])
+        .timeout(std::time::Duration::from_secs(60))
         .send()
         .await
         .map_err(|e| {
@@ -454,105 +466,168 @@ async fn query_vlogs(
         )));
     }
 
-    // VictoriaLogs returns JSON Lines format
-    let text = response
-        .text()
+    // VictoriaLogs returns JSON Lines format; group records as chunks arrive
+    // instead of buffering the whole body first
+    let mut grouper = VLogsStreamGrouper::default();
+    while let Some(chunk) = response
+        .chunk()
         .await
-        .map_err(|e| AppError::Internal(format!("Failed to read VictoriaLogs response: {}", e)))?;
+        .map_err(|e| AppError::Internal(format!("Failed to read VictoriaLogs response: {}", e)))?
+    {
+        grouper.push_chunk(&chunk);
+    }
 
-    // Parse JSON Lines response
-    let mut streams_map: HashMap<String, VLogsStream> = HashMap::new();
-    let mut total_entries = 0;
+    let (streams, total_entries) = grouper.finish();
 
-    for line in text.lines() {
-        if line.is_empty() {
-            continue;
-        }
+    Ok(Json(VLogsQueryResponse {
+        streams,
+        total_entries,
+    }))
+}
 
-        if let Ok(log_entry) = serde_json::from_str::<serde_json::Value>(line) {
-            let namespace = log_entry
-                .get("namespace")
-                .and_then(|v| v.as_str())
-                .unwrap_or("unknown")
-                .to_string();
-            let pod = log_entry
-                .get("pod")
-                .and_then(|v| v.as_str())
-                .unwrap_or("unknown")
-                .to_string();
-            let container = log_entry
-                .get("container")
-                .and_then(|v| v.as_str())
-                .unwrap_or("unknown")
-                .to_string();
-
-            let stream_key = format!("{}/{}/{}", namespace, pod, container);
-
-            let timestamp = log_entry
-                .get("_time")
-                .and_then(|v| v.as_str())
-                .unwrap_or("")
-                .to_string();
-
-            let raw_msg = log_entry.get("_msg").and_then(|v| v.as_str()).unwrap_or("");
-
-            // Parse the log message - handle different formats:
-            // 1. key_value format: log="actual message"
-            // 2. JSON format: {"log": "actual message"}
-            // 3. Plain text
-            let log_line = if let Some(content) = raw_msg.strip_prefix("log=") {
-                // key_value format: log="message" or log=message
-                if content.starts_with('"') && content.ends_with('"') && content.len() > 1 {
-                    content[1..content.len() - 1].to_string()
-                } else {
-                    content.to_string()
-                }
-            } else if raw_msg.starts_with('{') {
-                // JSON format: try to extract "log" field
-                if let Ok(json) = serde_json::from_str::<serde_json::Value>(raw_msg) {
-                    json.get("log")
-                        .and_then(|v| v.as_str())
-                        .unwrap_or(raw_msg)
-                        .to_string()
-                } else {
-                    raw_msg.to_string()
-                }
-            } else {
-                raw_msg.to_string()
-            };
+/// One VictoriaLogs JSON Lines record, borrowing from the response body
+/// wherever the value needs no unescaping
+#[derive(Deserialize)]
+struct VLogsRecord<'a> {
+    #[serde(borrow, default)]
+    namespace: Option<Cow<'a, str>>,
+    #[serde(borrow, default)]
+    pod: Option<Cow<'a, str>>,
+    #[serde(borrow, default)]
+    container: Option<Cow<'a, str>>,
+    #[serde(rename = "_time", borrow, default)]
+    time: Option<Cow<'a, str>>,
+    #[serde(rename = "_msg", borrow, default)]
+    msg: Option<Cow<'a, str>>,
+    #[serde(borrow, default)]
+    level: Option<Cow<'a, str>>,
+}
 
-            // Extract level from the log entry
-            let level = log_entry
-                .get("level")
-                .and_then(|v| v.as_str())
-                .map(|s| s.to_uppercase());
+/// JSON-formatted container log message, e.g. `{"log": "actual message"}`
+#[derive(Deserialize)]
+struct JsonLogMessage<'a> {
+    #[serde(borrow)]
+    log: Option<Cow<'a, str>>,
+}
 
-            let stream = streams_map.entry(stream_key).or_insert_with(|| {
-                let mut labels = HashMap::new();
-                labels.insert("namespace".to_string(), namespace);
-                labels.insert("pod".to_string(), pod);
-                labels.insert("container".to_string(), container);
-                VLogsStream {
-                    labels,
-                    entries: Vec::new(),
-                }
-            });
+/// Groups a VictoriaLogs JSON Lines body into per-container streams, one
+/// chunk at a time.
+///
+/// Records are decoded into borrowed structs rather than `serde_json::Value`,
+/// and label strings are only allocated once per stream, not once per line.
+#[derive(Default)]
+struct VLogsStreamGrouper {
+    /// Start of a line that continues in the next chunk
+    pending: Vec<u8>,
+    /// Index into `streams`, keyed by `namespace\0pod\0container`
+    index: HashMap<String, usize>,
+    /// Reused buffer for building lookup keys
+    key_buf: String,
+    streams: Vec<VLogsStream>,
+    total_entries: i32,
+}
 
-            stream.entries.push(VLogsEntry {
-                timestamp,
-                line: log_line,
-                level,
-            });
-            total_entries += 1;
+impl VLogsStreamGrouper {
+    /// Consume a chunk of the body, processing every line it completes
+    fn push_chunk(&mut self, chunk: &[u8]) {
+        let mut rest = chunk;
+        while let Some(pos) = rest.iter().position(|&b| b == b'\n') {
+            let (line, tail) = rest.split_at(pos);
+            rest = &tail[1..];
+
+            if self.pending.is_empty() {
+                self.push_line(line);
+            } else {
+                let mut joined = std::mem::take(&mut self.pending);
+                joined.extend_from_slice(line);
+                self.push_line(&joined);
+                joined.clear();
+                self.pending = joined;
+            }
         }
+        self.pending.extend_from_slice(rest);
     }
 
-    let streams: Vec<VLogsStream> = streams_map.into_values().collect();
+    /// Process any trailing unterminated line and return the streams, in the
+    /// order they were first seen, with the total entry count
+    fn finish(mut self) -> (Vec<VLogsStream>, i32) {
+        let pending = std::mem::take(&mut self.pending);
+        self.push_line(&pending);
+        (self.streams, self.total_entries)
+    }
 
-    Ok(Json(VLogsQueryResponse {
-        streams,
-        total_entries,
-    }))
+    fn push_line(&mut self, line: &[u8]) {
+        let line = line.strip_suffix(b"\r").unwrap_or(line);
+        if line.is_empty() {
+            return;
+        }
+
+        let Ok(record) = serde_json::from_slice::<VLogsRecord>(line) else {
+            return;
+        };
+
+        let namespace = record.namespace.as_deref().unwrap_or("unknown");
+        let pod = record.pod.as_deref().unwrap_or("unknown");
+        let container = record.container.as_deref().unwrap_or("unknown");
+
+        let timestamp = record.time.as_deref().unwrap_or_default().to_string();
+        let raw_msg = record.msg.as_deref().unwrap_or("");
+
+        // Parse the log message - handle different formats:
+        // 1. key_value format: log="actual message"
+        // 2. JSON format: {"log": "actual message"}
+        // 3. Plain text
+        let log_line = if let Some(content) = raw_msg.strip_prefix("log=") {
+            // key_value format: log="message" or log=message
+            if content.starts_with('"') && content.ends_with('"') && content.len() > 1 {
+                content[1..content.len() - 1].to_string()
+            } else {
+                content.to_string()
+            }
+        } else if raw_msg.starts_with('{') {
+            // JSON format: try to extract "log" field
+            serde_json::from_str::<JsonLogMessage>(raw_msg)
+                .ok()
+                .and_then(|json| json.log)
+                .map(Cow::into_owned)
+                .unwrap_or_else(|| raw_msg.to_string())
+        } else {
+            raw_msg.to_string()
+        };
+
+        let level = record.level.map(|s| s.to_uppercase());
+
+        self.key_buf.clear();
+        self.key_buf.push_str(namespace);
+        self.key_buf.push('\0');
+        self.key_buf.push_str(pod);
+        self.key_buf.push('\0');
+        self.key_buf.push_str(container);
+
+        let idx = match self.index.get(self.key_buf.as_str()) {
+            Some(&idx) => idx,
+            None => {
+                let mut labels = HashMap::new();
+                labels.insert("namespace".to_string(), namespace.to_string());
+                labels.insert("pod".to_string(), pod.to_string());
+                labels.insert("container".to_string(), container.to_string());
+                self.streams.push(VLogsStream {
+                    labels,
+                    entries: Vec::new(),
+                });
+                self.index
+                    .insert(self.key_buf.clone(), self.streams.len() - 1);
+                self.streams.len() - 1
+            }
+        };
+
+        self.streams[idx].entries.push(VLogsEntry {
+            timestamp,
+            line: log_line,
+            level,
+        });
+        self.total_entries += 1;
+    }
 }
 
 /// Convert Loki LogQL query to VictoriaLogs LogsQL
@@ -602,3 +677,49 @@ fn convert_loki_to_logsql(query: &str) -> String {
     // Return as-is for other queries (might already be LogsQL)
     query.to_string()
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_vlogs_grouper_groups_streams_across_chunks() {
+        let text = concat!(
+            r#"{"_time":"2024-01-01T00:00:00Z","_msg":"log=\"hello\"","namespace":"a","pod":"p","container":"c","level":"info"}"#,
+            "\n",
+            r#"{"_time":"2024-01-01T00:00:01Z","_msg":"{\"log\":\"from \\\"json\\\"\"}","namespace":"a","pod":"p","container":"c"}"#,
+            "\n\nnot json\n",
+            r#"{"_time":"2024-01-01T00:00:02Z","_msg":"plain"}"#,
+            "\n",
+        );
+
+        // Feed the body in small chunks so records straddle chunk boundaries
+        let mut grouper = VLogsStreamGrouper::default();
+        for chunk in text.as_bytes().chunks(7) {
+            grouper.push_chunk(chunk);
+        }
+        let (streams, total) = grouper.finish();
+        assert_eq!(total, 3);
+        assert_eq!(streams.len(), 2);
+
+        let app = streams
+            .iter()
+            .find(|s| s.labels["namespace"] == "a")
+            .unwrap();
+        assert_eq!(app.labels["pod"], "p");
+        assert_eq!(app.labels["container"], "c");
+        assert_eq!(app.entries.len(), 2);
+        assert_eq!(app.entries[0].line, "hello");
+        assert_eq!(app.entries[0].level.as_deref(), Some("INFO"));
+        assert_eq!(app.entries[1].line, r#"from "json""#);
+        assert_eq!(app.entries[1].level, None);
+
+        let unknown = streams
+            .iter()
+            .find(|s| s.labels["namespace"] == "unknown")
+            .unwrap();
+        assert_eq!(unknown.labels["pod"], "unknown");
+        assert_eq!(unknown.entries[0].line, "plain");
+        assert_eq!(unknown.entries[0].timestamp, "2024-01-01T00:00:02Z");
+    }
+}
@@ -17,11 +17,23 @@ pub mod storage;
 pub mod users;
 pub mod vpn;
 
-use axum::{extract::State, middleware as axum_middleware, response::Html, Router};
+use axum::{
+    extract::State,
+    http::header,
+    middleware as axum_middleware,
+    response::{Html, IntoResponse, Response},
+    Router,
+};
+use once_cell::sync::Lazy;
 use sea_orm::{ColumnTrait, EntityTrait, JoinType, QueryFilter, QuerySelect, RelationTrait};
+use tower_http::compression::{
+    predicate::{NotForContentType, Predicate, SizeAbove},
+    CompressionLayer, DefaultPredicate,
+};
 use utoipa::OpenApi;
 
 use crate::config::CONFIG;
+use crate::error::AppError;
 use crate::middleware::require_auth;
 use crate::models::prelude::*;
 use crate::models::{role, user_role};
@@ -102,6 +114,7 @@ use crate::state::AppState;
         apps::check_app_health,
         apps::check_app_exists,
         apps::get_app_status,
+        apps::get_all_app_statuses,
         apps::sync_charts,
         apps::log_app_access,
         // Monitoring
@@ -218,6 +231,9 @@ pub fn create_router(state: AppState) -> Router {
             axum::routing::get(health_check_detailed),
         )
         .route("/api/system/version", axum::routing::get(get_version))
+        // Unknown /api/* paths answer 404 here instead of falling through to the
+        // frontend proxy, which would probe the frontend and then fetch index.html
+        .route("/api/{*path}", axum::routing::any(api_not_found))
         .with_state(state.clone());
 
     // Public routes (no auth required) - these already have state applied internally
@@ -243,34 +259,52 @@ pub fn create_router(state: AppState) -> Router {
         .route("/api/openapi.json", axum::routing::get(openapi_json))
         .route("/api/docs", axum::routing::get(swagger_ui));
 
-    // Merge all routes, with frontend proxy as fallback
-    // The frontend fallback handles app proxying (e.g., /qbittorrent/) for authenticated users
-    health_routes
+    // Gzip API responses; the frontend fallback is left out since it serves
+    // precompressed assets and proxies apps that negotiate their own encoding
+    let backend_routes = health_routes
         .merge(public_routes)
         .merge(openapi_routes)
         .merge(protected_api_routes)
-        .merge(fallback_router)
+        .layer(api_compression());
+
+    // Merge all routes, with frontend proxy as fallback
+    // The frontend fallback handles app proxying (e.g., /qbittorrent/) for authenticated users
+    backend_routes.merge(fallback_router)
 }
 
+/// Compression for API responses over 1 KiB, skipping file downloads
+fn api_compression() -> CompressionLayer<impl Predicate> {
+    CompressionLayer::new().compress_when(
+        DefaultPredicate::new()
+            .and(SizeAbove::new(1024))
+            .and(NotForContentType::const_new("application/octet-stream")),
+    )
+}
+
+/// Sub-routers nested under /api/*, as (prefix, builder) pairs
+const API_ROUTES: &[(&str, fn(AppState) -> Router)] = &[
+    ("/users", users::users_routes),
+    ("/roles", roles::roles_routes),
+    ("/settings", settings::settings_routes),
+    ("/monitoring", monitoring::monitoring_routes),
+    ("/networking", networking::networking_routes),
+    ("/apps", apps::apps_routes),
+    ("/storage", storage::storage_routes),
+    ("/logs", logs::logs_routes),
+    ("/audit", audit::audit_routes),
+    ("/notifications", notifications::notifications_routes),
+    ("/oauth", oauth::oauth_routes),
+    ("/vpn", vpn::vpn_routes),
+    ("/cloudflare", cloudflare::cloudflare_routes),
+];
+
 /// API routes under /api/* (protected by auth middleware)
 fn api_routes(state: AppState) -> Router {
-    Router::new()
-        .nest("/users", users::users_routes(state.clone()))
-        .nest("/roles", roles::roles_routes(state.clone()))
-        .nest("/settings", settings::settings_routes(state.clone()))
-        .nest("/monitoring", monitoring::monitoring_routes(state.clone()))
-        .nest("/networking", networking::networking_routes(state.clone()))
-        .nest("/apps", apps::apps_routes(state.clone()))
-        .nest("/storage", storage::storage_routes(state.clone()))
-        .nest("/logs", logs::logs_routes(state.clone()))
-        .nest("/audit", audit::audit_routes(state.clone()))
-        .nest(
-            "/notifications",
-            notifications::notifications_routes(state.clone()),
-        )
-        .nest("/oauth", oauth::oauth_routes(state.clone()))
-        .nest("/vpn", vpn::vpn_routes(state.clone()))
-        .nest("/cloudflare", cloudflare::cloudflare_routes(state.clone()))
+    API_ROUTES
+        .iter()
+        .fold(Router::new(), |router, (prefix, routes)| {
+            router.nest(prefix, routes(state.clone()))
+        })
 }
 
 #[utoipa::path(get, path = "/api/health", tag = "Health", responses((status = 200, description = "OK")))]
@@ -299,9 +333,12 @@ async fn health_check_detailed(State(state): State<AppState>) -> axum::Json<serd
     }))
 }
 
-#[utoipa::path(get, path = "/api/system/version", tag = "Health", responses((status = 200, body = serde_json::Value)))]
-async fn get_version() -> axum::Json<serde_json::Value> {
-    axum::Json(serde_json::json!({
+/// Cache lifetime for documents that only change when the backend is upgraded
+const BUILD_DOC_CACHE_CONTROL: &str = "public, max-age=300";
+
+/// Version metadata is fixed for the life of the process, so serialize it once
+static VERSION_JSON: Lazy<axum::body::Bytes> = Lazy::new(|| {
+    serde_json::to_vec(&serde_json::json!({
         "version": CONFIG.version,
         "channel": CONFIG.channel,
         "commit_hash": CONFIG.commit_hash,
@@ -309,11 +346,46 @@ async fn get_version() -> axum::Json<serde_json::Value> {
         "rust_version": "1.83",
         "backend": "rust"
     }))
+    .map(axum::body::Bytes::from)
+    .unwrap_or_default()
+});
+
+#[utoipa::path(get, path = "/api/system/version", tag = "Health", responses((status = 200, body = serde_json::Value)))]
+async fn get_version() -> Response {
+    (
+        [
+            (header::CONTENT_TYPE, "application/json"),
+            (header::CACHE_CONTROL, BUILD_DOC_CACHE_CONTROL),
+        ],
+        VERSION_JSON.clone(),
+    )
+        .into_response()
 }
 
+/// OpenAPI spec, generated and serialized once on first request
+#[allow(clippy::expect_used)]
+static OPENAPI_JSON: Lazy<axum::body::Bytes> = Lazy::new(|| {
+    ApiDoc::openapi()
+        .to_json()
+        .map(axum::body::Bytes::from)
+        .expect("Failed to serialize OpenAPI spec")
+});
+
 /// Serve the OpenAPI JSON spec
-async fn openapi_json() -> axum::Json<utoipa::openapi::OpenApi> {
-    axum::Json(ApiDoc::openapi())
+async fn openapi_json() -> Response {
+    (
+        [
+            (header::CONTENT_TYPE, "application/json"),
+            (header::CACHE_CONTROL, BUILD_DOC_CACHE_CONTROL),
+        ],
+        OPENAPI_JSON.clone(),
+    )
+        .into_response()
+}
+
+/// 404 for unmatched /api/* paths
+async fn api_not_found() -> AppError {
+    AppError::NotFound("API endpoint not found".to_string())
 }
 
 /// Serve Swagger UI
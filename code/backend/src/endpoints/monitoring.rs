@@ -1,17 +1,151 @@
 use axum::{
+    body::Bytes,
     extract::{Path, Query, State},
+    http::header,
+    response::{IntoResponse, Response},
     routing::get,
     Json, Router,
 };
+use once_cell::sync::Lazy;
+use parking_lot::Mutex;
 use serde::{Deserialize, Serialize};
-
-use crate::error::Result;
+use std::collections::HashMap;
+use std::future::Future;
+use std::sync::Arc;
+use std::time::{Duration, Instant};
+use tokio::sync::{OnceCell, Semaphore};
+
+use crate::config::CONFIG;
+use crate::error::{AppError, Result};
 use crate::middleware::permissions::{Authorized, MonitoringView};
 use crate::services::k8s::{PodMetrics, PodStatus, ServiceEndpoint};
 use crate::state::AppState;
 
-/// VictoriaMetrics URL (inside cluster)
-const VICTORIAMETRICS_URL: &str = "http://victoriametrics.victoriametrics.svc.cluster.local:8428";
+/// Idle keep-alive connections kept per host; dashboards fire bursts of
+/// parallel queries, so this bounds sockets left open after a burst
+const VM_POOL_MAX_IDLE: usize = 20;
+
+/// Shared VictoriaMetrics client, so queries reuse pooled connections.
+/// Per-request timeouts are set at each call site.
+#[allow(clippy::expect_used)]
+static VM_CLIENT: Lazy<reqwest::Client> = Lazy::new(|| {
+    reqwest::Client::builder()
+        .connect_timeout(Duration::from_secs(3))
+        .pool_max_idle_per_host(VM_POOL_MAX_IDLE)
+        .pool_idle_timeout(Duration::from_secs(90))
+        .tcp_keepalive(Duration::from_secs(60))
+        // Range query payloads are repetitive JSON and compress ~10x
+        .gzip(true)
+        .build()
+        .expect("Failed to build VictoriaMetrics HTTP client")
+});
+
+/// How long Kubernetes-backed monitoring responses are shared between callers
+const MONITORING_CACHE_TTL: Duration = Duration::from_secs(2);
+
+/// Upper bound on cached monitoring responses; app names come from the path
+const MONITORING_CACHE_MAX_ENTRIES: usize = 1024;
+
+/// Recent monitoring responses by request key
+static MONITORING_RESPONSES: Lazy<SingleFlightCache<Bytes>> =
+    Lazy::new(|| SingleFlightCache::new(MONITORING_CACHE_MAX_ENTRIES));
+
+/// VictoriaMetrics endpoints, joined once from the configured base URL
+static VM_QUERY_URL: Lazy<String> =
+    Lazy::new(|| format!("{}/api/v1/query", CONFIG.kubernetes.victoriametrics_url));
+static VM_QUERY_RANGE_URL: Lazy<String> = Lazy::new(|| {
+    format!(
+        "{}/api/v1/query_range",
+        CONFIG.kubernetes.victoriametrics_url
+    )
+});
+static VM_HEALTH_URL: Lazy<String> =
+    Lazy::new(|| format!("{}/health", CONFIG.kubernetes.victoriametrics_url));
+
+/// Caps VictoriaMetrics queries in flight across all handlers. Dashboard
+/// fan-outs from several tabs would otherwise stack dozens of concurrent
+/// queries onto a small single-node instance and inflate its tail latency.
+static VM_QUERY_PERMITS: Lazy<Semaphore> =
+    Lazy::new(|| Semaphore::new(CONFIG.kubernetes.victoriametrics_max_concurrent_queries));
+
+/// How long instant query results are reused; well below the scrape interval,
+/// so dashboards never see meaningfully stale values
+const VM_INSTANT_CACHE_TTL: Duration = Duration::from_secs(5);
+
+/// Upper bound on how long a range query result is reused
+const VM_RANGE_CACHE_TTL: Duration = Duration::from_secs(30);
+
+/// Upper bound on cached VictoriaMetrics results; app names end up in queries
+const VM_QUERY_CACHE_MAX_ENTRIES: usize = 1024;
+
+/// Recent VictoriaMetrics results by query
+static VM_QUERY_CACHE: Lazy<SingleFlightCache<VmResult>> =
+    Lazy::new(|| SingleFlightCache::new(VM_QUERY_CACHE_MAX_ENTRIES));
+
+/// Short-lived results shared between callers, keyed by request. Each slot is
+/// filled once, so concurrent identical requests wait for the first instead of
+/// repeating it. Failures reach the callers already waiting but are not kept,
+/// so the next request retries.
+struct SingleFlightCache<V> {
+    #[allow(clippy::type_complexity)]
+    slots: Mutex<HashMap<String, (Instant, Arc<OnceCell<std::result::Result<V, String>>>)>>,
+    max_entries: usize,
+}
+
+impl<V: Clone> SingleFlightCache<V> {
+    fn new(max_entries: usize) -> Self {
+        Self {
+            slots: Mutex::new(HashMap::new()),
+            max_entries,
+        }
+    }
+
+    /// Return the value cached for `key`, running `fetch` to fill it for
+    /// `ttl` if there is no live entry.
+    async fn get_or_fetch<F, Fut>(
+        &self,
+        key: &str,
+        ttl: Duration,
+        fetch: F,
+    ) -> std::result::Result<V, String>
+    where
+        F: FnOnce() -> Fut,
+        Fut: Future<Output = std::result::Result<V, String>>,
+    {
+        let slot = {
+            let mut slots = self.slots.lock();
+            let now = Instant::now();
+            match slots.get(key) {
+                Some((expires_at, slot)) if now < *expires_at => slot.clone(),
+                _ => {
+                    if slots.len() >= self.max_entries {
+                        slots.retain(|_, (expires_at, _)| now < *expires_at);
+                        // Still full of live entries: start over rather than grow
+                        if slots.len() >= self.max_entries {
+                            slots.clear();
+                        }
+                    }
+                    let slot = Arc::new(OnceCell::new());
+                    slots.insert(key.to_string(), (now + ttl, slot.clone()));
+                    slot
+                }
+            }
+        };
+
+        let result = slot.get_or_init(fetch).await.clone();
+        if result.is_err() {
+            // Forget the failure, unless the slot has already been replaced
+            let mut slots = self.slots.lock();
+            if slots
+                .get(key)
+                .is_some_and(|(_, current)| Arc::ptr_eq(current, &slot))
+            {
+                slots.remove(key);
+            }
+        }
+        result
+    }
+}
 
 /// Create monitoring routes
 pub fn monitoring_routes(state: AppState) -> Router {
@@ -36,6 +170,36 @@ pub fn monitoring_routes(state: AppState) -> Router {
         .with_state(state)
 }
 
+/// Serve the JSON produced by `fetch`, sharing it with every request for the
+/// same `key` during the next [`MONITORING_CACHE_TTL`].
+///
+/// Dashboards poll these endpoints from several widgets and tabs at once;
+/// coalescing them turns N identical Kubernetes API round trips into one.
+async fn coalesced_json<T, F, Fut>(key: String, fetch: F) -> Result<Response>
+where
+    T: Serialize,
+    F: FnOnce() -> Fut,
+    Fut: Future<Output = T>,
+{
+    let body = MONITORING_RESPONSES
+        .get_or_fetch(&key, MONITORING_CACHE_TTL, || async {
+            serde_json::to_vec(&fetch().await)
+                .map(Bytes::from)
+                .map_err(|e| e.to_string())
+        })
+        .await
+        .map_err(|e| AppError::Internal(format!("Failed to serialize response: {}", e)))?;
+
+    Ok((
+        [
+            (header::CONTENT_TYPE, "application/json"),
+            (header::CACHE_CONTROL, "private, max-age=2"),
+        ],
+        body,
+    )
+        .into_response())
+}
+
 // ============================================================================
 // Request/Response Types
 // ============================================================================
@@ -149,61 +313,140 @@ pub struct ClusterMetricsHistory {
 // VictoriaMetrics Query Helpers
 // ============================================================================
 
-async fn query_vm(query: &str) -> Vec<serde_json::Value> {
-    let client = reqwest::Client::new();
-    let url = format!("{}/api/v1/query", VICTORIAMETRICS_URL);
+/// Per-namespace CPU, memory and network usage in a single query. Each
+/// aggregate is tagged with a `kind` label so the series stay distinct
+/// when combined with `or`.
+const APP_METRICS_QUERY: &str = concat!(
+    r#"label_replace(sum by (namespace) (rate(container_cpu_usage_seconds_total{container!="",container!="POD"}[5m])), "kind", "cpu", "", "")"#,
+    r#" or label_replace(sum by (namespace) (container_memory_working_set_bytes{container!="",container!="POD"}), "kind", "memory", "", "")"#,
+    r#" or label_replace(sum by (namespace) (rate(container_network_receive_bytes_total{interface!="lo"}[5m])), "kind", "network_rx", "", "")"#,
+    r#" or label_replace(sum by (namespace) (rate(container_network_transmit_bytes_total{interface!="lo"}[5m])), "kind", "network_tx", "", "")"#,
+);
+
+/// Envelope of a VictoriaMetrics query API response
+///
+/// Only the fields the handlers read are decoded; the result array is moved
+/// out as-is rather than built as a generic tree and cloned.
+#[derive(Deserialize)]
+struct VmResponse {
+    status: String,
+    #[serde(default)]
+    data: Option<VmResponseData>,
+}
 
-    match client
-        .get(&url)
-        .query(&[("query", query)])
-        .timeout(std::time::Duration::from_secs(10))
-        .send()
-        .await
-    {
-        Ok(resp) => {
-            if let Ok(data) = resp.json::<serde_json::Value>().await {
-                if data.get("status") == Some(&serde_json::json!("success")) {
-                    return data["data"]["result"]
-                        .as_array()
-                        .cloned()
-                        .unwrap_or_default();
-                }
-            }
-            Vec::new()
-        }
-        Err(_) => Vec::new(),
+#[derive(Deserialize)]
+struct VmResponseData {
+    #[serde(default)]
+    result: Vec<serde_json::Value>,
+}
+
+/// Extract the result series from a query API response body
+///
+/// Malformed and unsuccessful responses are errors, so they are not cached.
+fn parse_vm_result(body: &[u8]) -> std::result::Result<Vec<serde_json::Value>, String> {
+    let resp = serde_json::from_slice::<VmResponse>(body).map_err(|e| e.to_string())?;
+    if resp.status != "success" {
+        return Err(format!("query status {}", resp.status));
     }
+    Ok(resp.data.map(|d| d.result).unwrap_or_default())
 }
 
-async fn query_vm_range(query: &str, start: f64, end: f64, step: &str) -> Vec<serde_json::Value> {
-    let client = reqwest::Client::new();
-    let url = format!("{}/api/v1/query_range", VICTORIAMETRICS_URL);
+/// Shared result of a VictoriaMetrics query
+type VmResult = Arc<Vec<serde_json::Value>>;
+
+/// Serve a VictoriaMetrics query from [`VM_QUERY_CACHE`] for `ttl`, sending
+/// `request` upstream only when there is no live entry. A failed query yields
+/// no results and is retried by the next caller.
+async fn cached_vm_query(key: &str, ttl: Duration, request: reqwest::RequestBuilder) -> VmResult {
+    let result = VM_QUERY_CACHE
+        .get_or_fetch(key, ttl, || async {
+            // Only queries that actually go upstream wait for a permit. The
+            // semaphore is never closed, so acquire cannot fail; if it somehow
+            // did, running unthrottled beats failing the dashboard.
+            let _permit = VM_QUERY_PERMITS.acquire().await.ok();
+            let resp = request.send().await.map_err(|e| e.to_string())?;
+            let body = resp.bytes().await.map_err(|e| e.to_string())?;
+            parse_vm_result(&body).map(Arc::new)
+        })
+        .await;
+
+    result.unwrap_or_else(|e| {
+        tracing::debug!("VictoriaMetrics query failed: {}", e);
+        VmResult::default()
+    })
+}
+
+async fn query_vm(query: &str) -> VmResult {
+    // Sent as a form body: the combined app metrics query alone is several
+    // hundred characters, and URLs that long risk hitting length limits
+    let request = VM_CLIENT
+        .post(VM_QUERY_URL.as_str())
+        .form(&[("query", query)])
+        .timeout(std::time::Duration::from_secs(10));
+    cached_vm_query(query, VM_INSTANT_CACHE_TTL, request).await
+}
 
-    match client
-        .get(&url)
-        .query(&[
+async fn query_vm_range(query: &str, start: f64, end: f64, step: &str) -> VmResult {
+    // Snap the window to the step grid so dashboards asking for "the last
+    // hour" within the same step share one cached result
+    let step_secs = step
+        .strip_suffix('s')
+        .and_then(|s| s.parse::<f64>().ok())
+        .filter(|s| *s > 0.0);
+    let (start, end) = match step_secs {
+        Some(step_secs) => (
+            (start / step_secs).floor() * step_secs,
+            (end / step_secs).floor() * step_secs,
+        ),
+        None => (start, end),
+    };
+    let ttl = step_secs
+        .map(Duration::from_secs_f64)
+        .map_or(VM_INSTANT_CACHE_TTL, |step| step.min(VM_RANGE_CACHE_TTL));
+    // Format the window once; the same strings key the cache and go upstream
+    let (start, end) = (start.to_string(), end.to_string());
+    let key = format!("{}\n{}\n{}\n{}", query, start, end, step);
+
+    let request = VM_CLIENT
+        .post(VM_QUERY_RANGE_URL.as_str())
+        .form(&[
             ("query", query),
-            ("start", &start.to_string()),
-            ("end", &end.to_string()),
+            ("start", start.as_str()),
+            ("end", end.as_str()),
             ("step", step),
         ])
-        .timeout(std::time::Duration::from_secs(15))
-        .send()
-        .await
-    {
-        Ok(resp) => {
-            if let Ok(data) = resp.json::<serde_json::Value>().await {
-                if data.get("status") == Some(&serde_json::json!("success")) {
-                    return data["data"]["result"]
-                        .as_array()
-                        .cloned()
-                        .unwrap_or_default();
-                }
-            }
-            Vec::new()
-        }
-        Err(_) => Vec::new(),
-    }
+        .timeout(std::time::Duration::from_secs(15));
+    cached_vm_query(&key, ttl, request).await
+}
+
+/// Value of the first sample in an instant query result, or 0 if there is none
+fn first_scalar(results: &[serde_json::Value]) -> f64 {
+    results
+        .first()
+        .and_then(|r| r["value"][1].as_str())
+        .and_then(|v| v.parse::<f64>().ok())
+        .unwrap_or(0.0)
+}
+
+/// Points of the first series in a range query result
+fn first_series(results: &[serde_json::Value]) -> Vec<TimeSeriesPoint> {
+    let values = match results.first().and_then(|r| r["values"].as_array()) {
+        Some(values) => values,
+        None => return Vec::new(),
+    };
+
+    // Size for every sample up front; filter_map alone gives collect() no
+    // lower bound, so long windows would regrow the buffer repeatedly
+    let mut series = Vec::with_capacity(values.len());
+    series.extend(values.iter().filter_map(|v| {
+        let ts = v[0].as_f64()?;
+        let val: f64 = v[1].as_str()?.parse().ok()?;
+        Some(TimeSeriesPoint {
+            timestamp: ts,
+            value: val,
+        })
+    }));
+    series
 }
 
 // ============================================================================
@@ -224,7 +467,7 @@ async fn get_app_metrics(
     _auth: Authorized<MonitoringView>,
 ) -> Result<Json<Vec<AppMetrics>>> {
     // Get list of known app namespaces from catalog
-    let catalog = state.catalog.read().await;
+    let catalog = state.get_catalog().await;
     let mut allowed_namespaces: std::collections::HashSet<String> = catalog
         .get_all_apps()
         .iter()
@@ -238,118 +481,62 @@ async fn get_app_metrics(
     allowed_namespaces.insert("fluent-bit".to_string());
     allowed_namespaces.insert("grafana".to_string());
 
-    // Query CPU usage by namespace
-    let cpu_query = r#"sum by (namespace) (rate(container_cpu_usage_seconds_total{container!="",container!="POD"}[5m]))"#;
-    let cpu_results = query_vm(cpu_query).await;
+    let results = query_vm(APP_METRICS_QUERY).await;
 
-    // Query memory usage by namespace
-    let memory_query = r#"sum by (namespace) (container_memory_working_set_bytes{container!="",container!="POD"})"#;
-    let memory_results = query_vm(memory_query).await;
-
-    // Query network receive rate by namespace
-    let network_rx_query =
-        r#"sum by (namespace) (rate(container_network_receive_bytes_total{interface!="lo"}[5m]))"#;
-    let network_rx_results = query_vm(network_rx_query).await;
-
-    // Query network transmit rate by namespace
-    let network_tx_query =
-        r#"sum by (namespace) (rate(container_network_transmit_bytes_total{interface!="lo"}[5m]))"#;
-    let network_tx_results = query_vm(network_tx_query).await;
-
-    let mut metrics_map = std::collections::HashMap::new();
-
-    // Process CPU results
-    for result in &cpu_results {
-        if let Some(namespace) = result["metric"]["namespace"].as_str() {
-            // Only include namespaces in our allowed list
-            if !allowed_namespaces.contains(namespace) {
-                continue;
-            }
-            if let Some(value) = result["value"][1].as_str() {
-                let cpu_val: f64 = value.parse().unwrap_or(0.0);
-                metrics_map.insert(
-                    namespace.to_string(),
-                    AppMetrics {
-                        app_name: namespace.to_string(),
-                        namespace: namespace.to_string(),
-                        cpu_usage_cores: (cpu_val * 10000.0).round() / 10000.0,
-                        memory_usage_bytes: 0,
-                        memory_usage_mb: 0.0,
-                        cpu_usage_percent: None,
-                        memory_usage_percent: None,
-                        network_receive_bytes_per_sec: 0.0,
-                        network_transmit_bytes_per_sec: 0.0,
-                    },
-                );
-            }
-        }
+    // Collect per-namespace samples first; series come back in no particular order
+    #[derive(Default)]
+    struct Samples {
+        cpu: Option<f64>,
+        memory: Option<f64>,
+        network_rx: f64,
+        network_tx: f64,
     }
 
-    // Process memory results
-    for result in &memory_results {
-        if let Some(namespace) = result["metric"]["namespace"].as_str() {
+    let mut samples: std::collections::HashMap<&str, Samples> = std::collections::HashMap::new();
+    for result in results.iter() {
+        if let (Some(namespace), Some(kind), Some(value)) = (
+            result["metric"]["namespace"].as_str(),
+            result["metric"]["kind"].as_str(),
+            result["value"][1].as_str(),
+        ) {
             // Only include namespaces in our allowed list
             if !allowed_namespaces.contains(namespace) {
                 continue;
             }
-            if let Some(value) = result["value"][1].as_str() {
-                let mem_val: i64 = value.parse::<f64>().unwrap_or(0.0) as i64;
-                if let Some(metrics) = metrics_map.get_mut(namespace) {
-                    metrics.memory_usage_bytes = mem_val;
-                    metrics.memory_usage_mb =
-                        (mem_val as f64 / (1024.0 * 1024.0) * 100.0).round() / 100.0;
-                } else {
-                    metrics_map.insert(
-                        namespace.to_string(),
-                        AppMetrics {
-                            app_name: namespace.to_string(),
-                            namespace: namespace.to_string(),
-                            cpu_usage_cores: 0.0,
-                            memory_usage_bytes: mem_val,
-                            memory_usage_mb: (mem_val as f64 / (1024.0 * 1024.0) * 100.0).round()
-                                / 100.0,
-                            cpu_usage_percent: None,
-                            memory_usage_percent: None,
-                            network_receive_bytes_per_sec: 0.0,
-                            network_transmit_bytes_per_sec: 0.0,
-                        },
-                    );
-                }
-            }
-        }
-    }
-
-    // Process network receive results
-    for result in &network_rx_results {
-        if let Some(namespace) = result["metric"]["namespace"].as_str() {
-            if !allowed_namespaces.contains(namespace) {
-                continue;
-            }
-            if let Some(value) = result["value"][1].as_str() {
-                let rx_val: f64 = value.parse().unwrap_or(0.0);
-                if let Some(metrics) = metrics_map.get_mut(namespace) {
-                    metrics.network_receive_bytes_per_sec = (rx_val * 100.0).round() / 100.0;
-                }
+            let value: f64 = value.parse().unwrap_or(0.0);
+            let entry = samples.entry(namespace).or_default();
+            match kind {
+                "cpu" => entry.cpu = Some(value),
+                "memory" => entry.memory = Some(value),
+                "network_rx" => entry.network_rx = value,
+                "network_tx" => entry.network_tx = value,
+                _ => {}
             }
         }
     }
 
-    // Process network transmit results
-    for result in &network_tx_results {
-        if let Some(namespace) = result["metric"]["namespace"].as_str() {
-            if !allowed_namespaces.contains(namespace) {
-                continue;
-            }
-            if let Some(value) = result["value"][1].as_str() {
-                let tx_val: f64 = value.parse().unwrap_or(0.0);
-                if let Some(metrics) = metrics_map.get_mut(namespace) {
-                    metrics.network_transmit_bytes_per_sec = (tx_val * 100.0).round() / 100.0;
-                }
+    // Namespaces are listed when they report CPU or memory usage; network
+    // rates alone do not make an app
+    let metrics: Vec<AppMetrics> = samples
+        .into_iter()
+        .filter(|(_, s)| s.cpu.is_some() || s.memory.is_some())
+        .map(|(namespace, s)| {
+            let mem_val = s.memory.unwrap_or(0.0) as i64;
+            AppMetrics {
+                app_name: namespace.to_string(),
+                namespace: namespace.to_string(),
+                cpu_usage_cores: (s.cpu.unwrap_or(0.0) * 10000.0).round() / 10000.0,
+                memory_usage_bytes: mem_val,
+                memory_usage_mb: (mem_val as f64 / (1024.0 * 1024.0) * 100.0).round() / 100.0,
+                cpu_usage_percent: None,
+                memory_usage_percent: None,
+                network_receive_bytes_per_sec: (s.network_rx * 100.0).round() / 100.0,
+                network_transmit_bytes_per_sec: (s.network_tx * 100.0).round() / 100.0,
             }
-        }
-    }
+        })
+        .collect();
 
-    Ok(Json(metrics_map.into_values().collect()))
+    Ok(Json(metrics))
 }
 
 /// Get overall cluster resource metrics from VictoriaMetrics
@@ -362,91 +549,55 @@ async fn get_app_metrics(
     )
 )]
 async fn get_cluster_metrics(_auth: Authorized<MonitoringView>) -> Result<Json<ClusterMetrics>> {
-    // Total CPU cores
-    let total_cpu = query_vm("sum(machine_cpu_cores)")
-        .await
-        .first()
-        .and_then(|r| r["value"][1].as_str())
-        .and_then(|v| v.parse::<f64>().ok())
-        .unwrap_or(0.0);
-
-    // Total memory
-    let total_memory = query_vm("sum(machine_memory_bytes)")
-        .await
-        .first()
-        .and_then(|r| r["value"][1].as_str())
-        .and_then(|v| v.parse::<f64>().ok())
-        .unwrap_or(0.0) as i64;
-
-    // Used CPU
-    let used_cpu = query_vm(
-        r#"sum(rate(container_cpu_usage_seconds_total{container!="",container!="POD"}[5m]))"#,
-    )
-    .await
-    .first()
-    .and_then(|r| r["value"][1].as_str())
-    .and_then(|v| v.parse::<f64>().ok())
-    .unwrap_or(0.0);
-
-    // Used memory
-    let used_memory =
-        query_vm(r#"sum(container_memory_working_set_bytes{container!="",container!="POD"})"#)
-            .await
-            .first()
-            .and_then(|r| r["value"][1].as_str())
-            .and_then(|v| v.parse::<f64>().ok())
-            .unwrap_or(0.0) as i64;
-
-    // Container count
-    let container_count = query_vm(r#"count(container_last_seen{container!="",container!="POD"})"#)
-        .await
-        .first()
-        .and_then(|r| r["value"][1].as_str())
-        .and_then(|v| v.parse::<f64>().ok())
-        .unwrap_or(0.0) as i32;
-
-    // Pod count
-    let pod_count = query_vm(
-        r#"count(count by (pod, namespace) (container_last_seen{container!="",container!="POD"}))"#,
-    )
-    .await
-    .first()
-    .and_then(|r| r["value"][1].as_str())
-    .and_then(|v| v.parse::<f64>().ok())
-    .unwrap_or(0.0) as i32;
-
-    // Network receive rate
-    let network_rx =
-        query_vm(r#"sum(rate(container_network_receive_bytes_total{interface!="lo"}[5m]))"#)
-            .await
-            .first()
-            .and_then(|r| r["value"][1].as_str())
-            .and_then(|v| v.parse::<f64>().ok())
-            .unwrap_or(0.0);
-
-    // Network transmit rate
-    let network_tx =
-        query_vm(r#"sum(rate(container_network_transmit_bytes_total{interface!="lo"}[5m]))"#)
-            .await
-            .first()
-            .and_then(|r| r["value"][1].as_str())
-            .and_then(|v| v.parse::<f64>().ok())
-            .unwrap_or(0.0);
-
-    // Storage metrics
-    let total_storage = query_vm(r#"max(container_fs_limit_bytes{id="/",device=~"/dev/.*"})"#)
-        .await
-        .first()
-        .and_then(|r| r["value"][1].as_str())
-        .and_then(|v| v.parse::<f64>().ok())
-        .unwrap_or(0.0) as i64;
+    // The queries are independent, so issue them together rather than
+    // paying one VictoriaMetrics round trip per figure
+    let (
+        total_cpu,
+        total_memory,
+        used_cpu,
+        used_memory,
+        container_count,
+        pod_count,
+        network_rx,
+        network_tx,
+        total_storage,
+        used_storage,
+    ) = tokio::join!(
+        // Total CPU cores
+        query_vm("sum(machine_cpu_cores)"),
+        // Total memory
+        query_vm("sum(machine_memory_bytes)"),
+        // Used CPU
+        query_vm(
+            r#"sum(rate(container_cpu_usage_seconds_total{container!="",container!="POD"}[5m]))"#
+        ),
+        // Used memory
+        query_vm(r#"sum(container_memory_working_set_bytes{container!="",container!="POD"})"#),
+        // Container count
+        query_vm(r#"count(container_last_seen{container!="",container!="POD"})"#),
+        // Pod count
+        query_vm(
+            r#"count(count by (pod, namespace) (container_last_seen{container!="",container!="POD"}))"#
+        ),
+        // Network receive rate
+        query_vm(r#"sum(rate(container_network_receive_bytes_total{interface!="lo"}[5m]))"#),
+        // Network transmit rate
+        query_vm(r#"sum(rate(container_network_transmit_bytes_total{interface!="lo"}[5m]))"#),
+        // Storage metrics
+        query_vm(r#"max(container_fs_limit_bytes{id="/",device=~"/dev/.*"})"#),
+        query_vm(r#"max(container_fs_usage_bytes{id="/",device=~"/dev/.*"})"#),
+    );
 
-    let used_storage = query_vm(r#"max(container_fs_usage_bytes{id="/",device=~"/dev/.*"})"#)
-        .await
-        .first()
-        .and_then(|r| r["value"][1].as_str())
-        .and_then(|v| v.parse::<f64>().ok())
-        .unwrap_or(0.0) as i64;
+    let total_cpu = first_scalar(&total_cpu);
+    let total_memory = first_scalar(&total_memory) as i64;
+    let used_cpu = first_scalar(&used_cpu);
+    let used_memory = first_scalar(&used_memory) as i64;
+    let container_count = first_scalar(&container_count) as i32;
+    let pod_count = first_scalar(&pod_count) as i32;
+    let network_rx = first_scalar(&network_rx);
+    let network_tx = first_scalar(&network_tx);
+    let total_storage = first_scalar(&total_storage) as i64;
+    let used_storage = first_scalar(&used_storage) as i64;
 
     Ok(Json(ClusterMetrics {
         total_cpu_cores: (total_cpu * 100.0).round() / 100.0,
@@ -522,28 +673,8 @@ async fn get_cluster_network_history(
     let rx_results = query_vm_range(rx_query, start_time, end_time, step).await;
     let tx_results = query_vm_range(tx_query, start_time, end_time, step).await;
 
-    let parse_series = |results: Vec<serde_json::Value>| -> Vec<TimeSeriesPoint> {
-        results
-            .first()
-            .and_then(|r| r["values"].as_array())
-            .map(|values| {
-                values
-                    .iter()
-                    .filter_map(|v| {
-                        let ts = v[0].as_f64()?;
-                        let val: f64 = v[1].as_str()?.parse().ok()?;
-                        Some(TimeSeriesPoint {
-                            timestamp: ts,
-                            value: val,
-                        })
-                    })
-                    .collect()
-            })
-            .unwrap_or_default()
-    };
-
-    let rx_series = parse_series(rx_results);
-    let tx_series = parse_series(tx_results);
+    let rx_series = first_series(&rx_results);
+    let tx_series = first_series(&tx_results);
 
     // Combine RX+TX by matching timestamps
     let combined_series: Vec<TimeSeriesPoint> = rx_series
@@ -616,32 +747,20 @@ async fn get_cluster_metrics_history(
         query_vm_range(container_query, start_time, end_time, step),
     );
 
-    let parse_series = |results: Vec<serde_json::Value>| -> Vec<TimeSeriesPoint> {
-        results
-            .first()
-            .and_then(|r| r["values"].as_array())
-            .map(|values| {
-                values
-                    .iter()
-                    .filter_map(|v| {
-                        let ts = v[0].as_f64()?;
-                        let val: f64 = v[1].as_str()?.parse().ok()?;
-                        Some(TimeSeriesPoint {
-                            timestamp: ts,
-                            value: (val * 100.0).round() / 100.0,
-                        })
-                    })
-                    .collect()
-            })
-            .unwrap_or_default()
+    let parse_series = |results: &[serde_json::Value]| -> Vec<TimeSeriesPoint> {
+        let mut series = first_series(results);
+        for point in &mut series {
+            point.value = (point.value * 100.0).round() / 100.0;
+        }
+        series
     };
 
     Ok(Json(ClusterMetricsHistory {
-        cpu_series: parse_series(cpu_results),
-        memory_series: parse_series(memory_results),
-        storage_series: parse_series(storage_results),
-        pod_series: parse_series(pod_results),
-        container_series: parse_series(container_results),
+        cpu_series: parse_series(&cpu_results),
+        memory_series: parse_series(&memory_results),
+        storage_series: parse_series(&storage_results),
+        pod_series: parse_series(&pod_results),
+        container_series: parse_series(&container_results),
     }))
 }
 
@@ -711,106 +830,7 @@ async fn get_app_detail_metrics(
         app_name
     );
 
-    // Query historical CPU
-    let cpu_results = query_vm_range(&cpu_query, start_time, end_time, step).await;
-
-    let cpu_series: Vec<TimeSeriesPoint> = cpu_results
-        .first()
-        .and_then(|r| r["values"].as_array())
-        .map(|values| {
-            values
-                .iter()
-                .filter_map(|v| {
-                    let ts = v[0].as_f64()?;
-                    let val: f64 = v[1].as_str()?.parse().ok()?;
-                    Some(TimeSeriesPoint {
-                        timestamp: ts,
-                        value: val,
-                    })
-                })
-                .collect()
-        })
-        .unwrap_or_default();
-
-    // Query historical memory
-    let memory_results = query_vm_range(&memory_query, start_time, end_time, step).await;
-
-    let memory_series: Vec<TimeSeriesPoint> = memory_results
-        .first()
-        .and_then(|r| r["values"].as_array())
-        .map(|values| {
-            values
-                .iter()
-                .filter_map(|v| {
-                    let ts = v[0].as_f64()?;
-                    let val: f64 = v[1].as_str()?.parse().ok()?;
-                    Some(TimeSeriesPoint {
-                        timestamp: ts,
-                        value: val,
-                    })
-                })
-                .collect()
-        })
-        .unwrap_or_default();
-
-    // Query historical network receive
-    let network_rx_results = query_vm_range(&network_rx_query, start_time, end_time, step).await;
-
-    let network_rx_series: Vec<TimeSeriesPoint> = network_rx_results
-        .first()
-        .and_then(|r| r["values"].as_array())
-        .map(|values| {
-            values
-                .iter()
-                .filter_map(|v| {
-                    let ts = v[0].as_f64()?;
-                    let val: f64 = v[1].as_str()?.parse().ok()?;
-                    Some(TimeSeriesPoint {
-                        timestamp: ts,
-                        value: val,
-                    })
-                })
-                .collect()
-        })
-        .unwrap_or_default();
-
-    // Query historical network transmit
-    let network_tx_results = query_vm_range(&network_tx_query, start_time, end_time, step).await;
-
-    let network_tx_series: Vec<TimeSeriesPoint> = network_tx_results
-        .first()
-        .and_then(|r| r["values"].as_array())
-        .map(|values| {
-            values
-                .iter()
-                .filter_map(|v| {
-                    let ts = v[0].as_f64()?;
-                    let val: f64 = v[1].as_str()?.parse().ok()?;
-                    Some(TimeSeriesPoint {
-                        timestamp: ts,
-                        value: val,
-                    })
-                })
-                .collect()
-        })
-        .unwrap_or_default();
-
-    let current_cpu = cpu_series.last().map(|p| p.value).unwrap_or(0.0);
-    let current_memory = memory_series.last().map(|p| p.value as i64).unwrap_or(0);
-    let current_network_rx = network_rx_series.last().map(|p| p.value).unwrap_or(0.0);
-    let current_network_tx = network_tx_series.last().map(|p| p.value).unwrap_or(0.0);
-
-    // Get pod status
-    let mut pods = if let Some(client) = state.k8s_client.read().await.as_ref() {
-        client
-            .get_pod_status(&app_name, None)
-            .await
-            .unwrap_or_default()
-    } else {
-        Vec::new()
-    };
-
-    // Query per-pod CPU and memory metrics from VictoriaMetrics
+    // Per-pod CPU and memory metrics from VictoriaMetrics
     let pod_cpu_query = format!(
         r#"sum(rate(container_cpu_usage_seconds_total{{namespace="{}",container!="",container!="POD"}}[5m])) by (pod)"#,
         app_name
@@ -820,15 +840,51 @@ async fn get_app_detail_metrics(
         app_name
     );
 
-    let pod_cpu_results = query_vm(&pod_cpu_query).await;
-    let pod_memory_results = query_vm(&pod_memory_query).await;
+    // The histories, per-pod figures and pod status are independent; fetch
+    // them all at once so the handler waits for the slowest, not the sum
+    let (
+        cpu_results,
+        memory_results,
+        network_rx_results,
+        network_tx_results,
+        pod_cpu_results,
+        pod_memory_results,
+        mut pods,
+    ) = tokio::join!(
+        query_vm_range(&cpu_query, start_time, end_time, step),
+        query_vm_range(&memory_query, start_time, end_time, step),
+        query_vm_range(&network_rx_query, start_time, end_time, step),
+        query_vm_range(&network_tx_query, start_time, end_time, step),
+        query_vm(&pod_cpu_query),
+        query_vm(&pod_memory_query),
+        async {
+            if let Some(client) = state.k8s_client.read().await.as_ref() {
+                client
+                    .get_pod_status(&app_name, None)
+                    .await
+                    .unwrap_or_default()
+            } else {
+                Vec::new()
+            }
+        },
+    );
+
+    let cpu_series = first_series(&cpu_results);
+    let memory_series = first_series(&memory_results);
+    let network_rx_series = first_series(&network_rx_results);
+    let network_tx_series = first_series(&network_tx_results);
+
+    let current_cpu = cpu_series.last().map(|p| p.value).unwrap_or(0.0);
+    let current_memory = memory_series.last().map(|p| p.value as i64).unwrap_or(0);
+    let current_network_rx = network_rx_series.last().map(|p| p.value).unwrap_or(0.0);
+    let current_network_tx = network_tx_series.last().map(|p| p.value).unwrap_or(0.0);
 
     // Build maps of pod name -> metric value
     let mut pod_cpu_map: std::collections::HashMap<String, f64> = std::collections::HashMap::new();
     let mut pod_memory_map: std::collections::HashMap<String, i64> =
         std::collections::HashMap::new();
 
-    for result in &pod_cpu_results {
+    for result in pod_cpu_results.iter() {
         if let (Some(pod_name), Some(value_str)) = (
             result["metric"]["pod"].as_str(),
             result["value"]
@@ -842,7 +898,7 @@ async fn get_app_detail_metrics(
         }
     }
 
-    for result in &pod_memory_results {
+    for result in pod_memory_results.iter() {
         if let (Some(pod_name), Some(value_str)) = (
             result["metric"]["pod"].as_str(),
             result["value"]
@@ -892,12 +948,9 @@ async fn get_app_detail_metrics(
     )
 )]
 async fn check_vm_available(_auth: Authorized<MonitoringView>) -> Result<Json<serde_json::Value>> {
-    let client = reqwest::Client::new();
     // VictoriaMetrics uses /health endpoint for health checks
-    let url = format!("{}/health", VICTORIAMETRICS_URL);
-
-    let available = client
-        .get(&url)
+    let available = VM_CLIENT
+        .get(VM_HEALTH_URL.as_str())
         .timeout(std::time::Duration::from_secs(5))
         .send()
         .await
@@ -924,19 +977,22 @@ async fn get_pods(
     State(state): State<AppState>,
     Query(query): Query<PodQuery>,
     _auth: Authorized<MonitoringView>,
-) -> Result<Json<Vec<PodStatus>>> {
+) -> Result<Response> {
     let namespace = query.namespace.unwrap_or_else(|| "media".to_string());
-
-    let pods = if let Some(client) = state.k8s_client.read().await.as_ref() {
-        client
-            .get_pod_status(&namespace, query.app.as_deref())
-            .await
-            .unwrap_or_default()
-    } else {
-        Vec::new()
-    };
-
-    Ok(Json(pods))
+    let key = format!("pods:{}:{}", namespace, query.app.as_deref().unwrap_or(""));
+
+    coalesced_json(key, || async {
+        let pods: Vec<PodStatus> = if let Some(client) = state.k8s_client.read().await.as_ref() {
+            client
+                .get_pod_status(&namespace, query.app.as_deref())
+                .await
+                .unwrap_or_default()
+        } else {
+            Vec::new()
+        };
+        pods
+    })
+    .await
 }
 
 /// Get pod metrics
@@ -953,19 +1009,27 @@ async fn get_metrics(
     State(state): State<AppState>,
     Query(query): Query<PodQuery>,
     _auth: Authorized<MonitoringView>,
-) -> Result<Json<Vec<PodMetrics>>> {
+) -> Result<Response> {
     let namespace = query.namespace.unwrap_or_else(|| "media".to_string());
+    let key = format!(
+        "metrics:{}:{}",
+        namespace,
+        query.app.as_deref().unwrap_or("")
+    );
 
-    let metrics = if let Some(client) = state.k8s_client.read().await.as_ref() {
-        client
-            .get_pod_metrics(&namespace, query.app.as_deref())
-            .await
-            .unwrap_or_default()
-    } else {
-        Vec::new()
-    };
-
-    Ok(Json(metrics))
+    coalesced_json(key, || async {
+        let metrics: Vec<PodMetrics> = if let Some(client) = state.k8s_client.read().await.as_ref()
+        {
+            client
+                .get_pod_metrics(&namespace, query.app.as_deref())
+                .await
+                .unwrap_or_default()
+        } else {
+            Vec::new()
+        };
+        metrics
+    })
+    .await
 }
 
 /// Get app health
@@ -986,23 +1050,27 @@ async fn get_app_health(
     Path(app_name): Path<String>,
     Query(query): Query<PodQuery>,
     _auth: Authorized<MonitoringView>,
-) -> Result<Json<AppHealth>> {
+) -> Result<Response> {
     let namespace = query.namespace.unwrap_or_else(|| "media".to_string());
+    let key = format!("health:{}:{}", namespace, app_name);
 
+    coalesced_json(key, || build_app_health(&state, app_name, namespace)).await
+}
+
+/// Gather pods, metrics and endpoints for an app and summarize its health
+async fn build_app_health(state: &AppState, app_name: String, namespace: String) -> AppHealth {
     let (pods, metrics, endpoints) = if let Some(client) = state.k8s_client.read().await.as_ref() {
-        let pods = client
-            .get_pod_status(&namespace, Some(&app_name))
-            .await
-            .unwrap_or_default();
-        let metrics = client
-            .get_pod_metrics(&namespace, Some(&app_name))
-            .await
-            .ok();
-        let endpoints = client
-            .get_service_endpoints(&app_name, &namespace)
-            .await
-            .unwrap_or_default();
-        (pods, metrics, endpoints)
+        // The three lookups are independent, so issue them together
+        let (pods, metrics, endpoints) = tokio::join!(
+            client.get_pod_status(&namespace, Some(&app_name)),
+            client.get_pod_metrics(&namespace, Some(&app_name)),
+            client.get_service_endpoints(&app_name, &namespace),
+        );
+        (
+            pods.unwrap_or_default(),
+            metrics.ok(),
+            endpoints.unwrap_or_default(),
+        )
     } else {
         (Vec::new(), None, Vec::new())
     };
@@ -1031,15 +1099,15 @@ async fn get_app_health(
         }
     };
 
-    Ok(Json(AppHealth {
-        app_name: app_name.clone(),
+    AppHealth {
+        app_name,
         namespace,
         healthy,
         pods,
         metrics,
         endpoints,
         message,
-    }))
+    }
 }
 
 /// Get service endpoints
@@ -1060,19 +1128,23 @@ async fn get_endpoints(
     Path(app_name): Path<String>,
     Query(query): Query<PodQuery>,
     _auth: Authorized<MonitoringView>,
-) -> Result<Json<Vec<ServiceEndpoint>>> {
+) -> Result<Response> {
     let namespace = query.namespace.unwrap_or_else(|| "media".to_string());
-
-    let endpoints = if let Some(client) = state.k8s_client.read().await.as_ref() {
-        client
-            .get_service_endpoints(&app_name, &namespace)
-            .await
-            .unwrap_or_default()
-    } else {
-        Vec::new()
-    };
-
-    Ok(Json(endpoints))
+    let key = format!("endpoints:{}:{}", namespace, app_name);
+
+    coalesced_json(key, || async {
+        let endpoints: Vec<ServiceEndpoint> =
+            if let Some(client) = state.k8s_client.read().await.as_ref() {
+                client
+                    .get_service_endpoints(&app_name, &namespace)
+                    .await
+                    .unwrap_or_default()
+            } else {
+                Vec::new()
+            };
+        endpoints
+    })
+    .await
 }
 
 /// Check if metrics-server is available
@@ -1099,3 +1171,66 @@ async fn check_metrics_available(
         "message": if available { "Metrics server is available" } else { "Metrics server not found" }
     })))
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_parse_vm_result() {
+        let body = br#"{"status":"success","data":{"resultType":"vector","result":[{"metric":{"namespace":"a"},"value":[1700000000,"0.5"]}]},"stats":{"seriesFetched":"1"}}"#;
+        let results = parse_vm_result(body).unwrap();
+        assert_eq!(results.len(), 1);
+        assert_eq!(results[0]["metric"]["namespace"], "a");
+        assert_eq!(first_scalar(&results), 0.5);
+
+        assert!(parse_vm_result(br#"{"status":"error","error":"bad query"}"#).is_err());
+        assert!(parse_vm_result(b"not json").is_err());
+    }
+
+    #[tokio::test]
+    async fn test_single_flight_cache_reuses_result_within_ttl() {
+        let cache = SingleFlightCache::new(16);
+        let ttl = Duration::from_secs(60);
+
+        let first = cache
+            .get_or_fetch("key", ttl, || async { Ok(Arc::new(1)) })
+            .await
+            .unwrap();
+        let second = cache
+            .get_or_fetch("key", ttl, || async { Ok(Arc::new(2)) })
+            .await
+            .unwrap();
+
+        assert!(Arc::ptr_eq(&first, &second));
+        assert_eq!(*second, 1);
+    }
+
+    #[tokio::test]
+    async fn test_single_flight_cache_retries_after_failure() {
+        let cache = SingleFlightCache::new(16);
+        let ttl = Duration::from_secs(60);
+
+        let failed = cache
+            .get_or_fetch("key", ttl, || async { Err("timed out".to_string()) })
+            .await;
+        let retried = cache.get_or_fetch("key", ttl, || async { Ok(2) }).await;
+
+        assert!(failed.is_err());
+        assert_eq!(retried, Ok(2));
+    }
+
+    #[tokio::test]
+    async fn test_single_flight_cache_stays_bounded() {
+        let cache = SingleFlightCache::new(4);
+        let ttl = Duration::from_secs(60);
+
+        for i in 0..10 {
+            let _ = cache
+                .get_or_fetch(&i.to_string(), ttl, || async { Ok(i) })
+                .await;
+        }
+
+        assert!(cache.slots.lock().len() <= 4);
+    }
+}
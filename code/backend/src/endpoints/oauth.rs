@@ -6,6 +6,7 @@ use axum::{
     Json, Router,
 };
 use chrono::Utc;
+use once_cell::sync::Lazy;
 use sea_orm::{ActiveModelTrait, ColumnTrait, EntityTrait, ModelTrait, QueryFilter, Set};
 use serde::{Deserialize, Serialize};
 
@@ -14,9 +15,19 @@ use crate::error::{AppError, Result};
 use crate::middleware::permissions::{Authenticated, Authorized, SettingsManage, SettingsView};
 use crate::models::prelude::*;
 use crate::models::{oauth_account, oauth_provider, user};
-use crate::services::{create_access_token, generate_random_string, hash_password};
+use crate::services::{create_access_token, generate_random_string, hash_password_async};
 use crate::state::AppState;
 
+/// Shared client for provider token and userinfo requests, so logins reuse
+/// pooled TLS connections instead of handshaking every time
+#[allow(clippy::expect_used)]
+static OAUTH_HTTP_CLIENT: Lazy<reqwest::Client> = Lazy::new(|| {
+    reqwest::Client::builder()
+        .timeout(std::time::Duration::from_secs(30))
+        .build()
+        .expect("Failed to build OAuth HTTP client")
+});
+
 /// Create OAuth routes
 pub fn oauth_routes(state: AppState) -> Router {
     Router::new()
@@ -318,16 +329,20 @@ async fn oauth_login(
         CONFIG.auth.oauth2_issuer_url, provider
     );
 
-    let url = format!(
-        "{}?client_id={}&redirect_uri={}&response_type=code&scope={}&state={}",
+    // Encode the whole query in one pass straight into the URL buffer
+    let url = reqwest::Url::parse_with_params(
         auth_url,
-        urlencoding::encode(&client_id),
-        urlencoding::encode(&redirect_uri),
-        urlencoding::encode(scopes),
-        urlencoding::encode(&state_token),
-    );
+        [
+            ("client_id", client_id.as_str()),
+            ("redirect_uri", redirect_uri.as_str()),
+            ("response_type", "code"),
+            ("scope", scopes),
+            ("state", state_token.as_str()),
+        ],
+    )
+    .map_err(|e| AppError::Internal(format!("Invalid authorization URL: {}", e)))?;
 
-    Ok(Redirect::to(&url).into_response())
+    Ok(Redirect::to(url.as_str()).into_response())
 }
 
 /// OAuth callback handler
@@ -347,7 +362,6 @@ async fn oauth_callback(
     Path(provider): Path<String>,
     Query(query): Query<OAuthCallbackQuery>,
 ) -> Result<Response> {
-    let db = state.get_db().await?;
     // Check for errors
     if let Some(error) = query.error {
         let msg = query.error_description.unwrap_or(error);
@@ -356,6 +370,8 @@ async fn oauth_callback(
         );
     }
 
+    let db = state.get_db().await?;
+
     let code = query
         .code
         .ok_or_else(|| AppError::BadRequest("Missing authorization code".to_string()))?;
@@ -409,10 +425,8 @@ async fn oauth_callback(
         }
     };
 
-    let http_client = reqwest::Client::new();
-
     // Exchange code for token
-    let token_response = http_client
+    let token_response = OAUTH_HTTP_CLIENT
         .post(token_url)
         .form(&[
             ("client_id", client_id.as_str()),
@@ -441,7 +455,7 @@ async fn oauth_callback(
         .ok_or_else(|| AppError::Internal("No access token in response".to_string()))?;
 
     // Fetch user info
-    let userinfo_response = http_client
+    let userinfo_response = OAUTH_HTTP_CLIENT
         .get(userinfo_url)
         .header("Authorization", format!("Bearer {}", access_token))
         .send()
@@ -580,7 +594,7 @@ async fn oauth_callback(
 
             // Create user with random password (they'll use OAuth to login)
             let random_password = generate_random_string(32);
-            let password_hash = hash_password(&random_password)?;
+            let password_hash = hash_password_async(&random_password).await?;
 
             let now = Utc::now();
             let new_user = user::ActiveModel {
@@ -761,6 +775,12 @@ async fn link_account_start(
     }
 
     // Redirect to OAuth login with link parameter
-    let redirect_url = format!("/api/oauth/{}/login?link={}", provider, auth.user_id());
+    // The provider arrives percent-decoded, so encode it again before putting
+    // it back into a path segment
+    let redirect_url = format!(
+        "/api/oauth/{}/login?link={}",
+        urlencoding::encode(&provider),
+        auth.user_id()
+    );
     Ok(Redirect::to(&redirect_url).into_response())
 }
@@ -102,7 +102,10 @@ async fn check_app_permission(state: &AppState, user_id: i64, app_name: &str) ->
     let permissions = get_user_permissions(&db, user_id).await;
 
     // Check for app.* wildcard or specific app.{name} permission
-    permissions.contains(&"app.*".to_string()) || permissions.contains(&format!("app.{}", app_name))
+    permissions
+        .iter()
+        .filter_map(|p| p.strip_prefix("app."))
+        .any(|app| app == "*" || app == app_name)
 }
 
 /// Get the target URL for an app
@@ -110,6 +113,11 @@ async fn get_app_target_url(state: &AppState, app_name: &str, path: &str) -> Res
     // Check cache first
     let (base_url, _base_path) = if let Some(cached) = state.endpoint_cache.get(app_name).await {
         cached
+    } else if state.endpoint_cache.is_missing(app_name).await {
+        return Err(AppError::NotFound(format!(
+            "App {} not found or not ready",
+            app_name
+        )));
     } else {
         // Get K8s client
         let k8s_guard = state.k8s_client.read().await;
@@ -122,6 +130,7 @@ async fn get_app_target_url(state: &AppState, app_name: &str, path: &str) -> Res
         let endpoints = k8s.get_service_endpoints(app_name, app_name).await?;
 
         if endpoints.is_empty() {
+            state.endpoint_cache.set_missing(app_name).await;
             return Err(AppError::NotFound(format!(
                 "App {} not found or not ready",
                 app_name
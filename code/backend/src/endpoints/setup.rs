@@ -15,13 +15,13 @@ use sea_orm::{
 };
 use serde::{Deserialize, Serialize};
 use std::path::Path;
-use std::sync::Arc;
-use tokio::sync::RwLock;
 
+use crate::config::CONFIG;
 use crate::error::{AppError, Result};
 use crate::models::prelude::*;
 use crate::models::{role, system_setting, user, user_role};
-use crate::services::bootstrap::{self, BootstrapService, ComponentStatus};
+use crate::services::bootstrap::{self, ComponentStatus};
+use crate::services::security::{generate_random_string, hash_password_async};
 use crate::state::AppState;
 
 /// System/virtual directories to hide from the setup directory browser
@@ -185,13 +185,7 @@ async fn get_setup_status(State(state): State<AppState>) -> Result<Json<SetupSta
     }
 
     // Check bootstrap status
-    let bootstrap_service = BootstrapService::new(
-        state.db.clone(),
-        state.k8s_client.clone(),
-        state.catalog.clone(),
-        state.bootstrap_tx.clone(),
-    );
-    let bootstrap_complete = bootstrap_service.is_complete().await;
+    let bootstrap_complete = state.bootstrap.is_complete().await;
 
     // Check for server configuration (requires database)
     let server_configured = {
@@ -258,7 +252,7 @@ async fn initialize_setup(
     })?;
 
     // Hash the password
-    let hashed_password = crate::services::security::hash_password(&request.admin_password)?;
+    let hashed_password = hash_password_async(&request.admin_password).await?;
 
     // Create admin user
     let now = Utc::now();
@@ -362,7 +356,7 @@ async fn generate_credentials(
     Ok(Json(GeneratedCredentialsResponse {
         admin_username: "admin".to_string(),
         admin_email: "admin@example.com".to_string(),
-        admin_password: crate::services::security::generate_random_string(16),
+        admin_password: generate_random_string(16),
     }))
 }
 
@@ -493,7 +487,7 @@ async fn browse_setup_directory(
     // KUBARR_HOST_BROWSE_PREFIX maps the container mount point so we can translate
     // between host paths (what the user sees) and container paths (what we read).
     // When not set, we browse the container's own filesystem directly.
-    let host_prefix = std::env::var("KUBARR_HOST_BROWSE_PREFIX").unwrap_or_default();
+    let host_prefix = &CONFIG.server.host_browse_prefix;
 
     let requested = Path::new(&query.path);
     if !requested.is_absolute() {
@@ -641,16 +635,9 @@ async fn get_bootstrap_status(
     // Return 403 if setup is already complete
     require_setup(&state).await?;
 
-    let bootstrap_service = BootstrapService::new(
-        state.db.clone(),
-        state.k8s_client.clone(),
-        state.catalog.clone(),
-        state.bootstrap_tx.clone(),
-    );
-
-    let components = bootstrap_service.get_status().await?;
-    let complete = bootstrap_service.is_complete().await;
-    let started = bootstrap_service.has_started().await;
+    let components = state.bootstrap.get_status().await?;
+    let complete = state.bootstrap.is_complete().await;
+    let started = state.bootstrap.has_started().await;
 
     Ok(Json(BootstrapStatusResponse {
         components,
@@ -675,28 +662,17 @@ pub struct BootstrapStartResponse {
     )
 )]
 async fn start_bootstrap(State(state): State<AppState>) -> Result<Json<BootstrapStartResponse>> {
-    let bootstrap_service = Arc::new(RwLock::new(BootstrapService::new(
-        state.db.clone(),
-        state.k8s_client.clone(),
-        state.catalog.clone(),
-        state.bootstrap_tx.clone(),
-    )));
-
     // Check if already complete
-    {
-        let service = bootstrap_service.read().await;
-        if service.is_complete().await {
-            return Ok(Json(BootstrapStartResponse {
-                message: "Bootstrap already complete".to_string(),
-                started: false,
-            }));
-        }
+    if state.bootstrap.is_complete().await {
+        return Ok(Json(BootstrapStartResponse {
+            message: "Bootstrap already complete".to_string(),
+            started: false,
+        }));
     }
 
     // Start bootstrap in background task
-    let service_clone = bootstrap_service.clone();
+    let service = state.bootstrap.clone();
     tokio::spawn(async move {
-        let service = service_clone.read().await;
         if let Err(e) = service.start_bootstrap().await {
             tracing::error!("Bootstrap failed: {}", e);
         }
@@ -731,17 +707,10 @@ async fn retry_bootstrap_component(
     // Return 403 if setup is already complete
     require_setup(&state).await?;
 
-    let bootstrap_service = Arc::new(RwLock::new(BootstrapService::new(
-        state.db.clone(),
-        state.k8s_client.clone(),
-        state.catalog.clone(),
-        state.bootstrap_tx.clone(),
-    )));
-
     // Retry in background task
+    let service = state.bootstrap.clone();
     let component_clone = component.clone();
     tokio::spawn(async move {
-        let service = bootstrap_service.read().await;
         if let Err(e) = service.retry_component(&component_clone).await {
             tracing::error!("Retry failed for {}: {}", component_clone, e);
         }
@@ -769,25 +738,17 @@ async fn handle_bootstrap_socket(socket: WebSocket, state: AppState) {
     // Subscribe to the shared bootstrap broadcast channel
     let mut rx = state.bootstrap_tx.subscribe();
 
-    // Create a bootstrap service to get the initial status
-    let bootstrap_service = BootstrapService::new(
-        state.db.clone(),
-        state.k8s_client.clone(),
-        state.catalog.clone(),
-        state.bootstrap_tx.clone(),
-    );
-
     tracing::info!(
         "New WebSocket client connected for bootstrap updates, subscribers: {}",
         state.bootstrap_tx.receiver_count()
     );
 
     // Send initial status
-    if let Ok(components) = bootstrap_service.get_status().await {
+    if let Ok(components) = state.bootstrap.get_status().await {
         let initial_status = serde_json::json!({
             "type": "initial_status",
             "components": components,
-            "complete": bootstrap_service.is_complete().await,
+            "complete": state.bootstrap.is_complete().await,
         });
         if let Ok(json) = serde_json::to_string(&initial_status) {
             let _ = sender.send(Message::Text(json.into())).await;
@@ -5,7 +5,7 @@ use axum::{
 };
 use chrono::{Duration, Utc};
 use sea_orm::{
-    ActiveModelTrait, ColumnTrait, EntityTrait, ModelTrait, PaginatorTrait, QueryFilter,
+    ActiveModelTrait, ColumnTrait, Condition, EntityTrait, ModelTrait, PaginatorTrait, QueryFilter,
     QueryOrder, QuerySelect, Set,
 };
 use serde::{Deserialize, Serialize};
@@ -16,8 +16,8 @@ use crate::middleware::{Authenticated, Authorized, UsersManage, UsersResetPasswo
 use crate::models::prelude::*;
 use crate::models::{invite, role, two_factor_recovery_code, user, user_preferences, user_role};
 use crate::services::{
-    generate_recovery_codes, generate_totp_secret, get_totp_provisioning_uri, hash_password,
-    hash_recovery_code, verify_password, verify_totp,
+    generate_recovery_codes, generate_totp_secret, get_totp_provisioning_uri, hash_password_async,
+    hash_recovery_code, verify_password_async, verify_totp,
 };
 use crate::state::AppState;
 
@@ -197,29 +197,28 @@ pub struct InviteResponse {
 
 async fn get_user_with_roles(state: &AppState, user_id: i64) -> Result<UserResponse> {
     let db = state.get_db().await?;
-    let found_user = User::find_by_id(user_id)
-        .one(&db)
-        .await?
-        .ok_or_else(|| AppError::NotFound("User not found".to_string()))?;
 
-    // Get user's roles via the junction table
-    let roles: Vec<role::Model> = Role::find()
-        .inner_join(UserRole)
-        .filter(user_role::Column::UserId.eq(user_id))
-        .all(&db)
-        .await?;
+    // The user row, roles (via the junction table), preferences, permissions
+    // and allowed apps are independent lookups, so issue them concurrently
+    let (found_user, roles, preferences, permissions, allowed_apps) = tokio::join!(
+        User::find_by_id(user_id).one(&db),
+        Role::find()
+            .inner_join(UserRole)
+            .filter(user_role::Column::UserId.eq(user_id))
+            .all(&db),
+        UserPreferences::find_by_id(user_id).one(&db),
+        get_user_permissions(&db, user_id),
+        get_user_app_access(&db, user_id),
+    );
 
-    // Fetch user preferences (or use defaults)
-    let preferences = UserPreferences::find_by_id(user_id).one(&db).await?;
+    let found_user = found_user?.ok_or_else(|| AppError::NotFound("User not found".to_string()))?;
+    let roles: Vec<role::Model> = roles?;
 
-    let theme = preferences
+    // Fall back to default preferences
+    let theme = preferences?
         .map(|p| p.theme)
         .unwrap_or_else(|| "system".to_string());
 
-    // Get user's permissions and allowed apps
-    let permissions = get_user_permissions(&db, user_id).await;
-    let allowed_apps = get_user_app_access(&db, user_id).await;
-
     Ok(UserResponse {
         id: found_user.id,
         username: found_user.username.clone(),
@@ -403,7 +402,7 @@ async fn delete_own_account(
         .ok_or_else(|| AppError::NotFound("User not found".to_string()))?;
 
     // Verify password
-    if !verify_password(&data.password, &user_record.hashed_password) {
+    if !verify_password_async(&data.password, &user_record.hashed_password).await {
         return Err(AppError::BadRequest("Incorrect password".to_string()));
     }
 
@@ -573,27 +572,27 @@ async fn create_user(
     Json(data): Json<CreateUserRequest>,
 ) -> Result<Json<UserResponse>> {
     let db = state.get_db().await?;
-    // Check if username exists
-    let existing = User::find()
-        .filter(user::Column::Username.eq(&data.username))
-        .one(&db)
+    // Check username and email uniqueness in one query; at most one row can
+    // match each, so two rows are enough to tell the conflicts apart
+    let conflicts = User::find()
+        .filter(
+            Condition::any()
+                .add(user::Column::Username.eq(&data.username))
+                .add(user::Column::Email.eq(&data.email)),
+        )
+        .limit(2)
+        .all(&db)
         .await?;
 
-    if existing.is_some() {
+    if conflicts.iter().any(|u| u.username == data.username) {
         return Err(AppError::BadRequest("Username already exists".to_string()));
     }
 
-    // Check if email exists
-    let existing = User::find()
-        .filter(user::Column::Email.eq(&data.email))
-        .one(&db)
-        .await?;
-
-    if existing.is_some() {
+    if !conflicts.is_empty() {
         return Err(AppError::BadRequest("Email already exists".to_string()));
     }
 
-    let hashed = hash_password(&data.password)?;
+    let hashed = hash_password_async(&data.password).await?;
     let now = Utc::now();
 
     // Create user
@@ -868,12 +867,12 @@ async fn create_invite(
     use crate::services::generate_random_string;
 
     let code = generate_random_string(32);
+    let now = Utc::now();
     let expires_at = if data.expires_in_days > 0 {
-        Some(Utc::now() + Duration::days(data.expires_in_days as i64))
+        Some(now + Duration::days(data.expires_in_days as i64))
     } else {
         None
     };
-    let now = Utc::now();
 
     let new_invite = invite::ActiveModel {
         code: Set(code.clone()),
@@ -915,12 +914,11 @@ async fn delete_invite(
     _auth: Authorized<UsersManage>,
 ) -> Result<Json<serde_json::Value>> {
     let db = state.get_db().await?;
-    let existing_invite = Invite::find_by_id(invite_id)
-        .one(&db)
-        .await?
-        .ok_or_else(|| AppError::NotFound("Invite not found".to_string()))?;
-
-    existing_invite.delete(&db).await?;
+    // Delete directly instead of loading the row first
+    let deleted = Invite::delete_by_id(invite_id).exec(&db).await?;
+    if deleted.rows_affected == 0 {
+        return Err(AppError::NotFound("Invite not found".to_string()));
+    }
 
     Ok(Json(serde_json::json!({"message": "Invite deleted"})))
 }
@@ -959,14 +957,14 @@ async fn change_own_password(
         .ok_or_else(|| AppError::NotFound("User not found".to_string()))?;
 
     // Verify current password
-    if !verify_password(&data.current_password, &user_record.hashed_password) {
+    if !verify_password_async(&data.current_password, &user_record.hashed_password).await {
         return Err(AppError::BadRequest(
             "Current password is incorrect".to_string(),
         ));
     }
 
     // Hash and update password
-    let hashed = hash_password(&data.new_password)?;
+    let hashed = hash_password_async(&data.new_password).await?;
     let now = Utc::now();
 
     let mut user_model: user::ActiveModel = user_record.into();
@@ -1019,7 +1017,7 @@ async fn admin_reset_password(
         .ok_or_else(|| AppError::NotFound("User not found".to_string()))?;
 
     // Hash and update password
-    let hashed = hash_password(&data.new_password)?;
+    let hashed = hash_password_async(&data.new_password).await?;
     let now = Utc::now();
 
     let mut user_model: user::ActiveModel = user_record.into();
@@ -1152,18 +1150,28 @@ async fn enable_2fa(
         .exec(&db)
         .await?;
 
-    // Generate and store 8 recovery codes
+    // Generate and store 8 recovery codes, hashing them off the async runtime
     let plaintext_codes = generate_recovery_codes();
-    for code in &plaintext_codes {
-        let code_hash = hash_recovery_code(code)?;
-        let recovery_code_model = two_factor_recovery_code::ActiveModel {
+    let codes = plaintext_codes.clone();
+    let code_hashes = tokio::task::spawn_blocking(move || {
+        codes
+            .iter()
+            .map(|code| hash_recovery_code(code))
+            .collect::<Result<Vec<_>>>()
+    })
+    .await
+    .map_err(|e| AppError::Internal(format!("Recovery code hashing failed: {}", e)))??;
+
+    TwoFactorRecoveryCode::insert_many(code_hashes.into_iter().map(|code_hash| {
+        two_factor_recovery_code::ActiveModel {
             user_id: Set(user_id),
             code_hash: Set(code_hash),
             created_at: Set(now),
             ..Default::default()
-        };
-        recovery_code_model.insert(&db).await?;
-    }
+        }
+    }))
+    .exec(&db)
+    .await?;
 
     Ok(Json(TwoFactorEnableResponse {
         message: "Two-factor authentication enabled successfully".to_string(),
@@ -1201,7 +1209,7 @@ async fn disable_2fa(
     }
 
     // Verify password
-    if !verify_password(&data.password, &user_record.hashed_password) {
+    if !verify_password_async(&data.password, &user_record.hashed_password).await {
         return Err(AppError::BadRequest("Incorrect password".to_string()));
     }
 
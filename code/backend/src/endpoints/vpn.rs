@@ -9,7 +9,7 @@ use serde::Serialize;
 
 use crate::error::Result;
 use crate::middleware::permissions::{Authorized, VpnManage, VpnView};
-use crate::services::deployment::{DeploymentManager, DeploymentRequest};
+use crate::services::deployment::DeploymentRequest;
 use crate::services::vpn::{
     self, AppVpnConfigResponse, AssignVpnRequest, CreateVpnProviderRequest, SupportedProvider,
     UpdateVpnProviderRequest, VpnProviderResponse, VpnTestResult,
@@ -165,11 +165,8 @@ async fn delete_provider(
     _auth: Authorized<VpnManage>,
 ) -> Result<Json<serde_json::Value>> {
     let db = state.get_db().await?;
-    let k8s = state.k8s_client.read().await;
-    let client = k8s.as_ref().ok_or_else(|| {
-        crate::error::AppError::Internal("Kubernetes client not available".to_string())
-    })?;
-    vpn::delete_vpn_provider(&db, client, id).await?;
+    let client = state.get_k8s().await?;
+    vpn::delete_vpn_provider(&db, &client, id).await?;
     Ok(Json(serde_json::json!({ "success": true })))
 }
 
@@ -191,12 +188,9 @@ async fn test_provider(
     _auth: Authorized<VpnManage>,
 ) -> Result<Json<VpnTestResult>> {
     let db = state.get_db().await?;
-    let k8s = state.k8s_client.read().await;
-    let client = k8s.as_ref().ok_or_else(|| {
-        crate::error::AppError::Internal("Kubernetes client not available".to_string())
-    })?;
+    let client = state.get_k8s().await?;
 
-    let result = vpn::test_vpn_connection(client, &db, id).await?;
+    let result = vpn::test_vpn_connection(&client, &db, id).await?;
     Ok(Json(result))
 }
 
@@ -268,10 +262,8 @@ async fn assign_vpn(
     let config = vpn::assign_vpn_to_app(&db, &app_name, req).await?;
 
     // Trigger redeploy to apply VPN changes
-    let k8s = state.k8s_client.read().await;
-    if let Some(k8s_client) = k8s.as_ref() {
-        let catalog = state.catalog.read().await;
-        let deployment_manager = DeploymentManager::with_db(k8s_client, &catalog, &db);
+    if let Ok(deployment_manager) = state.deployment_manager().await {
+        let deployment_manager = deployment_manager.with_db(db);
         let deploy_request = DeploymentRequest {
             app_name: app_name.clone(),
             custom_config: std::collections::HashMap::new(),
@@ -307,17 +299,13 @@ async fn remove_vpn(
     _auth: Authorized<VpnManage>,
 ) -> Result<Json<serde_json::Value>> {
     let db = state.get_db().await?;
-    let k8s = state.k8s_client.read().await;
-    let client = k8s.as_ref().ok_or_else(|| {
-        crate::error::AppError::Internal("Kubernetes client not available".to_string())
-    })?;
+    let client = state.get_k8s().await?;
 
     // Remove VPN config from database
-    vpn::remove_vpn_from_app(&db, client, &app_name).await?;
+    vpn::remove_vpn_from_app(&db, &client, &app_name).await?;
 
     // Trigger redeploy to remove VPN sidecar
-    let catalog = state.catalog.read().await;
-    let deployment_manager = DeploymentManager::with_db(client, &catalog, &db);
+    let deployment_manager = state.deployment_manager().await?.with_db(db);
     let deploy_request = DeploymentRequest {
         app_name: app_name.clone(),
         custom_config: std::collections::HashMap::new(),
@@ -355,10 +343,7 @@ async fn get_forwarded_port(
     Path(app_name): Path<String>,
     _auth: Authorized<VpnView>,
 ) -> Result<Json<serde_json::Value>> {
-    let k8s = state.k8s_client.read().await;
-    let k8s_client = k8s.as_ref().ok_or_else(|| {
-        crate::error::AppError::Internal("Kubernetes client not available".to_string())
-    })?;
+    let k8s_client = state.get_k8s().await?;
 
     // Find pods in the app's namespace with the gluetun container
     let pods: kube::api::Api<k8s_openapi::api::core::v1::Pod> =
@@ -395,14 +380,11 @@ async fn get_forwarded_port(
 
     // Query Gluetun control API for forwarded port
     let url = format!("http://{}:8001/v1/openvpn/portforwarded", pod_ip);
-    let client = reqwest::Client::builder()
-        .timeout(std::time::Duration::from_secs(5))
-        .build()
-        .map_err(|e| {
-            crate::error::AppError::Internal(format!("Failed to create HTTP client: {}", e))
-        })?;
+    let request = vpn::GLUETUN_CLIENT
+        .get(&url)
+        .timeout(std::time::Duration::from_secs(5));
 
-    match client.get(&url).send().await {
+    match request.send().await {
         Ok(resp) => {
             let body: serde_json::Value = resp
                 .json()
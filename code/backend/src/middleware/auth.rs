@@ -10,8 +10,9 @@ use axum::{
     response::{IntoResponse, Response},
     Json,
 };
-use chrono::Utc;
+use chrono::{Duration, Utc};
 use sea_orm::{ActiveModelTrait, ColumnTrait, EntityTrait, QueryFilter, Set};
+use std::collections::HashSet;
 
 use crate::models::prelude::*;
 use crate::models::{role_app_permission, role_permission, session, user, user_role};
@@ -25,6 +26,9 @@ pub const ACTIVE_SESSION_COOKIE: &str = "kubarr_active";
 /// Maximum number of simultaneous sessions
 pub const MAX_SESSIONS: usize = 5;
 
+/// Minimum time between last_accessed_at writes for a session
+const LAST_ACCESSED_UPDATE_INTERVAL_SECS: i64 = 60;
+
 /// Legacy cookie name (for backwards compatibility)
 pub const SESSION_COOKIE_NAME: &str = "kubarr_session";
 
@@ -32,20 +36,26 @@ pub const SESSION_COOKIE_NAME: &str = "kubarr_session";
 #[derive(Clone, Debug)]
 pub struct AuthenticatedUser {
     pub user: user::Model,
-    pub permissions: Vec<String>,
+    /// Permission names, held as a set so each check is a single hash lookup
+    pub permissions: HashSet<String>,
 }
 
 impl AuthenticatedUser {
     /// Check if user has a specific permission
     pub fn has_permission(&self, permission: &str) -> bool {
-        self.permissions.contains(&permission.to_string())
+        self.permissions.contains(permission)
     }
 
     /// Check if user has access to a specific app
     pub fn has_app_access(&self, app_name: &str) -> bool {
-        // Check for app.* wildcard or specific app permission
-        self.permissions.contains(&"app.*".to_string())
-            || self.permissions.contains(&format!("app.{}", app_name))
+        // Check for app.* wildcard or specific app permission. Matching on the
+        // suffix avoids building an "app.{name}" key on every check; the set
+        // only holds a handful of entries.
+        self.permissions.contains("app.*")
+            || self
+                .permissions
+                .iter()
+                .any(|p| p.strip_prefix("app.") == Some(app_name))
     }
 }
 
@@ -137,7 +147,7 @@ fn extract_token(req: &Request) -> Option<String> {
 }
 
 /// Authenticate using session token (from cookie)
-/// Validates the signed JWT, looks up session in database, and updates last_accessed_at
+/// Validates the signed JWT, looks up session in database, and refreshes last_accessed_at
 async fn authenticate_session(state: &AppState, token: &str) -> Result<AuthenticatedUser, String> {
     // Decode and validate the session token
     let claims =
@@ -149,8 +159,9 @@ async fn authenticate_session(state: &AppState, token: &str) -> Result<Authentic
         .await
         .map_err(|_| "Database not available".to_string())?;
 
-    // Look up session in database
-    let session = Session::find_by_id(&claims.sid)
+    // Look up the session together with its user in a single query
+    let (session, user) = Session::find_by_id(&claims.sid)
+        .find_also_related(User)
         .one(&db)
         .await
         .map_err(|e| format!("Database error: {}", e))?
@@ -162,32 +173,31 @@ async fn authenticate_session(state: &AppState, token: &str) -> Result<Authentic
     }
 
     // Check if session is expired (double-check against DB value)
-    if session.expires_at < Utc::now() {
+    let now = Utc::now();
+    if session.expires_at < now {
         return Err("Session has expired".to_string());
     }
 
-    // Fetch user from database
-    let user = User::find_by_id(session.user_id)
-        .filter(user::Column::IsActive.eq(true))
-        .filter(user::Column::IsApproved.eq(true))
-        .one(&db)
-        .await
-        .map_err(|e| format!("Database error: {}", e))?
+    let user = user
+        .filter(|u| u.is_active && u.is_approved)
         .ok_or_else(|| "User not found or inactive".to_string())?;
 
-    // Update last_accessed_at (fire and forget - don't block on this)
-    let session_id = session.id.clone();
-    let shared_db = state.db.clone();
-    tokio::spawn(async move {
-        if let Some(db) = shared_db.read().await.clone() {
-            let update = session::ActiveModel {
-                id: Set(session_id),
-                last_accessed_at: Set(Utc::now()),
-                ..Default::default()
-            };
-            let _ = update.update(&db).await;
-        }
-    });
+    // Update last_accessed_at at most once per interval rather than writing on
+    // every request (fire and forget - don't block on this)
+    if now - session.last_accessed_at > Duration::seconds(LAST_ACCESSED_UPDATE_INTERVAL_SECS) {
+        let session_id = session.id.clone();
+        let shared_db = state.db.clone();
+        tokio::spawn(async move {
+            if let Some(db) = shared_db.read().await.clone() {
+                let update = session::ActiveModel {
+                    id: Set(session_id),
+                    last_accessed_at: Set(Utc::now()),
+                    ..Default::default()
+                };
+                let _ = update.update(&db).await;
+            }
+        });
+    }
 
     // Fetch all permissions for this user from their roles
     let permissions = fetch_user_permissions(state, session.user_id).await;
@@ -196,11 +206,11 @@ async fn authenticate_session(state: &AppState, token: &str) -> Result<Authentic
 }
 
 /// Fetch all permissions for a user from their roles
-async fn fetch_user_permissions(state: &AppState, user_id: i64) -> Vec<String> {
+async fn fetch_user_permissions(state: &AppState, user_id: i64) -> HashSet<String> {
     // Get database connection
     let db = match state.get_db().await {
         Ok(db) => db,
-        Err(_) => return Vec::new(),
+        Err(_) => return HashSet::new(),
     };
 
     // Get all role IDs for this user
@@ -213,32 +223,34 @@ async fn fetch_user_permissions(state: &AppState, user_id: i64) -> Vec<String> {
     let role_ids: Vec<i64> = user_roles.iter().map(|ur| ur.role_id).collect();
 
     if role_ids.is_empty() {
-        return Vec::new();
+        return HashSet::new();
     }
 
-    // Get all permissions from all roles
-    let permissions = RolePermission::find()
-        .filter(role_permission::Column::RoleId.is_in(role_ids.clone()))
-        .all(&db)
-        .await
-        .unwrap_or_default();
-
-    let mut perms: Vec<String> = permissions.iter().map(|p| p.permission.clone()).collect();
-
-    // Get app permissions and convert to app.{name} format
-    let app_permissions = RoleAppPermission::find()
-        .filter(role_app_permission::Column::RoleId.is_in(role_ids))
-        .all(&db)
-        .await
-        .unwrap_or_default();
-
-    for app_perm in app_permissions {
-        perms.push(format!("app.{}", app_perm.app_name));
-    }
+    // Get role permissions and app permissions from all roles concurrently
+    let (permissions, app_permissions) = tokio::join!(
+        RolePermission::find()
+            .filter(role_permission::Column::RoleId.is_in(role_ids.clone()))
+            .all(&db),
+        RoleAppPermission::find()
+            .filter(role_app_permission::Column::RoleId.is_in(role_ids))
+            .all(&db)
+    );
+
+    let mut perms: HashSet<String> = permissions
+        .unwrap_or_default()
+        .into_iter()
+        .map(|p| p.permission)
+        .collect();
+
+    // Convert app permissions to app.{name} format
+    let app_permissions = app_permissions.unwrap_or_default();
+
+    perms.extend(
+        app_permissions
+            .into_iter()
+            .map(|app_perm| format!("app.{}", app_perm.app_name)),
+    );
 
-    // Deduplicate
-    perms.sort();
-    perms.dedup();
     perms
 }
 
@@ -278,7 +290,7 @@ mod tests {
     fn test_has_permission_present() {
         let user = AuthenticatedUser {
             user: fake_user(1),
-            permissions: vec!["users.view".to_string(), "apps.view".to_string()],
+            permissions: HashSet::from(["users.view".to_string(), "apps.view".to_string()]),
         };
         assert!(user.has_permission("users.view"));
         assert!(user.has_permission("apps.view"));
@@ -288,7 +300,7 @@ mod tests {
     fn test_has_permission_absent() {
         let user = AuthenticatedUser {
             user: fake_user(1),
-            permissions: vec!["users.view".to_string()],
+            permissions: HashSet::from(["users.view".to_string()]),
         };
         assert!(!user.has_permission("users.manage"));
         assert!(!user.has_permission("apps.install"));
@@ -298,7 +310,7 @@ mod tests {
     fn test_has_permission_empty() {
         let user = AuthenticatedUser {
             user: fake_user(1),
-            permissions: vec![],
+            permissions: HashSet::new(),
         };
         assert!(!user.has_permission("any.permission"));
     }
@@ -307,7 +319,7 @@ mod tests {
     fn test_has_app_access_via_wildcard() {
         let user = AuthenticatedUser {
             user: fake_user(1),
-            permissions: vec!["app.*".to_string()],
+            permissions: HashSet::from(["app.*".to_string()]),
         };
         assert!(user.has_app_access("sonarr"));
         assert!(user.has_app_access("radarr"));
@@ -317,7 +329,7 @@ mod tests {
     fn test_has_app_access_via_specific() {
         let user = AuthenticatedUser {
             user: fake_user(1),
-            permissions: vec!["app.sonarr".to_string()],
+            permissions: HashSet::from(["app.sonarr".to_string()]),
         };
         assert!(user.has_app_access("sonarr"));
         assert!(!user.has_app_access("radarr"));
@@ -327,7 +339,7 @@ mod tests {
     fn test_has_app_access_no_perms() {
         let user = AuthenticatedUser {
             user: fake_user(1),
-            permissions: vec!["users.view".to_string()],
+            permissions: HashSet::from(["users.view".to_string()]),
         };
         assert!(!user.has_app_access("sonarr"));
     }
@@ -0,0 +1,38 @@
+//! Migration: Add composite index for listing a user's notifications
+
+use sea_orm_migration::prelude::*;
+
+#[derive(DeriveMigrationName)]
+pub struct Migration;
+
+const INDEX_NAME: &str = "idx_user_notifications_user_created";
+
+#[async_trait::async_trait]
+impl MigrationTrait for Migration {
+    async fn up(&self, manager: &SchemaManager) -> Result<(), DbErr> {
+        // The notification list filters by user and sorts newest first; the
+        // single-column user_id and created_at indexes can only serve one half
+        manager
+            .create_index(
+                Index::create()
+                    .name(INDEX_NAME)
+                    .table(Alias::new("user_notifications"))
+                    .col(Alias::new("user_id"))
+                    .col(Alias::new("created_at"))
+                    .if_not_exists()
+                    .to_owned(),
+            )
+            .await
+    }
+
+    async fn down(&self, manager: &SchemaManager) -> Result<(), DbErr> {
+        manager
+            .drop_index(
+                Index::drop()
+                    .name(INDEX_NAME)
+                    .table(Alias::new("user_notifications"))
+                    .to_owned(),
+            )
+            .await
+    }
+}
@@ -1,6 +1,7 @@
 use std::sync::Arc;
 
 use chrono::Utc;
+use futures_util::{stream, StreamExt};
 use sea_orm::{ActiveModelTrait, ColumnTrait, DatabaseConnection, EntityTrait, QueryFilter, Set};
 use serde::{Deserialize, Serialize};
 use tokio::sync::{broadcast, RwLock};
@@ -9,7 +10,6 @@ use crate::db;
 use crate::error::{AppError, Result};
 use crate::models::prelude::*;
 use crate::models::{bootstrap_status, server_config};
-use crate::services::catalog::AppCatalog;
 use crate::services::k8s::K8sClient;
 use crate::state::SharedDbConn;
 
@@ -57,6 +57,9 @@ pub const BOOTSTRAP_COMPONENTS: &[(&str, &str)] = &[
     ("fluent-bit", "Fluent Bit"),
 ];
 
+/// Maximum number of components installed at the same time after PostgreSQL
+const MAX_CONCURRENT_INSTALLS: usize = 4;
+
 /// In-memory status for components (used before database is available)
 #[derive(Debug, Clone, Default)]
 pub struct InMemoryStatus {
@@ -68,7 +71,6 @@ pub struct InMemoryStatus {
 pub struct BootstrapService {
     db: SharedDbConn,
     k8s: Arc<RwLock<Option<K8sClient>>>,
-    catalog: Arc<RwLock<AppCatalog>>,
     pub broadcast_tx: broadcast::Sender<String>,
     /// In-memory status (used before PostgreSQL is installed)
     in_memory_status: Arc<RwLock<InMemoryStatus>>,
@@ -78,7 +80,6 @@ impl BootstrapService {
     pub fn new(
         db: SharedDbConn,
         k8s: Arc<RwLock<Option<K8sClient>>>,
-        catalog: Arc<RwLock<AppCatalog>>,
         broadcast_tx: broadcast::Sender<String>,
     ) -> Self {
         // Initialize in-memory status with all components
@@ -96,7 +97,6 @@ impl BootstrapService {
         Self {
             db,
             k8s,
-            catalog,
             broadcast_tx,
             in_memory_status: Arc::new(RwLock::new(InMemoryStatus {
                 statuses,
@@ -660,34 +660,22 @@ impl BootstrapService {
         // Install PostgreSQL first (sequential, not parallel)
         self.install_component("postgresql", "PostgreSQL").await?;
 
-        // Now install remaining components in parallel
-        let remaining_components: Vec<_> = BOOTSTRAP_COMPONENTS
+        // Install the remaining components concurrently on this service, so their
+        // progress is recorded in the same in-memory status that callers read
+        let remaining = BOOTSTRAP_COMPONENTS
             .iter()
-            .filter(|(c, _)| *c != "postgresql")
-            .collect();
-
-        let mut handles = Vec::new();
-        for (component, display_name) in remaining_components {
-            let db = self.db.clone();
-            let k8s = self.k8s.clone();
-            let catalog = self.catalog.clone();
-            let broadcast_tx = self.broadcast_tx.clone();
-            let component = component.to_string();
-            let display_name = display_name.to_string();
-
-            let handle = tokio::spawn(async move {
-                let service = BootstrapService::new(db, k8s, catalog, broadcast_tx);
-                if let Err(e) = service.install_component(&component, &display_name).await {
-                    tracing::error!("Failed to install {}: {}", component, e);
-                }
-            });
-            handles.push(handle);
-        }
-
-        // Wait for all installations to complete
-        for handle in handles {
-            let _ = handle.await;
-        }
+            .filter(|(c, _)| *c != "postgresql");
+
+        stream::iter(remaining)
+            .for_each_concurrent(
+                MAX_CONCURRENT_INSTALLS,
+                |(component, display_name)| async move {
+                    if let Err(e) = self.install_component(component, display_name).await {
+                        tracing::error!("Failed to install {}: {}", component, e);
+                    }
+                },
+            )
+            .await;
 
         // Check if all components are healthy
         if self.is_complete().await {
@@ -6,6 +6,7 @@
 
 use std::collections::HashMap;
 
+use futures_util::future::join_all;
 use kube::Client;
 use tracing::warn;
 
@@ -54,15 +55,23 @@ pub async fn fetch_cadvisor_metrics(client: &Client) -> Vec<ContainerNetworkMetr
         }
     };
 
-    let mut all_metrics = Vec::new();
+    // Scrape all nodes at once so the total latency is the slowest node, not the sum
+    let node_names: Vec<String> = node_list
+        .items
+        .into_iter()
+        .filter_map(|node| node.metadata.name)
+        .collect();
+    let results = join_all(
+        node_names
+            .iter()
+            .map(|node_name| fetch_node_cadvisor_metrics(client, node_name)),
+    )
+    .await;
 
-    for node in node_list.items {
-        let node_name = match &node.metadata.name {
-            Some(name) => name.clone(),
-            None => continue,
-        };
+    let mut all_metrics = Vec::new();
 
-        match fetch_node_cadvisor_metrics(client, &node_name).await {
+    for (node_name, result) in node_names.iter().zip(results) {
+        match result {
             Ok(metrics) => {
                 all_metrics.extend(metrics);
             }
@@ -1,6 +1,9 @@
-use std::collections::HashMap;
+use std::collections::{BTreeMap, HashMap};
+use std::hash::{DefaultHasher, Hash, Hasher};
 use std::path::Path;
+use std::sync::Arc;
 
+use axum::body::Bytes;
 use serde::{Deserialize, Serialize};
 
 use crate::config::CONFIG;
@@ -39,24 +42,136 @@ pub struct VolumeConfig {
     pub size: String,
 }
 
+/// SVG icon from a chart directory, read once per catalog load
+#[derive(Debug, Clone)]
+pub struct AppIcon {
+    pub svg: Bytes,
+    /// Strong entity tag for the icon content
+    pub etag: String,
+}
+
 /// App catalog - registry of all available applications
+///
+/// The app map is shared behind an `Arc`, so cloning a catalog is cheap and
+/// handlers can take a snapshot instead of holding the catalog lock.
+#[derive(Clone)]
 pub struct AppCatalog {
-    apps: HashMap<String, AppConfig>,
+    apps: Arc<HashMap<String, AppConfig>>,
+    /// App names per category, both ordered by name, built once per load
+    by_category: Arc<BTreeMap<String, Vec<String>>>,
+    /// JSON object for each app, keyed like `apps` and serialized once per load
+    app_json: Arc<HashMap<String, Bytes>>,
+    /// JSON array of the visible (non-hidden) apps, serialized once per load
+    visible_apps_json: Bytes,
+    /// JSON array of the category names, serialized once per load
+    categories_json: Bytes,
+    /// JSON array of each category's apps, serialized once per load
+    category_apps_json: Arc<HashMap<String, Bytes>>,
+    /// Chart icons keyed by chart directory name
+    icons: Arc<HashMap<String, AppIcon>>,
+    /// Strong entity tag covering every app definition in the catalog
+    etag: String,
 }
 
 impl AppCatalog {
     /// Create a new app catalog from charts directory
     pub fn new() -> Self {
-        let mut catalog = Self {
-            apps: HashMap::new(),
-        };
+        let mut catalog = Self::with_apps(HashMap::new());
         catalog.load_apps();
         catalog
     }
 
     /// Create an app catalog with the given apps (for testing)
     pub fn with_apps(apps: HashMap<String, AppConfig>) -> Self {
-        Self { apps }
+        let by_category = Self::index_by_category(&apps);
+        let app_json = Self::serialize_each_app(&apps);
+        let visible_apps_json = Self::serialize_visible_apps(&apps);
+        let categories_json = Self::to_json_bytes(&by_category.keys().collect::<Vec<_>>());
+        let category_apps_json = by_category
+            .iter()
+            .map(|(category, names)| {
+                let category_apps: Vec<&AppConfig> =
+                    names.iter().filter_map(|name| apps.get(name)).collect();
+                (category.clone(), Self::to_json_bytes(&category_apps))
+            })
+            .collect();
+        let etag = Self::compute_etag(&apps);
+        Self {
+            apps: Arc::new(apps),
+            by_category: Arc::new(by_category),
+            app_json: Arc::new(app_json),
+            visible_apps_json,
+            categories_json,
+            category_apps_json: Arc::new(category_apps_json),
+            icons: Arc::default(),
+            etag,
+        }
+    }
+
+    /// Replace the app map and refresh the derived data
+    fn set_apps(&mut self, apps: HashMap<String, AppConfig>) {
+        *self = Self::with_apps(apps);
+    }
+
+    /// Fingerprint all app definitions (hidden ones included, since categories
+    /// and per-category listings see them) as a quoted ETag value
+    fn compute_etag(apps: &HashMap<String, AppConfig>) -> String {
+        let mut all: Vec<&AppConfig> = apps.values().collect();
+        all.sort_by(|a, b| a.name.cmp(&b.name));
+
+        Self::quoted_hash(&serde_json::to_vec(&all).unwrap_or_default())
+    }
+
+    /// Hash content into a quoted ETag value
+    fn quoted_hash(content: &[u8]) -> String {
+        let mut hasher = DefaultHasher::new();
+        content.hash(&mut hasher);
+        format!("\"{:016x}\"", hasher.finish())
+    }
+
+    /// Group app names by category in a single pass over the apps
+    fn index_by_category(apps: &HashMap<String, AppConfig>) -> BTreeMap<String, Vec<String>> {
+        let mut by_category: BTreeMap<String, Vec<String>> = BTreeMap::new();
+        for (key, app) in apps {
+            by_category
+                .entry(app.category.clone())
+                .or_default()
+                .push(key.clone());
+        }
+        for names in by_category.values_mut() {
+            names.sort();
+        }
+        by_category
+    }
+
+    /// Serialize every app as its own JSON object, skipping any that fail
+    fn serialize_each_app(apps: &HashMap<String, AppConfig>) -> HashMap<String, Bytes> {
+        apps.iter()
+            .filter_map(|(key, app)| match serde_json::to_vec(app) {
+                Ok(json) => Some((key.clone(), Bytes::from(json))),
+                Err(e) => {
+                    tracing::warn!("Failed to serialize app '{}': {}", key, e);
+                    None
+                }
+            })
+            .collect()
+    }
+
+    /// Serialize the non-hidden apps, ordered by name, as a JSON array
+    fn serialize_visible_apps(apps: &HashMap<String, AppConfig>) -> Bytes {
+        let mut visible: Vec<&AppConfig> = apps.values().filter(|app| !app.is_hidden).collect();
+        visible.sort_by(|a, b| a.name.cmp(&b.name));
+        Self::to_json_bytes(&visible)
+    }
+
+    /// Serialize a list as a JSON array, falling back to an empty array
+    fn to_json_bytes<T: Serialize>(items: &[T]) -> Bytes {
+        serde_json::to_vec(items)
+            .map(Bytes::from)
+            .unwrap_or_else(|e| {
+                tracing::warn!("Failed to serialize app catalog: {}", e);
+                Bytes::from_static(b"[]")
+            })
     }
 
     /// Load all app definitions from Helm charts
@@ -68,14 +183,26 @@ impl AppCatalog {
             return;
         }
 
+        let mut apps = HashMap::new();
+        let mut icons = HashMap::new();
         if let Ok(entries) = std::fs::read_dir(charts_dir) {
             for entry in entries.flatten() {
                 let path = entry.path();
                 if path.is_dir() {
                     if let Some(chart_name) = path.file_name().and_then(|n| n.to_str()) {
+                        if let Ok(svg) = std::fs::read(path.join("icon.svg")) {
+                            let etag = Self::quoted_hash(&svg);
+                            icons.insert(
+                                chart_name.to_string(),
+                                AppIcon {
+                                    svg: Bytes::from(svg),
+                                    etag,
+                                },
+                            );
+                        }
                         match self.parse_chart(chart_name, &path) {
                             Ok(Some(app)) => {
-                                self.apps.insert(app.name.clone(), app);
+                                apps.insert(app.name.clone(), app);
                             }
                             Ok(None) => {
                                 // Chart doesn't have kubarr annotations, skip
@@ -89,7 +216,9 @@ impl AppCatalog {
             }
         }
 
-        tracing::info!("Loaded {} apps from catalog", self.apps.len());
+        tracing::info!("Loaded {} apps from catalog", apps.len());
+        self.set_apps(apps);
+        self.icons = Arc::new(icons);
     }
 
     /// Parse a Helm chart into an AppConfig
@@ -300,6 +429,42 @@ impl AppCatalog {
         self.apps.values().collect()
     }
 
+    /// Get the visible (non-hidden) apps as a pre-serialized JSON array
+    ///
+    /// Cloning `Bytes` is a reference-count bump, so the catalog listing is
+    /// served without re-serializing every app on each request.
+    pub fn visible_apps_json(&self) -> Bytes {
+        self.visible_apps_json.clone()
+    }
+
+    /// Get a specific app by name as a pre-serialized JSON object
+    pub fn app_json(&self, app_name: &str) -> Option<Bytes> {
+        self.app_json.get(&app_name.to_lowercase()).cloned()
+    }
+
+    /// Get the sorted category names as a pre-serialized JSON array
+    pub fn categories_json(&self) -> Bytes {
+        self.categories_json.clone()
+    }
+
+    /// Get the apps in a category, ordered by name, as a pre-serialized JSON array
+    pub fn category_apps_json(&self, category: &str) -> Bytes {
+        self.category_apps_json
+            .get(category)
+            .cloned()
+            .unwrap_or_else(|| Bytes::from_static(b"[]"))
+    }
+
+    /// Get the icon from a chart directory, if it has one
+    pub fn get_icon(&self, chart_name: &str) -> Option<AppIcon> {
+        self.icons.get(chart_name).cloned()
+    }
+
+    /// Get the ETag identifying this version of the catalog
+    pub fn etag(&self) -> &str {
+        &self.etag
+    }
+
     /// Get a specific app by name
     pub fn get_app(&self, app_name: &str) -> Option<&AppConfig> {
         self.apps.get(&app_name.to_lowercase())
@@ -307,10 +472,15 @@ impl AppCatalog {
 
     /// Get all apps in a specific category
     pub fn get_apps_by_category(&self, category: &str) -> Vec<&AppConfig> {
-        self.apps
-            .values()
-            .filter(|app| app.category == category)
-            .collect()
+        self.by_category
+            .get(category)
+            .map(|names| {
+                names
+                    .iter()
+                    .filter_map(|name| self.apps.get(name))
+                    .collect()
+            })
+            .unwrap_or_default()
     }
 
     /// Check if an app exists in the catalog
@@ -321,20 +491,12 @@ impl AppCatalog {
 
     /// Get all unique categories
     pub fn get_categories(&self) -> Vec<String> {
-        let mut categories: Vec<_> = self
-            .apps
-            .values()
-            .map(|app| app.category.clone())
-            .collect::<std::collections::HashSet<_>>()
-            .into_iter()
-            .collect();
-        categories.sort();
-        categories
+        self.by_category.keys().cloned().collect()
     }
 
     /// Reload apps from charts directory
     pub fn reload(&mut self) {
-        self.apps.clear();
+        self.set_apps(HashMap::new());
         self.load_apps();
     }
 }
@@ -3,15 +3,17 @@
 //! Discovers charts from GitHub and pulls them from an OCI registry
 //! so the catalog always reflects the latest published versions.
 
-use std::process::Command;
 use std::sync::Arc;
 use std::time::Duration;
 
 use async_trait::async_trait;
+use futures_util::{stream, StreamExt};
 use sea_orm::DatabaseConnection;
 use serde::Deserialize;
+use tokio::process::Command;
 
 use crate::config::CONFIG;
+use crate::services::catalog::AppCatalog;
 use crate::state::SharedCatalog;
 
 /// GitHub Contents API entry
@@ -22,6 +24,9 @@ struct GitHubContent {
     content_type: String,
 }
 
+/// Maximum number of `helm pull` processes run at once during a sync
+const MAX_CONCURRENT_PULLS: usize = 8;
+
 /// Shared chart sync service used by both the scheduler and the on-demand endpoint.
 pub struct ChartSyncService {
     catalog: SharedCatalog,
@@ -50,19 +55,26 @@ impl ChartSyncService {
             return Ok(());
         }
 
+        // Each pull is dominated by helm startup and registry latency, so run them concurrently
+        let results: Vec<(&String, anyhow::Result<()>)> = stream::iter(&chart_names)
+            .map(|name| async move { (name, self.pull_chart(name).await) })
+            .buffer_unordered(MAX_CONCURRENT_PULLS)
+            .collect()
+            .await;
+
         let mut synced = 0u32;
-        for name in &chart_names {
-            match self.pull_chart(name) {
+        for (name, result) in results {
+            match result {
                 Ok(()) => synced += 1,
                 Err(e) => tracing::warn!("Chart sync: failed to pull {}: {}", name, e),
             }
         }
 
-        // Reload the catalog from the (now-updated) charts directory
-        {
-            let mut catalog = self.catalog.write().await;
-            catalog.reload();
-        }
+        // Reload the catalog from the (now-updated) charts directory.
+        // Parse off the async runtime and swap the result in, so catalog
+        // readers keep being served from memory while the YAML is re-read.
+        let fresh = tokio::task::spawn_blocking(AppCatalog::new).await?;
+        *self.catalog.write().await = fresh;
 
         tracing::info!("Chart sync completed, {} charts synced", synced);
         Ok(())
@@ -90,13 +102,14 @@ impl ChartSyncService {
     }
 
     /// Pull a single chart from the OCI registry using `helm pull`.
-    fn pull_chart(&self, name: &str) -> anyhow::Result<()> {
+    async fn pull_chart(&self, name: &str) -> anyhow::Result<()> {
         let chart_ref = format!("{}/{}", CONFIG.charts.registry, name);
         let dest = CONFIG.charts.dir.to_str().unwrap_or("/app/charts");
 
         let output = Command::new("helm")
             .args(["pull", &chart_ref, "--untar", "--destination", dest])
-            .output()?;
+            .output()
+            .await?;
 
         if !output.status.success() {
             let stderr = String::from_utf8_lossy(&output.stderr);
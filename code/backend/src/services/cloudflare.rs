@@ -9,7 +9,6 @@
 //! **Legacy mode:** The user pastes a pre-created tunnel token directly.
 
 use std::collections::BTreeMap;
-use std::process::Command;
 
 use base64::Engine as _;
 use chrono::Utc;
@@ -19,6 +18,7 @@ use kube::api::{Api, DeleteParams, PostParams};
 use once_cell::sync::Lazy;
 use sea_orm::{ActiveModelTrait, EntityTrait, Set};
 use serde::{Deserialize, Serialize};
+use tokio::process::Command;
 
 use crate::error::{AppError, Result};
 use crate::models::cloudflare_tunnel;
@@ -510,31 +510,25 @@ pub async fn save_config(
     let tunnel_db_id = tunnel.id;
     tokio::spawn(async move {
         let set_arg = format!("tunnelToken.existingSecret={}", CLOUDFLARED_SECRET_NAME);
-        let helm_result = tokio::task::spawn_blocking(move || {
-            run_helm_command(&[
-                "upgrade",
-                "--install",
-                CLOUDFLARED_RELEASE_NAME,
-                CLOUDFLARED_CHART_PATH,
-                "-n",
-                CLOUDFLARED_NAMESPACE,
-                "--create-namespace",
-                "--set",
-                &set_arg,
-                "--wait",
-                "--timeout",
-                "3m",
-            ])
-        })
+        let helm_result = run_helm_command(&[
+            "upgrade",
+            "--install",
+            CLOUDFLARED_RELEASE_NAME,
+            CLOUDFLARED_CHART_PATH,
+            "-n",
+            CLOUDFLARED_NAMESPACE,
+            "--create-namespace",
+            "--set",
+            &set_arg,
+            "--wait",
+            "--timeout",
+            "3m",
+        ])
         .await;
 
         let (status, error_msg) = match helm_result {
-            Ok(Ok(_)) => ("running".to_string(), None),
-            Ok(Err(e)) => ("failed".to_string(), Some(e.to_string())),
-            Err(e) => (
-                "failed".to_string(),
-                Some(format!("helm task panicked: {}", e)),
-            ),
+            Ok(_) => ("running".to_string(), None),
+            Err(e) => ("failed".to_string(), Some(e.to_string())),
         };
 
         match CloudflareTunnel::find_by_id(tunnel_db_id).one(&db_bg).await {
@@ -606,7 +600,9 @@ pub async fn delete_config(db: &DbConn, k8s: &K8sClient) -> Result<()> {
         CLOUDFLARED_RELEASE_NAME,
         "-n",
         CLOUDFLARED_NAMESPACE,
-    ]) {
+    ])
+    .await
+    {
         tracing::warn!("helm uninstall cloudflared failed (may be OK): {}", e);
     }
 
@@ -721,13 +717,14 @@ async fn ensure_namespace(k8s: &K8sClient, namespace: &str) -> Result<()> {
     Ok(())
 }
 
-/// Run a synchronous Helm command
-fn run_helm_command(args: &[&str]) -> Result<String> {
+/// Run a Helm command without blocking the async runtime
+async fn run_helm_command(args: &[&str]) -> Result<String> {
     tracing::info!("Running helm {}", args.join(" "));
 
     let output = Command::new("helm")
         .args(args)
         .output()
+        .await
         .map_err(|e| AppError::Internal(format!("Failed to execute helm: {}", e)))?;
 
     if !output.status.success() {
@@ -1,5 +1,5 @@
-use std::collections::HashMap;
-use std::process::Command;
+use std::borrow::Cow;
+use std::collections::{BTreeMap, HashMap, HashSet};
 
 use chrono::{DateTime, Utc};
 use k8s_openapi::api::apps::v1::{DaemonSet, Deployment};
@@ -7,6 +7,7 @@ use k8s_openapi::api::core::v1::Namespace;
 use kube::api::{Api, DeleteParams, ListParams};
 use sea_orm::DatabaseConnection;
 use serde::{Deserialize, Serialize};
+use tokio::process::Command;
 
 use crate::config::CONFIG;
 use crate::error::{AppError, Result};
@@ -33,14 +34,17 @@ pub struct DeploymentStatus {
 }
 
 /// Deployment manager for applications
-pub struct DeploymentManager<'a> {
-    k8s: &'a K8sClient,
-    catalog: &'a AppCatalog,
-    db: Option<&'a DatabaseConnection>,
+///
+/// Holds cheap handles (the shared Kubernetes client and a catalog snapshot),
+/// so building one per request costs a couple of reference-count bumps.
+pub struct DeploymentManager {
+    k8s: K8sClient,
+    catalog: AppCatalog,
+    db: Option<DatabaseConnection>,
 }
 
-impl<'a> DeploymentManager<'a> {
-    pub fn new(k8s: &'a K8sClient, catalog: &'a AppCatalog) -> Self {
+impl DeploymentManager {
+    pub fn new(k8s: K8sClient, catalog: AppCatalog) -> Self {
         Self {
             k8s,
             catalog,
@@ -48,17 +52,10 @@ impl<'a> DeploymentManager<'a> {
         }
     }
 
-    /// Create with database connection for VPN support
-    pub fn with_db(
-        k8s: &'a K8sClient,
-        catalog: &'a AppCatalog,
-        db: &'a DatabaseConnection,
-    ) -> Self {
-        Self {
-            k8s,
-            catalog,
-            db: Some(db),
-        }
+    /// Attach a database connection for VPN support
+    pub fn with_db(mut self, db: DatabaseConnection) -> Self {
+        self.db = Some(db);
+        self
     }
 
     /// Get the OCI chart reference for an app
@@ -66,11 +63,12 @@ impl<'a> DeploymentManager<'a> {
         format!("{}/{}", CONFIG.charts.registry, app_name)
     }
 
-    /// Run a Helm command
-    fn run_helm_command(&self, args: &[&str]) -> Result<String> {
+    /// Run a Helm command without blocking the async runtime
+    async fn run_helm_command(&self, args: &[&str]) -> Result<String> {
         let output = Command::new("helm")
             .args(args)
             .output()
+            .await
             .map_err(|e| AppError::Internal(format!("Failed to run helm: {}", e)))?;
 
         if !output.status.success() {
@@ -109,34 +107,38 @@ impl<'a> DeploymentManager<'a> {
             "--create-namespace",
         ];
 
-        // Collect --set arguments
-        let mut set_args: Vec<String> = Vec::new();
+        // Collect --set arguments (fixed flags are borrowed, only computed ones allocate)
+        let mut set_args: Vec<Cow<'static, str>> = Vec::new();
         let mut set_string_args: Vec<String> = Vec::new();
 
         // Add storage configuration
         if let Some(path) = storage_path {
-            set_args.push("storage.hostPath.enabled=true".to_string());
-            set_args.push(format!("storage.hostPath.rootPath={}", path));
+            set_args.push(Cow::Borrowed("storage.hostPath.enabled=true"));
+            set_args.push(format!("storage.hostPath.rootPath={}", path).into());
         }
 
         // Check for VPN configuration
-        if let Some(db) = self.db {
+        if let Some(db) = &self.db {
             if let Ok(Some(vpn_config)) =
                 vpn::get_vpn_deployment_config(db, &request.app_name).await
             {
                 // Create K8s secret with VPN credentials
-                match vpn::create_vpn_secret_for_app(self.k8s, db, &request.app_name).await {
+                match vpn::create_vpn_secret_for_app(&self.k8s, db, &request.app_name).await {
                     Ok(secret_name) => {
                         tracing::info!(
                             "Created VPN secret {} for app {}",
                             secret_name,
                             request.app_name
                         );
-                        set_args.push("vpn.enabled=true".to_string());
-                        set_args.push(format!("vpn.secretName={}", secret_name));
-                        set_args.push(format!("vpn.killSwitch={}", vpn_config.kill_switch));
+                        set_args.push(Cow::Borrowed("vpn.enabled=true"));
+                        set_args.push(format!("vpn.secretName={}", secret_name).into());
+                        set_args.push(Cow::Borrowed(if vpn_config.kill_switch {
+                            "vpn.killSwitch=true"
+                        } else {
+                            "vpn.killSwitch=false"
+                        }));
                         if vpn_config.port_forwarding {
-                            set_args.push("vpn.portForwarding.enabled=true".to_string());
+                            set_args.push(Cow::Borrowed("vpn.portForwarding.enabled=true"));
                         }
                         // Use --set-string for subnets since CIDR notation contains
                         // commas and slashes that Helm's --set parser misinterprets
@@ -158,7 +160,7 @@ impl<'a> DeploymentManager<'a> {
 
         // Add custom config
         for (key, value) in &request.custom_config {
-            set_args.push(format!("{}={}", key, value));
+            set_args.push(format!("{}={}", key, value).into());
         }
 
         // Add --set arguments
@@ -174,8 +176,7 @@ impl<'a> DeploymentManager<'a> {
         }
 
         // Run helm command
-        let args_str: Vec<&str> = helm_args.iter().map(|s| s.as_ref()).collect();
-        self.run_helm_command(&args_str)?;
+        self.run_helm_command(&helm_args).await?;
 
         Ok(DeploymentStatus {
             app_name: request.app_name.clone(),
@@ -191,7 +192,9 @@ impl<'a> DeploymentManager<'a> {
         let namespace = app_name;
 
         // Try to uninstall with Helm
-        let _ = self.run_helm_command(&["uninstall", app_name, "-n", namespace]);
+        let _ = self
+            .run_helm_command(&["uninstall", app_name, "-n", namespace])
+            .await;
 
         // Delete the namespace
         let namespaces: Api<Namespace> = Api::all(self.k8s.client().clone());
@@ -207,36 +210,44 @@ impl<'a> DeploymentManager<'a> {
     }
 
     /// Get list of deployed app names (excludes hidden/system apps like kubarr itself)
+    ///
+    /// An app counts as deployed when its namespace has at least one Deployment
+    /// or DaemonSet. Workload metadata is listed cluster-wide in two requests
+    /// rather than probing every app namespace individually.
     pub async fn get_deployed_apps(&self) -> Vec<String> {
-        let namespaces: Api<Namespace> = Api::all(self.k8s.client().clone());
-
-        // Get all catalog app names (excluding hidden apps)
-        let catalog_apps: std::collections::HashSet<_> = self
+        // Borrow catalog app names (excluding hidden apps) rather than cloning them
+        let catalog_apps: std::collections::HashSet<&str> = self
             .catalog
             .get_all_apps()
-            .iter()
+            .into_iter()
             .filter(|app| !app.is_hidden)
-            .map(|app| app.name.clone())
+            .map(|app| app.name.as_str())
             .collect();
 
-        let mut deployed_apps = Vec::new();
-
-        if let Ok(ns_list) = namespaces.list(&ListParams::default()).await {
-            for ns in ns_list {
-                if let Some(name) = ns.metadata.name {
-                    if catalog_apps.contains(&name) {
-                        // Check if there are deployments in this namespace
-                        if let Ok(health) = self.check_namespace_health(&name).await {
-                            if health.get("deployments").is_some() {
-                                deployed_apps.push(name);
-                            }
-                        }
-                    }
-                }
-            }
-        }
-
-        deployed_apps
+        let deployments: Api<Deployment> = Api::all(self.k8s.client().clone());
+        let daemonsets: Api<DaemonSet> = Api::all(self.k8s.client().clone());
+        let lp = ListParams::default();
+        let (deploy_list, ds_list) = tokio::join!(
+            deployments.list_metadata(&lp),
+            daemonsets.list_metadata(&lp)
+        );
+
+        let deploy_namespaces = deploy_list
+            .into_iter()
+            .flat_map(|list| list.items)
+            .filter_map(|d| d.metadata.namespace);
+        let ds_namespaces = ds_list
+            .into_iter()
+            .flat_map(|list| list.items)
+            .filter_map(|d| d.metadata.namespace);
+
+        // BTreeSet dedupes namespaces with several workloads and keeps name order
+        deploy_namespaces
+            .chain(ds_namespaces)
+            .filter(|ns| catalog_apps.contains(ns.as_str()))
+            .collect::<std::collections::BTreeSet<_>>()
+            .into_iter()
+            .collect()
     }
 
     /// Check if a namespace exists
@@ -258,13 +269,11 @@ impl<'a> DeploymentManager<'a> {
             }));
         }
 
-        // Get deployments
+        // Get deployments and daemonsets concurrently
         let deployments: Api<Deployment> = Api::namespaced(self.k8s.client().clone(), namespace);
-        let deploy_list = deployments.list(&ListParams::default()).await?;
-
-        // Get daemonsets
         let daemonsets: Api<DaemonSet> = Api::namespaced(self.k8s.client().clone(), namespace);
-        let ds_list = daemonsets.list(&ListParams::default()).await?;
+        let lp = ListParams::default();
+        let (deploy_list, ds_list) = tokio::try_join!(deployments.list(&lp), daemonsets.list(&lp))?;
 
         if deploy_list.items.is_empty() && ds_list.items.is_empty() {
             return Ok(serde_json::json!({
@@ -287,7 +296,7 @@ impl<'a> DeploymentManager<'a> {
             let ready_replicas = status.and_then(|s| s.ready_replicas).unwrap_or(0);
             let available_replicas = status.and_then(|s| s.available_replicas).unwrap_or(0);
 
-            let is_healthy = ready_replicas >= replicas && available_replicas >= replicas;
+            let is_healthy = deployment_is_healthy(deploy);
 
             workload_statuses.push(serde_json::json!({
                 "name": name,
@@ -312,7 +321,7 @@ impl<'a> DeploymentManager<'a> {
             let ready = status.map(|s| s.number_ready).unwrap_or(0);
             let available = status.and_then(|s| s.number_available).unwrap_or(0);
 
-            let is_healthy = ready >= desired && available >= desired && desired > 0;
+            let is_healthy = daemonset_is_healthy(ds);
 
             workload_statuses.push(serde_json::json!({
                 "name": name,
@@ -335,4 +344,85 @@ impl<'a> DeploymentManager<'a> {
             "message": if all_healthy { "All workloads healthy" } else { "Some workloads are not healthy" }
         }))
     }
+
+    /// Get the health status of every visible catalog app at once
+    ///
+    /// Reports the same `status`, `healthy` and `message` fields as
+    /// [`Self::check_namespace_health`] (without the per-workload breakdown),
+    /// but from three cluster-wide list calls rather than three calls per app.
+    pub async fn get_app_health_statuses(&self) -> Result<BTreeMap<String, serde_json::Value>> {
+        let namespaces: Api<Namespace> = Api::all(self.k8s.client().clone());
+        let deployments: Api<Deployment> = Api::all(self.k8s.client().clone());
+        let daemonsets: Api<DaemonSet> = Api::all(self.k8s.client().clone());
+        let lp = ListParams::default();
+        let (ns_list, deploy_list, ds_list) = tokio::try_join!(
+            namespaces.list_metadata(&lp),
+            deployments.list(&lp),
+            daemonsets.list(&lp)
+        )?;
+
+        let existing: HashSet<&str> = ns_list
+            .items
+            .iter()
+            .filter_map(|ns| ns.metadata.name.as_deref())
+            .collect();
+
+        // Namespace -> whether every workload in it is healthy
+        let mut workloads_healthy: HashMap<&str, bool> = HashMap::new();
+        let deploy_health = deploy_list
+            .items
+            .iter()
+            .map(|d| (d.metadata.namespace.as_deref(), deployment_is_healthy(d)));
+        let ds_health = ds_list
+            .items
+            .iter()
+            .map(|ds| (ds.metadata.namespace.as_deref(), daemonset_is_healthy(ds)));
+        for (namespace, healthy) in deploy_health.chain(ds_health) {
+            if let Some(namespace) = namespace {
+                *workloads_healthy.entry(namespace).or_insert(true) &= healthy;
+            }
+        }
+
+        Ok(self
+            .catalog
+            .get_all_apps()
+            .into_iter()
+            .filter(|app| !app.is_hidden)
+            .map(|app| {
+                let (status, message) = match workloads_healthy.get(app.name.as_str()) {
+                    Some(true) => ("healthy", "All workloads healthy"),
+                    Some(false) => ("unhealthy", "Some workloads are not healthy"),
+                    None if existing.contains(app.name.as_str()) => (
+                        "no_workloads",
+                        "No deployments or daemonsets found in namespace",
+                    ),
+                    None => ("not_found", "Namespace does not exist"),
+                };
+                let health = serde_json::json!({
+                    "status": status,
+                    "healthy": status == "healthy",
+                    "message": message
+                });
+                (app.name.clone(), health)
+            })
+            .collect())
+    }
+}
+
+/// A Deployment is healthy when all desired replicas are ready and available
+fn deployment_is_healthy(deploy: &Deployment) -> bool {
+    let replicas = deploy.spec.as_ref().and_then(|s| s.replicas).unwrap_or(1);
+    let status = deploy.status.as_ref();
+    let ready = status.and_then(|s| s.ready_replicas).unwrap_or(0);
+    let available = status.and_then(|s| s.available_replicas).unwrap_or(0);
+    ready >= replicas && available >= replicas
+}
+
+/// A DaemonSet is healthy when it is scheduled somewhere and every pod is ready and available
+fn daemonset_is_healthy(ds: &DaemonSet) -> bool {
+    let status = ds.status.as_ref();
+    let desired = status.map(|s| s.desired_number_scheduled).unwrap_or(1);
+    let ready = status.map(|s| s.number_ready).unwrap_or(0);
+    let available = status.and_then(|s| s.number_available).unwrap_or(0);
+    ready >= desired && available >= desired && desired > 0
 }
@@ -12,6 +12,9 @@ use crate::config::CONFIG;
 use crate::error::{AppError, Result};
 
 /// Kubernetes client manager
+///
+/// Cloning is cheap: the underlying `kube::Client` is reference-counted.
+#[derive(Clone)]
 pub struct K8sClient {
     client: Client,
 }
@@ -201,6 +204,9 @@ impl K8sClient {
     }
 
     /// Get service endpoints for an app
+    ///
+    /// A missing service yields an empty list; other API failures are errors,
+    /// so callers can tell an absent app from a transient outage.
     pub async fn get_service_endpoints(
         &self,
         app_name: &str,
@@ -210,7 +216,13 @@ impl K8sClient {
 
         let service = match services.get(app_name).await {
             Ok(s) => s,
-            Err(_) => return Ok(Vec::new()),
+            Err(kube::Error::Api(ae)) if ae.code == 404 => return Ok(Vec::new()),
+            Err(e) => {
+                return Err(AppError::Internal(format!(
+                    "Failed to get service {}/{}: {}",
+                    namespace, app_name, e
+                )))
+            }
         };
 
         // Read kubarr.io/base-path annotation from service metadata
@@ -282,6 +294,24 @@ impl K8sClient {
         Ok(pod_list.items)
     }
 
+    /// Delete all pods of an app in a single DeleteCollection request
+    ///
+    /// Returns the number of pods the API server reported as deleted.
+    pub async fn delete_app_pods(&self, namespace: &str, app_name: &str) -> Result<usize> {
+        use kube::api::DeleteParams;
+
+        let pods: Api<Pod> = Api::namespaced(self.client.clone(), namespace);
+        let lp = ListParams::default().labels(&format!("app.kubernetes.io/name={}", app_name));
+
+        let deleted = pods
+            .delete_collection(&DeleteParams::default(), &lp)
+            .await?
+            .left()
+            .map(|list| list.items.len())
+            .unwrap_or(0);
+        Ok(deleted)
+    }
+
     /// Get a specific pod by name
     pub async fn get_pod(&self, namespace: &str, pod_name: &str) -> Result<Pod> {
         let pods: Api<Pod> = Api::namespaced(self.client.clone(), namespace);
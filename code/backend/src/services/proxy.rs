@@ -3,16 +3,26 @@
 //! Proxies HTTP and WebSocket requests to Kubernetes services.
 
 use axum::{
-    body::Body,
+    body::{Body, HttpBody},
     extract::ws::{Message, WebSocket, WebSocketUpgrade},
-    http::{header, HeaderMap, Method, Response},
+    http::{header, HeaderMap, HeaderName, Method, Response},
 };
 use futures_util::{SinkExt, StreamExt};
+use http_body_util::{BodyStream, StreamBody};
 use reqwest::Client;
+use sync_wrapper::SyncStream;
 use tokio_tungstenite::{connect_async, tungstenite};
 
 use crate::error::{AppError, Result};
 
+/// Idle keep-alive connections kept per upstream app
+const PROXY_POOL_MAX_IDLE: usize = 20;
+
+/// Longest an upstream app may go without sending data. Responses are
+/// streamed, so there is no total timeout: large downloads, long polling and
+/// server-sent events may stay open as long as data keeps arriving.
+const PROXY_READ_TIMEOUT: std::time::Duration = std::time::Duration::from_secs(120);
+
 /// Proxy service for forwarding requests to apps
 #[derive(Clone)]
 pub struct ProxyService {
@@ -31,7 +41,12 @@ impl ProxyService {
         Self {
             client: Client::builder()
                 .redirect(reqwest::redirect::Policy::none())
-                .timeout(std::time::Duration::from_secs(30))
+                .read_timeout(PROXY_READ_TIMEOUT)
+                .connect_timeout(std::time::Duration::from_secs(5))
+                .pool_max_idle_per_host(PROXY_POOL_MAX_IDLE)
+                // Encoding is negotiated by forward() itself; never let the
+                // client decode a body that is meant to pass through untouched
+                .no_gzip()
                 .build()
                 .expect("Failed to create HTTP client"),
         }
@@ -45,48 +60,64 @@ impl ProxyService {
         headers: HeaderMap,
         body: Body,
     ) -> Result<Response<Body>> {
-        // Convert axum body to bytes
-        let body_bytes = axum::body::to_bytes(body, usize::MAX)
-            .await
-            .map_err(|e| AppError::Internal(format!("Failed to read request body: {}", e)))?;
+        self.forward(target_url, method, headers, body, false).await
+    }
 
-        // Build the request
-        let mut req_builder = self.client.request(method.clone(), target_url);
-
-        // Forward headers, excluding hop-by-hop headers
-        for (name, value) in headers.iter() {
-            let name_str = name.as_str().to_lowercase();
-            // Skip hop-by-hop, problematic, and encoding negotiation headers.
-            // accept-encoding is stripped so upstream apps don't compress responses,
-            // since the proxy reads the full body into memory and may rewrite HTML content.
-            if matches!(
-                name_str.as_str(),
-                "host"
-                    | "connection"
-                    | "keep-alive"
-                    | "proxy-authenticate"
-                    | "proxy-authorization"
-                    | "te"
-                    | "trailers"
-                    | "transfer-encoding"
-                    | "upgrade"
-                    | "content-length"
-                    | "accept-encoding"
-            ) {
-                continue;
-            }
-            if let Ok(v) = value.to_str() {
-                req_builder = req_builder.header(name.as_str(), v);
-            }
+    /// Proxy an HTTP request, letting upstream negotiate Content-Encoding
+    ///
+    /// Only for responses that are passed through untouched (e.g. precompressed
+    /// static assets); the body is never decoded or rewritten.
+    pub async fn proxy_http_encoded(
+        &self,
+        target_url: &str,
+        method: Method,
+        headers: HeaderMap,
+        body: Body,
+    ) -> Result<Response<Body>> {
+        self.forward(target_url, method, headers, body, true).await
+    }
+
+    async fn forward(
+        &self,
+        target_url: &str,
+        method: Method,
+        headers: HeaderMap,
+        body: Body,
+        keep_encoding: bool,
+    ) -> Result<Response<Body>> {
+        // Requests without a body (GET, HEAD, ...) must not be sent chunked
+        let has_body = body.size_hint().exact() != Some(0);
+
+        // Forward the caller's headers minus hop-by-hop ones, reusing the
+        // map instead of re-parsing every name and value into a new one.
+        // accept-encoding is stripped so upstream apps don't compress responses,
+        // since callers may read the body back and rewrite HTML, JS or CSS content.
+        let mut headers = headers;
+        strip_hop_by_hop(&mut headers);
+        headers.remove(header::HOST);
+        if !has_body {
+            headers.remove(header::CONTENT_LENGTH);
+        }
+        if !keep_encoding {
+            headers.remove(header::ACCEPT_ENCODING);
         }
 
-        // Add body if not empty
-        if !body_bytes.is_empty() {
-            req_builder = req_builder.body(body_bytes.to_vec());
+        // Build the request
+        let mut req_builder = self
+            .client
+            .request(method.clone(), target_url)
+            .headers(headers);
+
+        // Stream the upload through as it arrives instead of buffering it;
+        // the forwarded Content-Length keeps sized uploads from going chunked
+        if has_body {
+            req_builder = req_builder.body(reqwest::Body::wrap(StreamBody::new(SyncStream::new(
+                BodyStream::new(body),
+            ))));
         }
 
         // Send the request
-        let response = req_builder.send().await.map_err(|e| {
+        let mut response = req_builder.send().await.map_err(|e| {
             if e.is_connect() {
                 AppError::ServiceUnavailable(format!("Failed to connect to app: {}", e))
             } else if e.is_timeout() {
@@ -96,39 +127,54 @@ impl ProxyService {
             }
         })?;
 
-        // Build the response
+        // Build the response, moving the upstream headers over as-is apart from
+        // hop-by-hop ones and content-encoding (we strip accept-encoding from
+        // requests, but also guard against upstream compressing anyway)
         let status = response.status();
-        let resp_headers = response.headers().clone();
-        let resp_body = response
-            .bytes()
-            .await
-            .map_err(|e| AppError::BadGateway(format!("Failed to read response: {}", e)))?;
-
-        let mut builder = Response::builder().status(status);
-
-        // Forward response headers
-        for (name, value) in resp_headers.iter() {
-            // Skip hop-by-hop headers and content-encoding (we strip accept-encoding
-            // from requests, but also guard against upstream compressing anyway)
-            if matches!(
-                name.as_str(),
-                "connection"
-                    | "keep-alive"
-                    | "proxy-authenticate"
-                    | "proxy-authorization"
-                    | "te"
-                    | "trailers"
-                    | "transfer-encoding"
-                    | "content-encoding"
-            ) {
-                continue;
-            }
-            builder = builder.header(name, value);
+        let mut resp_headers = std::mem::take(response.headers_mut());
+        strip_hop_by_hop(&mut resp_headers);
+        if !keep_encoding {
+            resp_headers.remove(header::CONTENT_ENCODING);
         }
 
-        builder
-            .body(Body::from(resp_body))
-            .map_err(|e| AppError::Internal(format!("Failed to build response: {}", e)))
+        // Stream the body through as it arrives instead of buffering it, so
+        // large downloads start immediately and don't sit in memory
+        let body = futures_util::stream::try_unfold(response, |mut response| async move {
+            Ok::<_, reqwest::Error>(response.chunk().await?.map(|chunk| (chunk, response)))
+        });
+
+        let mut proxied = Response::new(Body::from_stream(body));
+        *proxied.status_mut() = status;
+        *proxied.headers_mut() = resp_headers;
+        Ok(proxied)
+    }
+}
+
+/// Hop-by-hop headers (RFC 7230 section 6.1). They describe a single
+/// connection, so the proxy never forwards them in either direction.
+static HOP_BY_HOP_HEADERS: [HeaderName; 8] = [
+    header::CONNECTION,
+    HeaderName::from_static("keep-alive"),
+    header::PROXY_AUTHENTICATE,
+    header::PROXY_AUTHORIZATION,
+    header::TE,
+    header::TRAILER,
+    header::TRANSFER_ENCODING,
+    header::UPGRADE,
+];
+
+/// Remove hop-by-hop headers, including any extra ones named in Connection
+fn strip_hop_by_hop(headers: &mut HeaderMap) {
+    let listed: Vec<HeaderName> = headers
+        .get_all(header::CONNECTION)
+        .iter()
+        .filter_map(|v| v.to_str().ok())
+        .flat_map(|v| v.split(','))
+        .filter_map(|name| HeaderName::from_bytes(name.trim().as_bytes()).ok())
+        .collect();
+
+    for name in listed.iter().chain(HOP_BY_HOP_HEADERS.iter()) {
+        headers.remove(name);
     }
 }
 
@@ -230,6 +276,7 @@ fn tungstenite_to_axum(msg: tungstenite::Message) -> Option<Message> {
 mod tests {
     use super::*;
     use axum::http::header as h;
+    use axum::http::HeaderValue;
 
     fn headers_with(key: &'static str, value: &str) -> HeaderMap {
         let mut map = HeaderMap::new();
@@ -261,6 +308,22 @@ mod tests {
         assert!(!is_websocket_upgrade(&headers));
     }
 
+    #[test]
+    fn test_strip_hop_by_hop() {
+        let mut headers = headers_with("connection", "keep-alive, x-hop");
+        headers.insert(h::TRANSFER_ENCODING, HeaderValue::from_static("chunked"));
+        headers.insert("keep-alive", HeaderValue::from_static("timeout=5"));
+        headers.insert("x-hop", HeaderValue::from_static("1"));
+        headers.insert(h::CONTENT_TYPE, HeaderValue::from_static("text/html"));
+        headers.insert(h::CONTENT_LENGTH, HeaderValue::from_static("42"));
+
+        strip_hop_by_hop(&mut headers);
+
+        assert_eq!(headers.len(), 2);
+        assert_eq!(headers[h::CONTENT_TYPE], "text/html");
+        assert_eq!(headers[h::CONTENT_LENGTH], "42");
+    }
+
     #[test]
     fn test_axum_to_tungstenite_text() {
         let msg = Message::Text("hello".to_string().into());
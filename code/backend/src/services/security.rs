@@ -1,3 +1,5 @@
+use std::collections::HashMap;
+
 use base64::{engine::general_purpose::URL_SAFE_NO_PAD, Engine};
 use chrono::{Duration, Utc};
 use jsonwebtoken::{decode, encode, DecodingKey, EncodingKey, Header, Validation};
@@ -7,6 +9,7 @@ use rand::RngExt;
 use rand_core::OsRng;
 use rsa::{
     pkcs8::{DecodePublicKey, EncodePrivateKey, EncodePublicKey, LineEnding},
+    traits::PublicKeyParts,
     RsaPrivateKey, RsaPublicKey,
 };
 use sea_orm::{ActiveModelTrait, ColumnTrait, EntityTrait, QueryFilter, Set};
@@ -27,6 +30,20 @@ const JWT_PUBLIC_KEY_SETTING: &str = "jwt_public_key";
 static PRIVATE_KEY: Lazy<RwLock<Option<String>>> = Lazy::new(|| RwLock::new(None));
 static PUBLIC_KEY: Lazy<RwLock<Option<String>>> = Lazy::new(|| RwLock::new(None));
 
+// Parsed signing/verification keys (PEM parsing is too expensive to repeat per token)
+static ENCODING_KEY: Lazy<RwLock<Option<EncodingKey>>> = Lazy::new(|| RwLock::new(None));
+static DECODING_KEY: Lazy<RwLock<Option<DecodingKey>>> = Lazy::new(|| RwLock::new(None));
+
+// JWKS document derived from the public key (only changes when the keys do)
+static JWKS: Lazy<RwLock<Option<serde_json::Value>>> = Lazy::new(|| RwLock::new(None));
+
+// Session tokens whose signature has already been verified (token -> session ID).
+// Session tokens carry no expiry and revocation is checked in the database, so
+// a verified token stays valid until the signing keys change.
+const SESSION_TOKEN_CACHE_MAX: usize = 4096;
+static SESSION_TOKEN_CACHE: Lazy<RwLock<HashMap<String, String>>> =
+    Lazy::new(|| RwLock::new(HashMap::new()));
+
 /// JWT token claims
 #[derive(Debug, Serialize, Deserialize)]
 pub struct Claims {
@@ -65,16 +82,21 @@ pub async fn init_jwt_keys(db: &sea_orm::DatabaseConnection) -> Result<()> {
     use crate::models::prelude::*;
     use crate::models::system_setting;
 
-    // Try to load existing keys from database
-    let private_setting = SystemSetting::find()
-        .filter(system_setting::Column::Key.eq(JWT_PRIVATE_KEY_SETTING))
-        .one(db)
-        .await?;
-
-    let public_setting = SystemSetting::find()
-        .filter(system_setting::Column::Key.eq(JWT_PUBLIC_KEY_SETTING))
-        .one(db)
+    // Try to load existing keys from database (both rows in one query)
+    let mut key_settings = SystemSetting::find()
+        .filter(
+            system_setting::Column::Key.is_in([JWT_PRIVATE_KEY_SETTING, JWT_PUBLIC_KEY_SETTING]),
+        )
+        .all(db)
         .await?;
+    let mut take_setting = |key: &str| {
+        key_settings
+            .iter()
+            .position(|s| s.key == key)
+            .map(|i| key_settings.swap_remove(i))
+    };
+    let private_setting = take_setting(JWT_PRIVATE_KEY_SETTING);
+    let public_setting = take_setting(JWT_PUBLIC_KEY_SETTING);
 
     let (private_pem, public_pem) = match (private_setting, public_setting) {
         (Some(priv_s), Some(pub_s)) if !priv_s.value.is_empty() && !pub_s.value.is_empty() => {
@@ -130,6 +152,13 @@ pub async fn init_jwt_keys(db: &sea_orm::DatabaseConnection) -> Result<()> {
         }
     };
 
+    // Parse once so signing and verification don't re-read the PEMs per token
+    let encoding_key = EncodingKey::from_rsa_pem(private_pem.as_bytes())
+        .map_err(|e| AppError::Internal(format!("Invalid private key: {}", e)))?;
+    let decoding_key = DecodingKey::from_rsa_pem(public_pem.as_bytes())
+        .map_err(|e| AppError::Internal(format!("Invalid public key: {}", e)))?;
+    let jwks = build_jwks(&public_pem)?;
+
     // Cache in memory
     {
         let mut cache = PRIVATE_KEY.write();
@@ -139,6 +168,12 @@ pub async fn init_jwt_keys(db: &sea_orm::DatabaseConnection) -> Result<()> {
         let mut cache = PUBLIC_KEY.write();
         *cache = Some(public_pem);
     }
+    *ENCODING_KEY.write() = Some(encoding_key);
+    *DECODING_KEY.write() = Some(decoding_key);
+    *JWKS.write() = Some(jwks);
+
+    // Tokens verified against the previous keys must be re-verified
+    SESSION_TOKEN_CACHE.write().clear();
 
     Ok(())
 }
@@ -161,6 +196,24 @@ pub fn get_public_key() -> Result<String> {
     })
 }
 
+/// Get the parsed JWT signing key
+/// Must be called after init_jwt_keys()
+fn get_encoding_key() -> Result<EncodingKey> {
+    let cache = ENCODING_KEY.read();
+    cache.clone().ok_or_else(|| {
+        AppError::Internal("JWT keys not initialized. Call init_jwt_keys() first.".to_string())
+    })
+}
+
+/// Get the parsed JWT verification key
+/// Must be called after init_jwt_keys()
+fn get_decoding_key() -> Result<DecodingKey> {
+    let cache = DECODING_KEY.read();
+    cache.clone().ok_or_else(|| {
+        AppError::Internal("JWT keys not initialized. Call init_jwt_keys() first.".to_string())
+    })
+}
+
 /// Generate an RSA key pair for JWT signing
 pub fn generate_rsa_key_pair() -> Result<(String, String)> {
     let private_key = RsaPrivateKey::new(&mut OsRng, 2048)
@@ -191,6 +244,51 @@ pub fn verify_password(password: &str, hash: &str) -> bool {
     bcrypt::verify(password, hash).unwrap_or(false)
 }
 
+/// Hash a password on the blocking thread pool.
+///
+/// bcrypt at the default cost takes tens of milliseconds of CPU; running it
+/// inline in a handler would stall every other task on that runtime worker.
+pub async fn hash_password_async(password: &str) -> Result<String> {
+    let password = password.to_string();
+    tokio::task::spawn_blocking(move || hash_password(&password))
+        .await
+        .map_err(|e| AppError::Internal(format!("Password hashing task failed: {}", e)))?
+}
+
+/// Verify a password against its hash on the blocking thread pool
+pub async fn verify_password_async(password: &str, hash: &str) -> bool {
+    let password = password.to_string();
+    let hash = hash.to_string();
+    tokio::task::spawn_blocking(move || verify_password(&password, &hash))
+        .await
+        .unwrap_or(false)
+}
+
+/// bcrypt hash of a throwaway password, hashed at the same cost as real
+/// accounts so that verifying against it takes just as long.
+static DUMMY_PASSWORD_HASH: Lazy<String> =
+    Lazy::new(|| hash_password("kubarr-login-timing-placeholder").unwrap_or_default());
+
+/// Verify a login password against a user's hash, or against a dummy hash
+/// when no such user exists.
+///
+/// Unknown usernames still pay for a full bcrypt verification, so response
+/// times don't reveal which accounts exist. Always returns `false` when
+/// `hash` is `None`.
+pub async fn verify_login_password_async(password: &str, hash: Option<&str>) -> bool {
+    let password = password.to_string();
+    let hash = hash.map(str::to_string);
+    tokio::task::spawn_blocking(move || {
+        let matched = verify_password(
+            &password,
+            hash.as_deref().unwrap_or(DUMMY_PASSWORD_HASH.as_str()),
+        );
+        matched && hash.is_some()
+    })
+    .await
+    .unwrap_or(false)
+}
+
 /// Create a JWT access token
 pub fn create_access_token(
     subject: &str,
@@ -204,7 +302,7 @@ pub fn create_access_token(
     let now = Utc::now();
     let exp = now + Duration::seconds(expires_in.unwrap_or(ACCESS_TOKEN_EXPIRE));
 
-    let issuer = format!("{}/auth", CONFIG.auth.oauth2_issuer_url);
+    let issuer = CONFIG.auth.token_issuer.clone();
     let claims = Claims {
         sub: subject.to_string(),
         iss: issuer,
@@ -220,9 +318,7 @@ pub fn create_access_token(
         allowed_apps,
     };
 
-    let private_key = get_private_key()?;
-    let encoding_key = EncodingKey::from_rsa_pem(private_key.as_bytes())
-        .map_err(|e| AppError::Internal(format!("Invalid private key: {}", e)))?;
+    let encoding_key = get_encoding_key()?;
 
     let header = Header::new(jsonwebtoken::Algorithm::RS256);
     encode(&header, &claims, &encoding_key).map_err(|e| e.into())
@@ -239,7 +335,7 @@ pub fn create_refresh_token(
     let now = Utc::now();
     let exp = now + Duration::seconds(expires_in.unwrap_or(REFRESH_TOKEN_EXPIRE));
 
-    let issuer = format!("{}/auth", CONFIG.auth.oauth2_issuer_url);
+    let issuer = CONFIG.auth.token_issuer.clone();
     let claims = Claims {
         sub: subject.to_string(),
         iss: issuer,
@@ -255,9 +351,7 @@ pub fn create_refresh_token(
         allowed_apps: None,
     };
 
-    let private_key = get_private_key()?;
-    let encoding_key = EncodingKey::from_rsa_pem(private_key.as_bytes())
-        .map_err(|e| AppError::Internal(format!("Invalid private key: {}", e)))?;
+    let encoding_key = get_encoding_key()?;
 
     let header = Header::new(jsonwebtoken::Algorithm::RS256);
     encode(&header, &claims, &encoding_key).map_err(|e| e.into())
@@ -265,9 +359,7 @@ pub fn create_refresh_token(
 
 /// Decode and validate a JWT token
 pub fn decode_token(token: &str) -> Result<Claims> {
-    let public_key = get_public_key()?;
-    let decoding_key = DecodingKey::from_rsa_pem(public_key.as_bytes())
-        .map_err(|e| AppError::Internal(format!("Invalid public key: {}", e)))?;
+    let decoding_key = get_decoding_key()?;
 
     let mut validation = Validation::new(jsonwebtoken::Algorithm::RS256);
     validation.validate_exp = true;
@@ -287,9 +379,7 @@ pub fn create_session_token(session_id: &str) -> Result<String> {
         sid: session_id.to_string(),
     };
 
-    let private_key = get_private_key()?;
-    let encoding_key = EncodingKey::from_rsa_pem(private_key.as_bytes())
-        .map_err(|e| AppError::Internal(format!("Invalid private key: {}", e)))?;
+    let encoding_key = get_encoding_key()?;
 
     let header = Header::new(jsonwebtoken::Algorithm::RS256);
     encode(&header, &claims, &encoding_key).map_err(|e| e.into())
@@ -298,9 +388,11 @@ pub fn create_session_token(session_id: &str) -> Result<String> {
 /// Decode and validate a session token
 /// Returns the session ID if signature is valid - expiration is checked in the database
 pub fn decode_session_token(token: &str) -> Result<SessionClaims> {
-    let public_key = get_public_key()?;
-    let decoding_key = DecodingKey::from_rsa_pem(public_key.as_bytes())
-        .map_err(|e| AppError::Internal(format!("Invalid public key: {}", e)))?;
+    if let Some(sid) = SESSION_TOKEN_CACHE.read().get(token) {
+        return Ok(SessionClaims { sid: sid.clone() });
+    }
+
+    let decoding_key = get_decoding_key()?;
 
     let mut validation = Validation::new(jsonwebtoken::Algorithm::RS256);
     validation.validate_exp = false; // Expiration checked in database
@@ -308,6 +400,15 @@ pub fn decode_session_token(token: &str) -> Result<SessionClaims> {
     validation.required_spec_claims.clear(); // No required claims
 
     let token_data = decode::<SessionClaims>(token, &decoding_key, &validation)?;
+
+    {
+        let mut cache = SESSION_TOKEN_CACHE.write();
+        if cache.len() >= SESSION_TOKEN_CACHE_MAX {
+            cache.clear();
+        }
+        cache.insert(token.to_string(), token_data.claims.sid.clone());
+    }
+
     Ok(token_data.claims)
 }
 
@@ -427,15 +528,21 @@ pub fn verify_recovery_code(code: &str, hash: &str) -> bool {
 }
 
 /// Get the JWKS (JSON Web Key Set) for the public key
+/// Must be called after init_jwt_keys()
 pub fn get_jwks() -> Result<serde_json::Value> {
-    let public_pem = get_public_key()?;
+    let cache = JWKS.read();
+    cache.clone().ok_or_else(|| {
+        AppError::Internal("JWT keys not initialized. Call init_jwt_keys() first.".to_string())
+    })
+}
 
+/// Build the JWKS document for a PEM-encoded public key
+fn build_jwks(public_pem: &str) -> Result<serde_json::Value> {
     // Parse the public key
-    let public_key = RsaPublicKey::from_public_key_pem(&public_pem)
+    let public_key = RsaPublicKey::from_public_key_pem(public_pem)
         .map_err(|e| AppError::Internal(format!("Failed to parse public key: {}", e)))?;
 
     // Get the modulus and exponent
-    use rsa::traits::PublicKeyParts;
     let n = URL_SAFE_NO_PAD.encode(public_key.n().to_bytes_be());
     let e = URL_SAFE_NO_PAD.encode(public_key.e().to_bytes_be());
 
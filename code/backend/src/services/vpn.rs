@@ -11,15 +11,21 @@ use k8s_openapi::api::core::v1::{
 };
 use k8s_openapi::apimachinery::pkg::apis::meta::v1::ObjectMeta;
 use kube::api::{Api, DeleteParams, PostParams};
+use once_cell::sync::Lazy;
 use sea_orm::{ActiveModelTrait, ColumnTrait, EntityTrait, PaginatorTrait, QueryFilter, Set};
 use serde::{Deserialize, Serialize};
 
+use crate::config::CONFIG;
 use crate::error::{AppError, Result};
 use crate::models::prelude::*;
 use crate::models::{app_vpn_config, vpn_provider};
 use crate::services::K8sClient;
 use crate::state::DbConn;
 
+/// Shared client for Gluetun control API calls, so requests reuse pooled
+/// connections. Callers set their own per-request timeouts.
+pub static GLUETUN_CLIENT: Lazy<reqwest::Client> = Lazy::new(reqwest::Client::new);
+
 // ============================================================================
 // Credential Structures
 // ============================================================================
@@ -870,10 +876,7 @@ async fn create_gluetun_test_pod(
         spec: Some(PodSpec {
             containers: vec![Container {
                 name: "gluetun".to_string(),
-                image: Some(
-                    std::env::var("KUBARR_GLUETUN_IMAGE")
-                        .unwrap_or_else(|_| "qmcgaw/gluetun:v3.40".to_string()),
-                ),
+                image: Some(CONFIG.kubernetes.gluetun_image.clone()),
                 env: Some(env_vars),
                 env_from: Some(vec![k8s_openapi::api::core::v1::EnvFromSource {
                     secret_ref: Some(k8s_openapi::api::core::v1::SecretEnvSource {
@@ -991,8 +994,7 @@ async fn query_gluetun_public_ip(
     let url = format!("http://{}:8000/v1/publicip/ip", pod_ip);
 
     let query_result = timeout(timeout_duration, async {
-        let client = reqwest::Client::new();
-        let response = client.get(&url).send().await.map_err(|e| {
+        let response = GLUETUN_CLIENT.get(&url).send().await.map_err(|e| {
             AppError::Internal(format!(
                 "Failed to connect to VPN: {}. The VPN connection may not be established yet.",
                 e
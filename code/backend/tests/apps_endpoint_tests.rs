@@ -9,6 +9,7 @@
 //! - `POST /api/apps/sync`              — requires apps.install
 //! - `GET  /api/apps/categories`        — requires apps.view
 //! - `GET  /api/apps/category/{cat}`    — requires apps.view
+//! - `GET  /api/apps/status`            — requires apps.view
 //! - `DELETE /api/apps/{name}`          — requires apps.delete
 //! - `POST /api/apps/{name}/restart`    — requires apps.restart
 //! - `GET  /api/apps/{name}/health`     — requires apps.view
@@ -225,6 +226,14 @@ async fn test_get_status_requires_auth() {
     assert_eq!(status, StatusCode::UNAUTHORIZED);
 }
 
+#[tokio::test]
+async fn test_get_all_statuses_requires_auth() {
+    let db = create_test_db_with_seed().await;
+    let app = create_router(build_test_app_state_with_db(db).await);
+    let (status, _) = make_request(app, "GET", "/api/apps/status", None, None).await;
+    assert_eq!(status, StatusCode::UNAUTHORIZED);
+}
+
 #[tokio::test]
 async fn test_log_access_requires_auth() {
     let db = create_test_db_with_seed().await;
@@ -302,6 +311,37 @@ async fn test_list_catalog_returns_empty_without_charts() {
     let _ = apps.len(); // Just verify it parses and doesn't panic
 }
 
+#[tokio::test]
+async fn test_list_catalog_returns_304_for_matching_etag() {
+    let (app, cookie) = make_admin("admin_etag", "admin_etag@test.com").await;
+
+    let request = Request::builder()
+        .uri("/api/apps/catalog")
+        .header("Cookie", &cookie)
+        .body(Body::empty())
+        .unwrap();
+    let response = app.clone().oneshot(request).await.unwrap();
+    assert_eq!(response.status(), StatusCode::OK);
+    let etag = response
+        .headers()
+        .get(axum::http::header::ETAG)
+        .expect("catalog response must carry an ETag")
+        .to_str()
+        .unwrap()
+        .to_string();
+
+    let request = Request::builder()
+        .uri("/api/apps/catalog")
+        .header("Cookie", &cookie)
+        .header("If-None-Match", &etag)
+        .body(Body::empty())
+        .unwrap();
+    let response = app.oneshot(request).await.unwrap();
+    assert_eq!(response.status(), StatusCode::NOT_MODIFIED);
+    let bytes = response.into_body().collect().await.unwrap().to_bytes();
+    assert!(bytes.is_empty(), "304 response must not carry a body");
+}
+
 #[tokio::test]
 async fn test_get_app_from_catalog_returns_404_when_not_found() {
     let (app, cookie) = make_admin("admin_cat404", "admin_cat404@test.com").await;
@@ -325,7 +365,7 @@ async fn test_get_app_from_catalog_returns_404_when_not_found() {
 async fn test_get_app_icon_rejects_path_traversal() {
     let (app, cookie) = make_admin("admin_icon", "admin_icon@test.com").await;
     // Use percent-encoded ".." to test the path traversal check in get_app_icon.
-    // The handler validates app_name.contains("..") and rejects with 400.
+    // The handler only accepts DNS-label app names and rejects this with 400.
     let (status, _) = make_request(
         app.clone(),
         "GET",
@@ -480,6 +520,17 @@ async fn test_get_status_returns_error_state_without_k8s() {
     );
 }
 
+#[tokio::test]
+async fn test_get_all_statuses_returns_500_without_k8s() {
+    let (app, cookie) = make_admin("admin_statuses", "admin_statuses@test.com").await;
+    let (status, _) = make_request(app, "GET", "/api/apps/status", Some(&cookie), None).await;
+    assert_eq!(
+        status,
+        StatusCode::INTERNAL_SERVER_ERROR,
+        "bulk status without K8s must return 500"
+    );
+}
+
 #[tokio::test]
 async fn test_log_app_access_returns_success() {
     let (app, cookie) = make_admin("admin_access", "admin_access@test.com").await;
@@ -695,6 +695,53 @@ async fn test_frontend_fallback_spa_routes_accessible() {
     }
 }
 
+#[tokio::test]
+async fn test_unknown_api_route_returns_404_not_spa() {
+    let state = create_test_state().await;
+
+    // Unknown /api/* paths must not fall through to the frontend SPA proxy
+    let (status, body) = make_unauthenticated_request(state, "/api/does-not-exist").await;
+    assert_eq!(
+        status,
+        StatusCode::NOT_FOUND,
+        "Unknown API route should return 404 (body: {})",
+        body
+    );
+}
+
+#[tokio::test]
+async fn test_openapi_spec_is_public_json() {
+    let state = create_test_state().await;
+
+    let (status, body) = make_unauthenticated_request(state, "/api/openapi.json").await;
+    assert_eq!(status, StatusCode::OK);
+
+    let spec: serde_json::Value = serde_json::from_str(&body).expect("spec should be JSON");
+    assert!(spec["paths"]["/api/apps/catalog"].is_object());
+}
+
+#[tokio::test]
+async fn test_api_responses_are_gzipped_when_accepted() {
+    let state = create_test_state().await;
+    let app = create_router(state);
+
+    let request = Request::builder()
+        .uri("/api/openapi.json")
+        .header("accept-encoding", "gzip")
+        .body(Body::empty())
+        .unwrap();
+
+    let response = app.oneshot(request).await.unwrap();
+    assert_eq!(response.status(), StatusCode::OK);
+    assert_eq!(
+        response
+            .headers()
+            .get("content-encoding")
+            .and_then(|v| v.to_str().ok()),
+        Some("gzip")
+    );
+}
+
 #[tokio::test]
 async fn test_frontend_app_routes_require_auth() {
     let state = create_test_state().await;
@@ -185,6 +185,38 @@ async fn test_login_valid_credentials_returns_user_info() {
     );
 }
 
+#[tokio::test]
+async fn test_login_with_email_returns_200() {
+    ensure_jwt_keys().await;
+
+    let db = create_test_db_with_seed().await;
+    create_test_user_with_role(&db, "mailuser", "mail@example.com", "mailpass", "admin").await;
+    let state = build_test_app_state_with_db(db).await;
+
+    let (status, cookie) = do_login(create_router(state), "mail@example.com", "mailpass").await;
+
+    assert_eq!(status, StatusCode::OK, "Login by email must return 200");
+    assert!(cookie.is_some(), "Login must set a session cookie");
+}
+
+#[tokio::test]
+async fn test_login_username_containing_at_sign_returns_200() {
+    ensure_jwt_keys().await;
+
+    // Identifiers with '@' are looked up by email first, then by username
+    let db = create_test_db_with_seed().await;
+    create_test_user_with_role(&db, "odd@name", "odd@example.com", "oddpass", "admin").await;
+    let state = build_test_app_state_with_db(db).await;
+
+    let (status, _) = do_login(create_router(state), "odd@name", "oddpass").await;
+
+    assert_eq!(
+        status,
+        StatusCode::OK,
+        "Username containing '@' must still log in"
+    );
+}
+
 #[tokio::test]
 async fn test_login_invalid_password_returns_401() {
     ensure_jwt_keys().await;
@@ -10,7 +10,6 @@ use common::create_test_db_with_seed;
 use kubarr::models::{bootstrap_status, prelude::BootstrapStatus};
 use kubarr::services::{
     bootstrap::{BootstrapService, BOOTSTRAP_COMPONENTS},
-    catalog::AppCatalog,
     k8s::K8sClient,
 };
 
@@ -44,9 +43,8 @@ async fn make_service_with_db_records(
 
     let shared_db = Arc::new(RwLock::new(Some(db)));
     let k8s: Arc<RwLock<Option<K8sClient>>> = Arc::new(RwLock::new(None));
-    let catalog = Arc::new(RwLock::new(AppCatalog::default()));
     let (tx, _rx) = broadcast::channel(100);
-    BootstrapService::new(shared_db, k8s, catalog, tx)
+    BootstrapService::new(shared_db, k8s, tx)
 }
 
 // ============================================================================
@@ -208,9 +206,8 @@ async fn test_get_status_falls_back_to_in_memory_when_db_empty() {
 
     let shared_db = Arc::new(RwLock::new(Some(db)));
     let k8s: Arc<RwLock<Option<K8sClient>>> = Arc::new(RwLock::new(None));
-    let catalog = Arc::new(RwLock::new(AppCatalog::default()));
     let (tx, _rx) = broadcast::channel(100);
-    let svc = BootstrapService::new(shared_db, k8s, catalog, tx);
+    let svc = BootstrapService::new(shared_db, k8s, tx);
 
     let statuses = svc.get_status().await.expect("get_status must succeed");
     // In-memory fallback: 4 components, all pending
@@ -22,7 +22,6 @@ use kubarr::services::network_broadcaster::{
     NetworkEdgeData, NetworkMetricsMessage, NetworkNodeData, NetworkStatsData, NetworkTopologyData,
 };
 
-use kubarr::services::catalog::AppCatalog;
 use kubarr::services::k8s::K8sClient;
 use std::sync::Arc;
 use tokio::sync::{broadcast, RwLock};
@@ -35,9 +34,8 @@ async fn make_service() -> (BootstrapService, broadcast::Receiver<String>) {
     let db = create_test_db_with_seed().await;
     let shared_db = Arc::new(RwLock::new(Some(db)));
     let k8s: Arc<RwLock<Option<K8sClient>>> = Arc::new(RwLock::new(None));
-    let catalog = Arc::new(RwLock::new(AppCatalog::default()));
     let (tx, rx) = broadcast::channel(100);
-    let svc = BootstrapService::new(shared_db, k8s, catalog, tx);
+    let svc = BootstrapService::new(shared_db, k8s, tx);
     (svc, rx)
 }
 
@@ -233,9 +231,8 @@ async fn bootstrap_service_broadcast_sends_to_channel() {
     let db = create_test_db_with_seed().await;
     let shared_db = Arc::new(RwLock::new(Some(db)));
     let k8s: Arc<RwLock<Option<K8sClient>>> = Arc::new(RwLock::new(None));
-    let catalog = Arc::new(RwLock::new(AppCatalog::default()));
     let (tx, mut rx) = broadcast::channel(100);
-    let svc = BootstrapService::new(shared_db, k8s, catalog, tx);
+    let svc = BootstrapService::new(shared_db, k8s, tx);
 
     // Trigger a broadcast via start_bootstrap would be too heavy;
     // instead, use the public broadcast_tx directly
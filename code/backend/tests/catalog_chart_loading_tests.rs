@@ -26,6 +26,7 @@ static CHARTS_TEMP_DIR: Lazy<TempDir> = Lazy::new(|| {
 
     // Create a valid chart with category annotation
     create_chart_in(tmp.path(), "sonarr", "media", "", SONARR_VALUES);
+    fs::write(tmp.path().join("sonarr").join("icon.svg"), SONARR_ICON).expect("write icon.svg");
 
     // Chart without kubarr.io/category annotation (should be skipped)
     let no_cat_dir = tmp.path().join("nocategory");
@@ -96,6 +97,8 @@ fn create_chart_in(
     }
 }
 
+const SONARR_ICON: &str = "<svg xmlns=\"http://www.w3.org/2000/svg\"></svg>";
+
 const SONARR_VALUES: &str = r#"sonarr:
   image:
     repository: linuxserver/sonarr
@@ -190,6 +193,19 @@ fn catalog_reload_with_charts() {
     let _ = catalog.get_all_apps();
 }
 
+#[test]
+fn catalog_loads_chart_icons_into_memory() {
+    init_charts_dir();
+    let catalog = AppCatalog::new();
+    // Only meaningful when CONFIG picked up the temp charts dir
+    if catalog.get_app("sonarr").is_some() {
+        let icon = catalog.get_icon("sonarr").expect("sonarr icon loaded");
+        assert_eq!(&icon.svg[..], SONARR_ICON.as_bytes());
+        assert!(icon.etag.starts_with('"') && icon.etag.ends_with('"'));
+        assert!(catalog.get_icon("radarr").is_none());
+    }
+}
+
 // ============================================================================
 // Testing AppCatalog with explicitly-created temp dirs (avoids CONFIG issue)
 // ============================================================================
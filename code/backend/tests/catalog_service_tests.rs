@@ -6,6 +6,7 @@
 //! - AppCatalog::with_apps() (test constructor)
 //! - get_all_apps() / get_app() / get_apps_by_category()
 //! - app_exists() / get_categories()
+//! - app_json() / visible_apps_json() / categories_json() / category_apps_json()
 //! - reload() (with empty charts dir)
 //! - AppCatalog::new() (with non-existent charts dir → empty catalog)
 //! - DeploymentRequest deserialization
@@ -166,6 +167,21 @@ fn get_apps_by_category_exact_match() {
     assert_eq!(networking[0].name, "traefik");
 }
 
+#[test]
+fn get_apps_by_category_ordered_by_name() {
+    let catalog = make_catalog_with(&[
+        ("sonarr", "media"),
+        ("jellyfin", "media"),
+        ("radarr", "media"),
+    ]);
+    let names: Vec<&str> = catalog
+        .get_apps_by_category("media")
+        .iter()
+        .map(|app| app.name.as_str())
+        .collect();
+    assert_eq!(names, vec!["jellyfin", "radarr", "sonarr"]);
+}
+
 // ============================================================================
 // get_categories
 // ============================================================================
@@ -275,6 +291,71 @@ fn hidden_app_is_accessible_via_get_app() {
     assert!(app.unwrap().is_system);
 }
 
+// ============================================================================
+// visible_apps_json
+// ============================================================================
+
+#[test]
+fn visible_apps_json_excludes_hidden_and_sorts_by_name() {
+    let mut apps = HashMap::new();
+    for name in ["sonarr", "jellyfin", "radarr"] {
+        let app = make_app(name, "media");
+        apps.insert(app.name.clone(), app);
+    }
+    let mut hidden_app = make_app("kubarr", "system");
+    hidden_app.is_hidden = true;
+    apps.insert("kubarr".to_string(), hidden_app);
+
+    let catalog = AppCatalog::with_apps(apps);
+    let parsed: Vec<AppConfig> =
+        serde_json::from_slice(&catalog.visible_apps_json()).expect("valid JSON");
+    let names: Vec<&str> = parsed.iter().map(|a| a.name.as_str()).collect();
+    assert_eq!(names, vec!["jellyfin", "radarr", "sonarr"]);
+}
+
+#[test]
+fn visible_apps_json_empty_catalog_is_empty_array() {
+    let catalog = AppCatalog::with_apps(HashMap::new());
+    assert_eq!(&catalog.visible_apps_json()[..], b"[]");
+}
+
+#[test]
+fn categories_json_matches_get_categories() {
+    let catalog = make_catalog_with(&[
+        ("traefik", "networking"),
+        ("sonarr", "media"),
+        ("radarr", "media"),
+    ]);
+    let parsed: Vec<String> =
+        serde_json::from_slice(&catalog.categories_json()).expect("valid JSON");
+    assert_eq!(parsed, catalog.get_categories());
+    assert_eq!(parsed, vec!["media", "networking"]);
+}
+
+#[test]
+fn category_apps_json_lists_category_apps_by_name() {
+    let catalog = make_catalog_with(&[
+        ("sonarr", "media"),
+        ("radarr", "media"),
+        ("traefik", "networking"),
+    ]);
+    let parsed: Vec<AppConfig> =
+        serde_json::from_slice(&catalog.category_apps_json("media")).expect("valid JSON");
+    let names: Vec<&str> = parsed.iter().map(|a| a.name.as_str()).collect();
+    assert_eq!(names, vec!["radarr", "sonarr"]);
+    assert_eq!(&catalog.category_apps_json("tools")[..], b"[]");
+}
+
+#[test]
+fn app_json_serializes_single_app_case_insensitively() {
+    let catalog = make_catalog_with(&[("sonarr", "media")]);
+    let parsed: AppConfig =
+        serde_json::from_slice(&catalog.app_json("Sonarr").expect("app present"))
+            .expect("valid JSON");
+    assert_eq!(parsed.name, "sonarr");
+    assert!(catalog.app_json("missing").is_none());
+}
+
 // ============================================================================
 // DeploymentRequest deserialization
 // ============================================================================
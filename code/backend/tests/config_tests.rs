@@ -13,6 +13,10 @@ fn test_config_defaults() {
     assert_eq!(config.kubernetes.default_namespace, "media");
     assert!(!config.auth.oauth2_enabled);
     assert!(!config.kubernetes.in_cluster);
+    assert_eq!(config.kubernetes.gluetun_image, "qmcgaw/gluetun:v3.40");
+    assert!(config.server.host_browse_prefix.is_empty());
+    assert!(config.server.cors_origins.is_empty());
+    assert_eq!(config.log_format, "text");
 }
 
 #[test]
@@ -73,3 +77,18 @@ fn test_lazy_static_config() {
     // CONFIG should be initialized with a non-empty host
     assert!(!CONFIG.server.host.is_empty());
 }
+
+#[test]
+fn test_auth_derived_fields() {
+    let config = Config::from_env();
+
+    // Derived auth settings are computed once from the issuer URL
+    assert_eq!(
+        config.auth.token_issuer,
+        format!("{}/auth", config.auth.oauth2_issuer_url)
+    );
+    assert_eq!(
+        config.auth.secure_cookies,
+        config.auth.oauth2_issuer_url.starts_with("https://")
+    );
+}
@@ -224,3 +224,29 @@ async fn test_version_endpoint_returns_json_with_version_field() {
     );
     assert_eq!(json["backend"], "rust");
 }
+
+#[tokio::test]
+async fn test_version_endpoint_is_cacheable_json() {
+    let state = build_test_app_state().await;
+    let app = create_router(state);
+
+    let response = app
+        .oneshot(
+            Request::builder()
+                .uri("/api/system/version")
+                .method("GET")
+                .body(Body::empty())
+                .unwrap(),
+        )
+        .await
+        .unwrap();
+
+    assert_eq!(
+        response.headers().get("content-type").unwrap(),
+        "application/json"
+    );
+    assert_eq!(
+        response.headers().get("cache-control").unwrap(),
+        "public, max-age=300"
+    );
+}
@@ -602,6 +602,27 @@ async fn audit_logs_indexes_impl(db: &DatabaseConnection) {
 
 test_both_databases!(test_audit_logs_indexes, audit_logs_indexes_impl);
 
+async fn user_notifications_indexes_impl(db: &DatabaseConnection) {
+    Migrator::up(db, None)
+        .await
+        .expect("Failed to apply migrations");
+
+    let indexes = get_indexes(db, "user_notifications").await;
+
+    assert!(
+        indexes
+            .iter()
+            .any(|i| i == "idx_user_notifications_user_created"),
+        "user_notifications should have a (user_id, created_at) index. Indexes: {:?}",
+        indexes
+    );
+}
+
+test_both_databases!(
+    test_user_notifications_indexes,
+    user_notifications_indexes_impl
+);
+
 // =============================================================================
 // Data Insertion Tests (verify schema works for actual data)
 // =============================================================================
@@ -879,7 +900,7 @@ async fn migration_count_impl(db: &DatabaseConnection) {
         .expect("Failed to query migrations");
 
     let count: i64 = result[0].try_get("", "cnt").unwrap();
-    assert_eq!(count, 26, "Should have exactly 26 migrations applied");
+    assert_eq!(count, 27, "Should have exactly 27 migrations applied");
 }
 
 test_both_databases!(test_migration_count, migration_count_impl);
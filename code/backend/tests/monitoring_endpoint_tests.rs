@@ -637,6 +637,32 @@ async fn test_pods_with_auth_returns_valid_status() {
     assert_valid_http_status(response.status(), "GET /api/monitoring/pods");
 }
 
+#[tokio::test]
+async fn test_pods_response_is_briefly_cacheable() {
+    let (state, cookie) = setup_authenticated_state().await;
+
+    let response = create_router(state)
+        .oneshot(
+            Request::builder()
+                .uri("/api/monitoring/pods?namespace=cache-control-test")
+                .header("cookie", &cookie)
+                .body(Body::empty())
+                .unwrap(),
+        )
+        .await
+        .unwrap();
+
+    assert_eq!(response.status(), StatusCode::OK);
+    assert_eq!(
+        response.headers().get("cache-control").unwrap(),
+        "private, max-age=2"
+    );
+    assert_eq!(
+        response.headers().get("content-type").unwrap(),
+        "application/json"
+    );
+}
+
 #[tokio::test]
 async fn test_pods_with_namespace_query_param() {
     let (state, cookie) = setup_authenticated_state().await;
@@ -1066,6 +1066,13 @@ async fn test_oauth_login_enabled_provider_redirects() {
         "Redirect must include client_id. Got: {}",
         location
     );
+    assert!(
+        location.contains("response_type=code")
+            && location.contains("%2Fapi%2Foauth%2Fgoogle%2Fcallback")
+            && location.contains("scope=openid+email+profile"),
+        "Redirect query must be form-encoded. Got: {}",
+        location
+    );
 }
 
 // ============================================================================
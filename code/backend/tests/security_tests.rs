@@ -2,7 +2,8 @@ use kubarr::services::security::{
     create_access_token, create_refresh_token, create_session_token, decode_session_token,
     decode_token, generate_random_string, generate_recovery_codes, generate_rsa_key_pair,
     generate_secure_password, generate_totp_secret, get_jwks, get_totp_provisioning_uri,
-    hash_password, hash_recovery_code, init_jwt_keys, verify_password, verify_recovery_code,
+    hash_password, hash_password_async, hash_recovery_code, init_jwt_keys,
+    verify_login_password_async, verify_password, verify_password_async, verify_recovery_code,
     verify_totp,
 };
 use once_cell::sync::Lazy;
@@ -56,6 +57,27 @@ fn test_verify_password_invalid_hash() {
     assert!(!verify_password("test", "not_a_valid_hash"));
 }
 
+#[tokio::test]
+async fn test_password_hashing_async() {
+    let password = "test_password123";
+    let hash = hash_password_async(password).await.unwrap();
+    assert!(verify_password(password, &hash));
+    assert!(verify_password_async(password, &hash).await);
+    assert!(!verify_password_async("wrong_password", &hash).await);
+    assert!(!verify_password_async(password, "not_a_valid_hash").await);
+}
+
+#[tokio::test]
+async fn test_verify_login_password_without_user_always_fails() {
+    let password = "test_password123";
+    let hash = hash_password(password).unwrap();
+    assert!(verify_login_password_async(password, Some(&hash)).await);
+    assert!(!verify_login_password_async("wrong_password", Some(&hash)).await);
+    // No stored hash: runs against the dummy hash and never succeeds
+    assert!(!verify_login_password_async(password, None).await);
+    assert!(!verify_login_password_async("kubarr-login-timing-placeholder", None).await);
+}
+
 // ==========================================================================
 // Random String Generation Tests
 // ==========================================================================
@@ -368,6 +390,29 @@ async fn test_session_token_roundtrip() {
     );
 }
 
+#[tokio::test]
+async fn test_session_token_rejected_after_key_rotation() {
+    let _lock = JWT_TEST_LOCK.lock().await;
+    let db = create_test_db().await;
+    init_jwt_keys(&db).await.expect("Failed to init JWT keys");
+
+    let token = create_session_token("sess-rotate").expect("create_session_token must not fail");
+    // Decode twice so the second call is served from the verified-token cache
+    decode_session_token(&token).expect("first decode must succeed");
+    decode_session_token(&token).expect("cached decode must succeed");
+
+    // A fresh database generates a new key pair, which must flush the cache
+    let other_db = create_test_db().await;
+    init_jwt_keys(&other_db)
+        .await
+        .expect("Failed to re-init JWT keys");
+
+    assert!(
+        decode_session_token(&token).is_err(),
+        "Token signed with the previous key must not be accepted after rotation"
+    );
+}
+
 // ==========================================================================
 // JWKS Tests
 // ==========================================================================
@@ -409,3 +454,28 @@ async fn test_get_jwks_structure() {
         "First key must have an exponent 'e'"
     );
 }
+
+#[tokio::test]
+async fn test_get_jwks_tracks_key_rotation() {
+    let _lock = JWT_TEST_LOCK.lock().await;
+    let db = create_test_db().await;
+    init_jwt_keys(&db).await.expect("Failed to init JWT keys");
+    let before = get_jwks().expect("get_jwks must not fail");
+    assert_eq!(
+        before,
+        get_jwks().unwrap(),
+        "JWKS must be stable between calls"
+    );
+
+    // A fresh database generates a new key pair, which must replace the JWKS
+    let other_db = create_test_db().await;
+    init_jwt_keys(&other_db)
+        .await
+        .expect("Failed to re-init JWT keys");
+
+    assert_ne!(
+        before,
+        get_jwks().unwrap(),
+        "JWKS must reflect the rotated public key"
+    );
+}
@@ -126,6 +126,45 @@ async fn test_get_db_returns_error_when_not_connected() {
     );
 }
 
+#[tokio::test]
+async fn test_get_k8s_returns_error_when_not_available() {
+    let k8s_client: SharedK8sClient = Arc::new(RwLock::new(None));
+    let catalog = AppCatalog::default();
+    let catalog: SharedCatalog = Arc::new(RwLock::new(catalog));
+    let chart_sync = Arc::new(ChartSyncService::new(catalog.clone()));
+    let audit = AuditService::new();
+    let notification = NotificationService::new();
+
+    let state = AppState::new(None, k8s_client, catalog, chart_sync, audit, notification);
+
+    let result = state.get_k8s().await;
+    assert!(
+        result.is_err(),
+        "get_k8s with no Kubernetes client must return an error"
+    );
+}
+
+#[tokio::test]
+async fn test_get_catalog_snapshot_does_not_hold_lock() {
+    let k8s_client: SharedK8sClient = Arc::new(RwLock::new(None));
+    let catalog: SharedCatalog = Arc::new(RwLock::new(AppCatalog::with_apps(Default::default())));
+    let chart_sync = Arc::new(ChartSyncService::new(catalog.clone()));
+    let audit = AuditService::new();
+    let notification = NotificationService::new();
+
+    let state = AppState::new(None, k8s_client, catalog, chart_sync, audit, notification);
+
+    let snapshot = state.get_catalog().await;
+    assert!(snapshot.get_all_apps().is_empty());
+
+    // A catalog swap (as chart sync does) must not wait on outstanding snapshots
+    let write_guard = state.catalog.try_write();
+    assert!(
+        write_guard.is_ok(),
+        "catalog snapshot must not keep the read lock held"
+    );
+}
+
 #[tokio::test]
 async fn test_is_db_connected_false_when_no_db() {
     use kubarr::state::AppState;
@@ -278,6 +317,57 @@ async fn test_endpoint_cache_overwrite() {
     assert_eq!(path.as_deref(), Some("/new"));
 }
 
+#[tokio::test]
+async fn test_endpoint_cache_missing_until_invalidated() {
+    use kubarr::state::EndpointCache;
+    let cache = EndpointCache::new(60);
+    assert!(!cache.is_missing("networking").await);
+    cache.set_missing("networking").await;
+    assert!(
+        cache.is_missing("networking").await,
+        "Recently missing name must be remembered"
+    );
+    cache.invalidate("networking").await;
+    assert!(
+        !cache.is_missing("networking").await,
+        "Invalidation must forget a missing name (e.g. after install)"
+    );
+}
+
+// ============================================================================
+// AppStatusCache
+// ============================================================================
+
+#[tokio::test]
+async fn test_app_status_cache_set_get_and_invalidate() {
+    use kubarr::state::AppStatusCache;
+    let cache = AppStatusCache::new(60);
+    assert!(cache.get("sonarr").await.is_none());
+
+    let status = serde_json::json!({ "state": "installed", "message": "Running" });
+    cache.set("sonarr", status.clone()).await;
+    assert_eq!(cache.get("sonarr").await, Some(status));
+
+    cache.invalidate("sonarr").await;
+    assert!(
+        cache.get("sonarr").await.is_none(),
+        "Invalidated entry must not be returned"
+    );
+}
+
+#[tokio::test]
+async fn test_app_status_cache_expires_entries() {
+    use kubarr::state::AppStatusCache;
+    let cache = AppStatusCache::new(0);
+    cache
+        .set("sonarr", serde_json::json!({ "state": "idle" }))
+        .await;
+    assert!(
+        cache.get("sonarr").await.is_none(),
+        "Expired entry must not be returned"
+    );
+}
+
 // ============================================================================
 // NetworkMetricsCache async methods (get / add_sample)
 // ============================================================================
@@ -335,6 +335,43 @@ async fn test_create_user_duplicate_email() {
     );
 }
 
+#[tokio::test]
+async fn test_create_user_duplicate_username_reported_before_email() {
+    ensure_jwt_keys().await;
+
+    let db = create_test_db_with_seed().await;
+    create_test_user_with_role(
+        &db,
+        "dupnameadmin",
+        "dupnameadmin@example.com",
+        "password123",
+        "admin",
+    )
+    .await;
+    let state = build_test_app_state_with_db(db).await;
+
+    let (_, cookie) = do_login(create_router(state.clone()), "dupnameadmin", "password123").await;
+    let cookie = cookie.expect("Login must set a session cookie");
+
+    // Username clashes with the admin, email clashes with nobody
+    let body = serde_json::json!({
+        "username": "dupnameadmin",
+        "email": "someoneelse@example.com",
+        "password": "securepassword"
+    })
+    .to_string();
+
+    let (status, body) =
+        authenticated_post(create_router(state), "/api/users", &cookie, &body).await;
+
+    assert_eq!(status, StatusCode::BAD_REQUEST);
+    assert!(
+        body.contains("Username already exists"),
+        "Duplicate username must be reported as such. Body: {}",
+        body
+    );
+}
+
 // ============================================================================
 // GET /api/users/{id}
 // ============================================================================
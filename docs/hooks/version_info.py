@@ -16,54 +16,59 @@ import os
 import subprocess
 import re
 from datetime import datetime, timezone
+from functools import lru_cache
 
+_DESCRIBE_RE = re.compile(r'^(.+)-\d+-g([0-9a-f]+)$')
+_VER_RE = re.compile(r'v?(\d+\.\d+\.\d+)')
+_STABLE_RE = re.compile(r'v?\d+\.\d+\.\d+$')
+_PRERELEASE_RE = re.compile(r'v?\d+\.\d+\.\d+-(rc|beta)')
+_PLACEHOLDER_RE = re.compile(r'\{\{(VERSION|CHANNEL|COMMIT)\}\}')
 
+
+@lru_cache(maxsize=1)
 def get_version_info():
     """Extract version information from environment or git."""
     version = os.environ.get('KUBARR_VERSION', '')
     channel = os.environ.get('KUBARR_CHANNEL', 'dev')
+    commit_hash = os.environ.get('KUBARR_COMMIT', '')
 
-    if not version:
-        # Try to get version from git tags
+    if not version or not commit_hash:
+        # A single `git describe` yields both the latest tag and the short
+        # commit hash (e.g. v1.2.3-4-gabc1234, or just abc1234 without tags)
+        tag, head = '', ''
         try:
-            # Get the latest tag
             result = subprocess.run(
-                ['git', 'describe', '--tags', '--abbrev=0'],
+                ['git', 'describe', '--tags', '--long', '--always'],
                 capture_output=True,
                 text=True,
                 check=False
             )
             if result.returncode == 0:
-                tag = result.stdout.strip()
-                # Extract version from tag (e.g., v1.2.3 -> 1.2.3)
-                version_match = re.match(r'v?(\d+\.\d+\.\d+)', tag)
-                if version_match:
-                    version = version_match.group(1)
-
-                    # Determine channel from tag
-                    if re.match(r'v?\d+\.\d+\.\d+$', tag):
-                        channel = 'stable'
-                    elif re.match(r'v?\d+\.\d+\.\d+-(rc|beta)', tag):
-                        channel = 'release'
-                    else:
-                        channel = 'dev'
+                described = result.stdout.strip()
+                describe_match = _DESCRIBE_RE.match(described)
+                if describe_match:
+                    tag, head = describe_match.group(1), describe_match.group(2)
+                else:
+                    head = described
         except Exception:
-            pass
+            head = 'unknown'
 
-    # Get commit hash
-    commit_hash = os.environ.get('KUBARR_COMMIT', '')
-    if not commit_hash:
-        try:
-            result = subprocess.run(
-                ['git', 'rev-parse', '--short', 'HEAD'],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            if result.returncode == 0:
-                commit_hash = result.stdout.strip()
-        except Exception:
-            commit_hash = 'unknown'
+        if not version and tag:
+            # Extract version from tag (e.g., v1.2.3 -> 1.2.3)
+            version_match = _VER_RE.match(tag)
+            if version_match:
+                version = version_match.group(1)
+
+                # Determine channel from tag
+                if _STABLE_RE.match(tag):
+                    channel = 'stable'
+                elif _PRERELEASE_RE.match(tag):
+                    channel = 'release'
+                else:
+                    channel = 'dev'
+
+        if not commit_hash:
+            commit_hash = head
 
     # Fallback values
     if not version:
@@ -106,11 +111,16 @@ def on_config(config, **kwargs):
 
 def on_page_markdown(markdown, page, config, files):
     """Called when page markdown is loaded, before rendering."""
-    # Replace version placeholders in markdown
-    version_info = config.get('extra', {}).get('version_info', {})
+    # Fast path: most pages contain no placeholders at all
+    if '{{' not in markdown:
+        return markdown
 
-    markdown = markdown.replace('{{VERSION}}', version_info.get('version', '0.0.0'))
-    markdown = markdown.replace('{{CHANNEL}}', version_info.get('channel', 'dev'))
-    markdown = markdown.replace('{{COMMIT}}', version_info.get('commit', 'unknown'))
+    # Replace version placeholders in markdown (cached, git runs once per build)
+    version_info = get_version_info()
+    mapping = {
+        'VERSION': version_info.get('version', '0.0.0'),
+        'CHANNEL': version_info.get('channel', 'dev'),
+        'COMMIT': version_info.get('commit', 'unknown'),
+    }
 
-    return markdown
+    return _PLACEHOLDER_RE.sub(lambda m: mapping[m.group(1)], markdown)